@@ -1,43 +1,82 @@
 """Daily entries endpoints."""
-from typing import List, Optional
+from pathlib import Path
+from typing import List, Optional, Union
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, File, Form, HTTPException, status, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.core.database import get_db
-from app.core.exceptions import NotFoundError, AuthorizationError
-from app.schemas.finance import DailyEntryCreate, DailyEntryUpdate, DailyEntryResponse
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, AuthorizationError, RateLimitError, ValidationError
+from app.schemas.finance import (
+    DailyEntryCreate,
+    DailyEntryUpdate,
+    DailyEntryResponse,
+    EntryImportMapping,
+    EntryImportResult,
+)
 from app.schemas.base import MessageResponse
+from app.schemas.job import JobResponse
 from app.services.finance import finance_service
+from app.services.jobs import job_service
+from app.services.statement_import import IMPORT_FORMATS, statement_import_service
 from app.api.v1.deps import get_current_active_user
+from app.models.finance import ExpenseCategory
 from app.models.user import User
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 @router.get("", response_model=List[DailyEntryResponse])
 async def get_daily_entries(
+    request: Request,
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    raw: bool = Query(
+        False,
+        description="Serialize the date range in the database (requires start_date and end_date)",
+    ),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> List:
     """
     Get daily entries for current user.
     
+    Date range reads are streamed as NDJSON when the client sends
+    ``Accept: application/x-ndjson``.
+    
     Args:
+        request: Incoming request
         start_date: Optional start date filter
         end_date: Optional end date filter
         skip: Number of records to skip
         limit: Maximum number of records
+        raw: Return the JSON array built by PostgreSQL as-is
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of daily entries
     """
+    if start_date and end_date and NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            finance_service.stream_entries_ndjson(current_user.id, start_date, end_date),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+    
+    if raw and start_date and end_date:
+        content = await finance_service.get_entries_json(
+            db, current_user.id, start_date, end_date
+        )
+        return Response(content=content, media_type="application/json")
+    
     entries = await finance_service.get_entries(
         db, current_user.id, start_date, end_date, skip, limit
     )
@@ -65,6 +104,124 @@ async def create_daily_entry(
     return entry
 
 
+@router.post(
+    "/import",
+    response_model=Union[EntryImportResult, JobResponse],
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse, "description": "Import job queued"}},
+)
+async def import_entries(
+    response: Response,
+    file: UploadFile = File(..., description="CSV or OFX bank statement"),
+    format: Optional[str] = Form(None, description="csv or ofx, detected from the file name by default"),
+    mapping: Optional[str] = Form(None, description="CSV column mapping as JSON"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> Union[EntryImportResult, JobResponse]:
+    """
+    Import daily entries from a bank statement.
+    
+    Statements up to ``IMPORT_SYNC_MAX_BYTES`` are imported right away.
+    Larger ones are stored and imported by an ``import`` job, returned
+    with status 202.
+    
+    Args:
+        response: Response to set the job status code on
+        file: Statement file
+        format: Statement format
+        mapping: Column mapping, see ``EntryImportMapping``
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Import result, or the queued import job
+    """
+    format = format or Path(file.filename or "").suffix.lstrip(".").lower()
+    if format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported import format, expected one of: {', '.join(IMPORT_FORMATS)}"
+        )
+    try:
+        import_mapping = EntryImportMapping.model_validate_json(mapping) if mapping else EntryImportMapping()
+    except PydanticValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid mapping: {'; '.join(error['msg'] for error in e.errors())}"
+        )
+    
+    file.file.seek(0, 2)
+    if file.file.tell() > settings.IMPORT_SYNC_MAX_BYTES:
+        upload_id = await run_in_threadpool(
+            statement_import_service.store_upload, current_user.id, file.file
+        )
+        params = {"upload_id": upload_id, "format": format, "mapping": import_mapping.model_dump()}
+        try:
+            job = await job_service.submit(current_user.id, "import", params)
+        except RateLimitError:
+            statement_import_service.upload_path(current_user.id, upload_id).unlink(missing_ok=True)
+            raise
+        response.status_code = status.HTTP_202_ACCEPTED
+        return job
+    
+    try:
+        return await statement_import_service.import_file(
+            db, current_user.id, file.file, format, import_mapping
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@router.get("/search", response_model=List[DailyEntryResponse])
+async def search_daily_entries(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search text"),
+    start_date: Optional[date] = Query(None, alias="from", description="First day"),
+    end_date: Optional[date] = Query(None, alias="to", description="Last day"),
+    category: Optional[ExpenseCategory] = Query(None, description="Expense category filter"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> List:
+    """
+    Search daily entries of current user by description and notes.
+    
+    Results are ranked by similarity to the search text; the cursor of
+    the next page, if any, is returned in ``X-Next-Cursor``.
+    
+    Args:
+        response: Response to set the pagination header on
+        q: Search text
+        start_date: Optional first day
+        end_date: Optional last day
+        category: Optional expense category filter
+        cursor: Cursor of the page to get
+        limit: Maximum number of records
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        List of daily entries, most relevant first
+    """
+    try:
+        entries, next_cursor = await finance_service.search_entries(
+            db,
+            current_user.id,
+            q,
+            cursor=cursor,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return entries
+
+
 @router.get("/{entry_id}", response_model=DailyEntryResponse)
 async def get_daily_entry(
     entry_id: int,
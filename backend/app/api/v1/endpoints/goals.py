@@ -1,10 +1,10 @@
 """Goals endpoints."""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.schemas.finance import MonthlyGoalResponse, MonthlyGoalUpdate
+from app.schemas.finance import MonthlyGoalResponse, MonthlyGoalUpdate, YearlyGoalUpdate
 from app.services.finance import finance_service
 from app.api.v1.deps import get_current_active_user
 from app.models.user import User
@@ -79,6 +79,7 @@ async def update_monthly_goal(
 @router.get("/yearly/{year}", response_model=List[MonthlyGoalResponse])
 async def get_yearly_goals(
     year: int,
+    materialize: bool = Query(False, description="Create missing months with default goals"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> List[MonthlyGoalResponse]:
@@ -87,11 +88,35 @@ async def get_yearly_goals(
     
     Args:
         year: Year
+        materialize: Create all missing months with defaults first
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of monthly goals
     """
-    goals = await finance_service.get_yearly_goals(db, current_user.id, year)
+    goals = await finance_service.get_yearly_goals(db, current_user.id, year, materialize)
+    return goals
+
+
+@router.put("/yearly/{year}", response_model=List[MonthlyGoalResponse])
+async def update_yearly_goals(
+    year: int,
+    goal_template: YearlyGoalUpdate,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> List[MonthlyGoalResponse]:
+    """
+    Apply one goal template to selected months of a year.
+    
+    Args:
+        year: Year
+        goal_template: Goal values and months to apply them to
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Updated monthly goals
+    """
+    goals = await finance_service.update_yearly_goals(db, current_user.id, year, goal_template)
     return goals
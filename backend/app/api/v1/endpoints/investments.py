@@ -1,35 +1,87 @@
 """Investment endpoints."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.exceptions import NotFoundError, AuthorizationError
-from app.schemas.finance import InvestmentCreate, InvestmentUpdate, InvestmentResponse, InvestmentSummary
+from app.core.exceptions import NotFoundError, AuthorizationError, ValidationError
+from app.schemas.finance import (
+    InvestmentCreate,
+    InvestmentUpdate,
+    InvestmentResponse,
+    InvestmentSummary,
+    InvestmentReturns,
+    PortfolioHistoryPoint,
+)
 from app.schemas.base import MessageResponse
 from app.services.finance import finance_service
+from app.services.portfolio import portfolio_service
+from app.services.returns import returns_service
 from app.api.v1.deps import get_current_active_user
 from app.models.user import User
+from app.models.finance import InvestmentType
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[InvestmentResponse])
 async def get_investments(
+    response: Response,
+    investment_type: Optional[InvestmentType] = Query(None, description="Investment type filter"),
+    start_date: Optional[date] = Query(None, alias="from", description="First purchase date"),
+    end_date: Optional[date] = Query(None, alias="to", description="Last purchase date"),
+    sort: str = Query(
+        "-purchase_date",
+        description="purchase_date, amount or name, prefixed with '-' for descending order",
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> List:
     """
-    Get all investments for current user.
+    Get a page of investments for current user.
+    
+    The number of matching investments is returned in ``X-Total-Count``
+    and the cursor of the next page, if any, in ``X-Next-Cursor``.
     
     Args:
+        response: Response to set pagination headers on
+        investment_type: Optional type filter
+        start_date: Optional first purchase date
+        end_date: Optional last purchase date
+        sort: Sort key
+        cursor: Cursor of the page to get
+        limit: Maximum number of records
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of investments
     """
-    investments = await finance_service.get_investments(db, current_user.id)
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="'from' must not be after 'to'"
+        )
+    try:
+        investments, total, next_cursor = await finance_service.get_investment_page(
+            db,
+            current_user.id,
+            sort=sort,
+            cursor=cursor,
+            limit=limit,
+            investment_type=investment_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return investments
 
 
@@ -73,6 +125,106 @@ async def get_investment_summary(
     return summary
 
 
+@router.get("/history", response_model=List[PortfolioHistoryPoint])
+async def get_investment_history(
+    start_date: Optional[date] = Query(None, alias="from", description="First day, a year before the last by default"),
+    end_date: Optional[date] = Query(None, alias="to", description="Last day, today by default"),
+    step: str = Query("day", pattern="^(day|week|month)$"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> List[PortfolioHistoryPoint]:
+    """
+    Get portfolio value over time.
+    
+    Args:
+        start_date: First day
+        end_date: Last day
+        step: Sampling step
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Portfolio value per sampled day
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=365)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="'from' must not be after 'to'"
+        )
+    return await portfolio_service.get_history(db, current_user.id, start_date, end_date, step)
+
+
+@router.get("/returns", response_model=InvestmentReturns)
+async def get_investment_returns(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> InvestmentReturns:
+    """
+    Get annualized returns per investment, per type and for the portfolio.
+    
+    Args:
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Investment returns
+    """
+    return await returns_service.get_returns(db, current_user.id)
+
+
+@router.get("/search", response_model=List[InvestmentResponse])
+async def search_investments(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200, description="Search text"),
+    investment_type: Optional[InvestmentType] = Query(None, description="Investment type filter"),
+    start_date: Optional[date] = Query(None, alias="from", description="First purchase date"),
+    end_date: Optional[date] = Query(None, alias="to", description="Last purchase date"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> List:
+    """
+    Search investments of current user by name and notes.
+    
+    Results are ranked by similarity to the search text; the cursor of
+    the next page, if any, is returned in ``X-Next-Cursor``.
+    
+    Args:
+        response: Response to set the pagination header on
+        q: Search text
+        investment_type: Optional type filter
+        start_date: Optional first purchase date
+        end_date: Optional last purchase date
+        cursor: Cursor of the page to get
+        limit: Maximum number of records
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        List of investments, most relevant first
+    """
+    try:
+        investments, next_cursor = await finance_service.search_investments(
+            db,
+            current_user.id,
+            q,
+            cursor=cursor,
+            limit=limit,
+            investment_type=investment_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return investments
+
+
 @router.get("/{investment_id}", response_model=InvestmentResponse)
 async def get_investment(
     investment_id: int,
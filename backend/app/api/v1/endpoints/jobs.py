@@ -0,0 +1,90 @@
+"""Background job endpoints."""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.exceptions import NotFoundError
+from app.schemas.job import JobCreate, JobResponse
+from app.services.jobs import job_service
+from app.api.v1.deps import get_current_active_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.post("/{kind}", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    kind: str,
+    job_create: JobCreate,
+    current_user: User = Depends(get_current_active_user),
+) -> JobResponse:
+    """
+    Submit a background job.
+    
+    Args:
+        kind: Job kind, e.g. export or annual_report
+        job_create: Job parameters
+        current_user: Current authenticated user
+        
+    Returns:
+        Queued job
+    """
+    try:
+        return await job_service.submit(current_user.id, kind, job_create.params)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user),
+) -> JobResponse:
+    """
+    Get job status and progress.
+    
+    Args:
+        job_id: Job ID
+        current_user: Current authenticated user
+        
+    Returns:
+        Job
+    """
+    try:
+        return await job_service.get(current_user.id, job_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Stream job progress as server-sent events.
+    
+    Args:
+        job_id: Job ID
+        current_user: Current authenticated user
+        
+    Returns:
+        Event stream ending when the job finished
+    """
+    try:
+        await job_service.get(current_user.id, job_id)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return StreamingResponse(
+        job_service.stream_events(current_user.id, job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
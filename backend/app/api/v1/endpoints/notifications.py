@@ -1,34 +1,39 @@
 """Notification endpoints."""
-from typing import List
+from typing import List, Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError, AuthorizationError
-from app.schemas.base import MessageResponse, BaseResponse
+from app.schemas.base import MessageResponse
+from app.schemas.notification import NotificationResponse
 from app.services.notification import notification_service
-from app.api.v1.deps import get_current_active_user
+from app.api.v1.deps import get_current_active_user, get_current_superuser
 from app.models.user import User
 from app.models.notification import Notification
 
 router = APIRouter()
 
 
-class NotificationResponse(BaseResponse):
-    """Notification response schema."""
-    user_id: int
-    title: str
-    message: str
-    notification_type: str
-    is_read: bool
-
-
 class UnreadCountResponse(BaseModel):
     """Unread count response."""
     count: int
 
 
+class BroadcastRequest(BaseModel):
+    """Broadcast notification request."""
+    title: str = Field(..., min_length=1, max_length=255)
+    message: str = Field(..., min_length=1)
+    notification_type: Literal["info", "warning", "success", "error"] = "info"
+    user_ids: Optional[List[int]] = Field(None, description="Recipients, all active users if omitted")
+
+
+class BroadcastResponse(BaseModel):
+    """Broadcast notification response."""
+    count: int
+
+
 @router.get("", response_model=List[NotificationResponse])
 async def get_notifications(
     unread_only: bool = Query(False, description="Get only unread notifications"),
@@ -75,6 +80,33 @@ async def get_unread_count(
     return UnreadCountResponse(count=count)
 
 
+@router.post("/broadcast", response_model=BroadcastResponse, status_code=status.HTTP_201_CREATED)
+async def broadcast_notification(
+    broadcast: BroadcastRequest,
+    current_user: User = Depends(get_current_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> BroadcastResponse:
+    """
+    Send a notification to many or all active users.
+    
+    Args:
+        broadcast: Notification and recipients
+        current_user: Current superuser
+        db: Database session
+        
+    Returns:
+        Number of notifications created
+    """
+    count = await notification_service.create_notifications_bulk(
+        db,
+        broadcast.title,
+        broadcast.message,
+        broadcast.notification_type,
+        broadcast.user_ids,
+    )
+    return BroadcastResponse(count=count)
+
+
 @router.post("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_as_read(
     notification_id: int,
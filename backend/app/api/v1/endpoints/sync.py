@@ -0,0 +1,41 @@
+"""Delta sync endpoints."""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.exceptions import ValidationError
+from app.schemas.sync import SyncResponse
+from app.services.sync import sync_service
+from app.api.v1.deps import get_current_active_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = Query(None, description="Token of the previous sync, everything if omitted"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+) -> SyncResponse:
+    """
+    Get entries, investments, goals and notifications changed since a sync.
+    
+    Clients keep a local copy of their data: they apply ``updated`` rows
+    and remove ``deleted`` IDs of every table, store ``token`` and sync
+    again while ``has_more`` is set. A rejected token calls for a full
+    sync without ``since``.
+    
+    Args:
+        since: Sync token
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Changes since the token
+    """
+    try:
+        return await sync_service.get_changes(db, current_user.id, since)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
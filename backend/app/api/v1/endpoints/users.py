@@ -1,12 +1,22 @@
 """User endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.exceptions import NotFoundError, ValidationError, AuthenticationError
-from app.schemas.user import UserResponse, UserUpdate, ChangePassword
+from app.schemas.user import (
+    UserResponse,
+    UserUpdate,
+    ChangePassword,
+    ExportTaskResponse,
+    ExportFileResponse,
+)
 from app.schemas.base import MessageResponse
 from app.services.user import user_service
+from app.services.export import export_service
+from app.services.jobs import job_service
 from app.api.v1.deps import get_current_active_user
 from app.models.user import User
 
@@ -100,3 +110,65 @@ async def delete_current_user(
     """
     await user_service.delete_account(db, current_user.id)
     return MessageResponse(message="Account deleted successfully")
+
+
+@router.post("/me/exports", response_model=ExportTaskResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export(
+    format: str = Query("jsonl", pattern="^(jsonl|csv)$"),
+    current_user: User = Depends(get_current_active_user),
+) -> ExportTaskResponse:
+    """
+    Queue export of all current user data.
+    
+    Shortcut for submitting an ``export`` job, see ``/jobs``.
+    
+    Args:
+        format: Export format, jsonl or csv
+        current_user: Current authenticated user
+        
+    Returns:
+        Queued export task
+    """
+    job = await job_service.submit(current_user.id, "export", {"format": format})
+    return ExportTaskResponse(task_id=job.id, format=format)
+
+
+@router.get("/me/exports", response_model=List[ExportFileResponse])
+async def list_exports(
+    current_user: User = Depends(get_current_active_user),
+) -> List[dict]:
+    """
+    List finished exports of current user.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Export files, newest first
+    """
+    return export_service.list_files(current_user.id)
+
+
+@router.get("/me/exports/{file_name}")
+async def download_export(
+    file_name: str,
+    current_user: User = Depends(get_current_active_user),
+) -> FileResponse:
+    """
+    Download a finished export of current user.
+    
+    Args:
+        file_name: Export file name
+        current_user: Current authenticated user
+        
+    Returns:
+        Gzip-compressed export file
+    """
+    try:
+        path = export_service.get_file(current_user.id, file_name)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return FileResponse(path, media_type="application/gzip", filename=file_name)
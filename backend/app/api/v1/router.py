@@ -9,6 +9,8 @@ from app.api.v1.endpoints import (
     goals,
     analytics,
     notifications,
+    jobs,
+    sync,
 )
 
 api_router = APIRouter()
@@ -20,3 +22,5 @@ api_router.include_router(investments.router, prefix="/investments", tags=["inve
 api_router.include_router(goals.router, prefix="/goals", tags=["goals"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
@@ -0,0 +1,93 @@
+"""Best-effort Redis cache."""
+import json
+from typing import Any, Optional
+from redis.exceptions import RedisError
+
+from app.core.logging import logger
+from app.core.redis import RedisClient
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """
+    Get a cached value.
+    
+    Args:
+        key: Cache key
+        
+    Returns:
+        Cached value, None if missing or Redis is unavailable
+    """
+    try:
+        redis = await RedisClient.get_client()
+        value = await redis.get(key)
+    except (RedisError, OSError) as e:
+        logger.warning("Cache unavailable", key=key, error=str(e))
+        return None
+    return json.loads(value) if value is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Cache a JSON serializable value.
+    
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Expiry in seconds
+    """
+    try:
+        redis = await RedisClient.get_client()
+        await redis.set(key, json.dumps(value), ex=ttl)
+    except (RedisError, OSError) as e:
+        logger.warning("Cache unavailable", key=key, error=str(e))
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Remove cached values.
+    
+    Args:
+        *keys: Cache keys
+    """
+    if not keys:
+        return
+    try:
+        redis = await RedisClient.get_client()
+        await redis.delete(*keys)
+    except (RedisError, OSError) as e:
+        logger.warning("Cache unavailable", keys=len(keys), error=str(e))
+
+
+async def get_generation(namespace: str) -> int:
+    """
+    Get the generation of a cache namespace.
+    
+    Keys built with the generation are all invalidated at once by
+    ``bump_generation`` instead of being deleted one by one.
+    
+    Args:
+        namespace: Cache namespace
+        
+    Returns:
+        Current generation
+    """
+    try:
+        redis = await RedisClient.get_client()
+        return int(await redis.get(f"{namespace}:generation") or 0)
+    except (RedisError, OSError) as e:
+        logger.warning("Cache unavailable", namespace=namespace, error=str(e))
+        return 0
+
+
+async def bump_generation(namespace: str) -> None:
+    """
+    Invalidate every key of a cache namespace.
+    
+    Args:
+        namespace: Cache namespace
+    """
+    try:
+        redis = await RedisClient.get_client()
+        await redis.incr(f"{namespace}:generation")
+    except (RedisError, OSError) as e:
+        logger.warning("Cache unavailable", namespace=namespace, error=str(e))
@@ -1,5 +1,7 @@
 """Celery configuration for background tasks."""
 from celery import Celery
+from celery.schedules import crontab
+from kombu import Queue
 from app.core.config import settings
 
 
@@ -23,24 +25,77 @@ celery_app.conf.update(
     timezone="Europe/Warsaw",
     enable_utc=True,
     task_track_started=True,
+    result_expires=settings.JOBS_RESULT_EXPIRES,
     task_time_limit=300,  # 5 minutes
     task_soft_time_limit=240,  # 4 minutes
     worker_prefetch_multiplier=4,
     worker_max_tasks_per_child=1000,
+    # Long tasks set acks_late; re-queue them if their worker dies
+    task_reject_on_worker_lost=True,
+    # Redis broker emulates priorities with one list per step, 0 is served first
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+        # Above SCHEDULE_WINDOW_SECONDS, or countdown shards get redelivered
+        "visibility_timeout": 10800,
+    },
+    task_default_priority=5,
+)
+
+# Queues, each consumed by its own worker pool (see docker-compose.yml).
+# Report and maintenance workers run with --prefetch-multiplier=1.
+celery_app.conf.task_queues = (
+    Queue("realtime"),
+    Queue("email"),
+    Queue("reports"),
+    Queue("maintenance"),
 )
+celery_app.conf.task_default_queue = "realtime"
+celery_app.conf.task_routes = {
+    "app.tasks.email_tasks.send_welcome_email": {"queue": "email", "priority": 0},
+    "app.tasks.email_tasks.send_password_reset_email": {"queue": "email", "priority": 0},
+    "app.tasks.email_tasks.send_monthly_report": {"queue": "email", "priority": 9},
+    "app.tasks.email_tasks.send_monthly_reports": {"queue": "email", "priority": 9},
+    "app.tasks.notification_tasks.create_notification": {"queue": "realtime", "priority": 0},
+    "app.tasks.notification_tasks.send_achievement_notification": {"queue": "realtime", "priority": 0},
+    "app.tasks.notification_tasks.flush_notification_digests": {"queue": "realtime"},
+    "app.tasks.notification_tasks.send_goal_reminders": {"queue": "maintenance"},
+    "app.tasks.data_tasks.import_entries": {"queue": "reports"},
+    "app.tasks.report_tasks.*": {"queue": "reports"},
+    "app.tasks.data_tasks.*": {"queue": "maintenance"},
+}
 
-# Periodic tasks configuration
+# Periodic tasks configuration, crontabs are in Europe/Warsaw time.
+# Per-user jobs run off-peak at night and fan out into user_id shards
+# spread over SCHEDULE_WINDOW_SECONDS.
 celery_app.conf.beat_schedule = {
+    "maintain-partitions": {
+        "task": "app.tasks.data_tasks.maintain_partitions",
+        "schedule": crontab(hour=1, minute=0),  # Daily
+    },
+    "update-investment-values": {
+        "task": "app.tasks.data_tasks.update_investment_values",
+        "schedule": crontab(hour=1, minute=30),  # Daily
+    },
+    "flush-notification-digests": {
+        "task": "app.tasks.notification_tasks.flush_notification_digests",
+        "schedule": float(settings.NOTIFICATION_DIGEST_WINDOW),  # Once per digest window
+    },
     "send-goal-reminders": {
         "task": "app.tasks.notification_tasks.send_goal_reminders",
-        "schedule": 86400.0,  # Daily
+        "schedule": crontab(hour=2, minute=0),  # Daily
     },
     "generate-monthly-reports": {
         "task": "app.tasks.report_tasks.generate_monthly_reports",
-        "schedule": 86400.0,  # Daily
+        "schedule": crontab(hour=3, minute=0, day_of_month="1-3"),  # Retried until complete
     },
     "cleanup-old-notifications": {
         "task": "app.tasks.data_tasks.cleanup_old_notifications",
-        "schedule": 604800.0,  # Weekly
+        "schedule": crontab(hour=4, minute=0, day_of_week="sun"),  # Weekly
+    },
+    "cleanup-old-exports": {
+        "task": "app.tasks.data_tasks.cleanup_old_exports",
+        "schedule": crontab(hour=4, minute=30),  # Daily
     },
 }
@@ -88,6 +88,73 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://redis:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/2"
+    CELERY_DB_POOL_SIZE: int = 2  # Database connections kept per worker process
+    CELERY_DB_MAX_OVERFLOW: int = 3  # Extra connections per worker process under load
+    SCHEDULE_SHARDS: int = 8  # user_id % N shards of nightly per-user tasks
+    SCHEDULE_WINDOW_SECONDS: int = 7200  # Nightly shards are spread over this window
+    
+    # Entries
+    ENTRIES_MAX_RESULTS: int = 5000  # Hard cap for non-streaming date range reads
+    ENTRIES_STREAM_CHUNK_SIZE: int = 500  # Rows fetched per server-side cursor round trip
+    
+    # Partitioning
+    PARTITION_ENTRIES_YEARS_AHEAD: int = 2  # Yearly daily_entries partitions kept ready
+    PARTITION_NOTIFICATIONS_MONTHS_AHEAD: int = 3  # Monthly notifications partitions kept ready
+    
+    # Goal reminders
+    GOAL_REMINDER_START_DAY: int = 7  # First day of month reminders are sent on
+    GOAL_REMINDER_TOLERANCE: float = 0.8  # Behind when progress < elapsed month share * tolerance
+    GOAL_REMINDER_INTERVAL_DAYS: int = 7  # Minimum days between reminders for a user
+    
+    # Notifications
+    NOTIFICATION_DIGEST_WINDOW: int = 900  # Seconds within which same-type notifications are merged
+    NOTIFICATION_DIGEST_TTL: int = 172800  # Buffer expiry, outlives missed flushes
+    NOTIFICATION_DIGEST_BATCH_SIZE: int = 1000  # Digest rows per bulk insert
+    NOTIFICATION_UNREAD_CACHE_TTL: int = 300  # Seconds unread counts are cached
+    
+    # Reports
+    REPORTS_CHUNK_SIZE: int = 200  # Users per monthly report subtask
+    REPORTS_STATE_TTL: int = 3456000  # 40 days, keeps a month's run resumable
+    
+    # Purging
+    PURGE_BATCH_SIZE: int = 5000  # Rows deleted per transaction
+    PURGE_PAUSE_SECONDS: float = 0.1  # Sleep between batches
+    PURGE_TIME_BUDGET: float = 200.0  # Seconds per cleanup run, below the task soft limit
+    
+    # Market prices
+    PRICE_PROVIDER: str = "file"  # Price provider used for revaluation
+    PRICE_FILE_PATH: Optional[str] = None  # CSV of instrument,date,price for the file provider, no prices if unset
+    REVALUATION_BATCH_SIZE: int = 1000  # Investments updated per statement
+    
+    # Portfolio
+    PORTFOLIO_HISTORY_CACHE_TTL: int = 86400  # Daily value series are rebuilt at least once a day
+    INVESTMENT_SUMMARY_CACHE_TTL: int = 3600  # Seconds investment summaries are cached
+    INVESTMENT_COUNT_CACHE_TTL: int = 3600  # Seconds investment listing counts are cached
+    
+    # Exports
+    EXPORT_DIR: str = "exports"  # Shared by API and workers
+    EXPORT_CHUNK_SIZE: int = 1000  # Rows fetched per round trip
+    EXPORT_RETENTION: int = 604800  # Seconds finished exports and reports are kept
+    
+    # Imports
+    IMPORT_DIR: str = "imports"  # Uploads handed over to workers, shared by API and workers
+    IMPORT_SYNC_MAX_BYTES: int = 1048576  # Larger uploads are imported by a background job
+    IMPORT_BATCH_SIZE: int = 2000  # Rows inserted and committed together
+    IMPORT_MAX_ERRORS: int = 50  # Parse errors reported per import
+    
+    # Sync
+    SYNC_PAGE_SIZE: int = 2000  # Rows per table returned by one sync
+    SYNC_OVERLAP_SECONDS: int = 120  # Window resent by every sync, covers late commits and clock skew
+    
+    # Jobs
+    JOBS_MAX_CONCURRENT_PER_USER: int = 2  # Unfinished jobs a user may have
+    JOBS_RESULT_EXPIRES: int = 86400  # Seconds job results are kept in the result backend
+    JOBS_EVENTS_POLL_INTERVAL: float = 1.0  # Seconds between progress checks of event streams
+    JOBS_EVENTS_TIMEOUT: int = 900  # Maximum event stream duration in seconds
+    
+    # Templates
+    TEMPLATE_CACHE_DIR: Optional[str] = None  # Compiled template cache, system temp dir if unset
+    TEMPLATE_AUTO_RELOAD: bool = False  # Recompile templates changed on disk, for development
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -100,6 +167,17 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM_EMAIL: str = "noreply@mojportfel.pl"
     SMTP_FROM_NAME: str = "Mój Portfel 2026"
+    SMTP_ENABLED: bool = False  # Deliver mail; when off messages are only logged
+    SMTP_USE_TLS: bool = False  # Implicit TLS, usually port 465
+    SMTP_START_TLS: bool = True  # STARTTLS upgrade, usually port 587
+    SMTP_TIMEOUT: float = 30.0  # Seconds per SMTP command
+    SMTP_POOL_SIZE: int = 5  # Concurrent connections per process
+    SMTP_BATCH_SIZE: int = 50  # Messages sent back to back over one connection
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100  # Reconnect after this many messages
+    SMTP_MAX_RETRIES: int = 3  # Retries of transient failures per message
+    SMTP_RETRY_BACKOFF: float = 1.0  # First retry delay in seconds, doubled per retry
+    EMAIL_TASK_MAX_RETRIES: int = 3  # Task retries of undelivered single emails
+    EMAIL_TASK_RETRY_DELAY: int = 300  # Seconds between task retries
     
     # Logging
     LOG_LEVEL: str = "INFO"
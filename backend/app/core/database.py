@@ -1,5 +1,5 @@
 """Database configuration and session management."""
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -26,11 +26,36 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session info key of callbacks waiting for the end of the transaction
+AFTER_COMMIT_KEY = "after_commit"
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     pass
 
 
+def after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Run a callback once the session's transaction has ended.
+    
+    Callbacks are run by ``get_db`` and ``task_session`` after their
+    commit, or rollback. Used to invalidate caches again after a write,
+    since concurrent reads may have cached data from before the commit.
+    
+    Args:
+        db: Database session
+        callback: Coroutine function without arguments
+    """
+    db.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+async def run_after_commit(db: AsyncSession) -> None:
+    """Run and clear callbacks registered with ``after_commit``."""
+    for callback in db.info.pop(AFTER_COMMIT_KEY, []):
+        await callback()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database sessions.
@@ -46,6 +71,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
             raise
         finally:
+            await run_after_commit(session)
             await session.close()
 
 
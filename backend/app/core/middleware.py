@@ -69,4 +69,5 @@ def setup_cors_middleware(app: any) -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Total-Count", "X-Next-Cursor"],
     )
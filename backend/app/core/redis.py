@@ -1,5 +1,6 @@
 """Redis configuration and client."""
 from typing import Optional
+import redis
 from redis import asyncio as aioredis
 from app.core.config import settings
 
@@ -8,6 +9,7 @@ class RedisClient:
     """Redis client wrapper."""
     
     _client: Optional[aioredis.Redis] = None
+    _sync_client: Optional[redis.Redis] = None
     
     @classmethod
     async def get_client(cls) -> aioredis.Redis:
@@ -26,6 +28,25 @@ class RedisClient:
             )
         return cls._client
     
+    @classmethod
+    def get_sync_client(cls) -> redis.Redis:
+        """
+        Get synchronous Redis client instance.
+        
+        Meant for Celery tasks, which run outside the application event loop.
+        
+        Returns:
+            Redis client
+        """
+        if cls._sync_client is None:
+            cls._sync_client = redis.Redis.from_url(
+                str(settings.REDIS_URL),
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=10,
+            )
+        return cls._sync_client
+    
     @classmethod
     async def close(cls) -> None:
         """Close Redis connection."""
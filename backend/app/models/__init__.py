@@ -1,7 +1,14 @@
 """Models initialization."""
 from app.models.base import BaseModel
 from app.models.user import User
-from app.models.finance import DailyEntry, Investment, MonthlyGoal, ExpenseCategory, InvestmentType
+from app.models.finance import (
+    DailyEntry,
+    Investment,
+    MonthlyGoal,
+    MarketPrice,
+    ExpenseCategory,
+    InvestmentType,
+)
 from app.models.notification import Notification
 
 __all__ = [
@@ -10,6 +17,7 @@ __all__ = [
     "DailyEntry",
     "Investment",
     "MonthlyGoal",
+    "MarketPrice",
     "ExpenseCategory",
     "InvestmentType",
     "Notification",
@@ -1,6 +1,6 @@
 """Finance related models."""
 import enum
-from sqlalchemy import Column, String, Integer, Float, Date, Enum, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, Date, Enum, ForeignKey, Index, Text, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -33,9 +33,22 @@ class InvestmentType(str, enum.Enum):
 
 
 class DailyEntry(BaseModel):
-    """Daily financial entry model."""
+    """
+    Daily financial entry model.
+    
+    Range-partitioned by year on ``date`` in the database, see
+    ``app.repositories.partition``.
+    """
     
     __tablename__ = "daily_entries"
+    __table_args__ = (
+        # Deduplicates statement imports, includes the partition key as required
+        Index("uq_daily_entries_user_date_import_hash", "user_id", "date", "import_hash", unique=True),
+        # Delta sync reads rows in write order, deleted ones included
+        Index("ix_daily_entries_user_updated_at", "user_id", "updated_at", "id"),
+        # GIN trigram indexes of searched text columns need pg_trgm and are
+        # created by migration 008_trigram_search only
+    )
     
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
@@ -56,6 +69,9 @@ class DailyEntry(BaseModel):
     # Notes
     notes = Column(Text, nullable=True)
     
+    # Content hash of entries imported from bank statements
+    import_hash = Column(String(64), nullable=True)
+    
     # Relationship
     user = relationship("User", back_populates="daily_entries")
     
@@ -67,10 +83,20 @@ class Investment(BaseModel):
     """Investment model."""
     
     __tablename__ = "investments"
+    __table_args__ = (
+        # Keyset pagination of live investments, one index per sort key
+        Index("ix_investments_user_purchase_date", "user_id", "purchase_date", "id", postgresql_where=text("NOT is_deleted")),
+        Index("ix_investments_user_amount", "user_id", "amount", "id", postgresql_where=text("NOT is_deleted")),
+        Index("ix_investments_user_name", "user_id", "name", "id", postgresql_where=text("NOT is_deleted")),
+        # Changed investments for delta sync, in write order
+        Index("ix_investments_user_updated_at", "user_id", "updated_at", "id"),
+        # GIN trigram indexes of name and notes are created by migration 008_trigram_search
+    )
     
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     investment_type = Column(Enum(InvestmentType), nullable=False, index=True)
     name = Column(String(255), nullable=False)
+    symbol = Column(String(50), nullable=True, index=True)  # Market instrument, e.g. ticker
     amount = Column(Float, nullable=False)  # Amount in PLN
     quantity = Column(Float, nullable=True)  # Quantity (shares, coins, etc.)
     purchase_date = Column(Date, nullable=False, index=True)
@@ -88,6 +114,11 @@ class MonthlyGoal(BaseModel):
     """Monthly financial goal model."""
     
     __tablename__ = "monthly_goals"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", name="uq_monthly_goals_user_year_month"),
+        # Changed goals for delta sync
+        Index("ix_monthly_goals_user_updated_at", "user_id", "updated_at", "id"),
+    )
     
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     year = Column(Integer, nullable=False, index=True)
@@ -104,3 +135,27 @@ class MonthlyGoal(BaseModel):
     
     def __repr__(self) -> str:
         return f"<MonthlyGoal {self.year}-{self.month:02d} - User {self.user_id}>"
+
+
+# Instruments priced for investments without an explicit symbol
+DEFAULT_INSTRUMENTS = {
+    InvestmentType.GOLD: "XAU",
+    InvestmentType.SILVER: "XAG",
+}
+
+
+class MarketPrice(BaseModel):
+    """Daily market price of an instrument, in PLN per unit of quantity."""
+    
+    __tablename__ = "market_prices"
+    __table_args__ = (
+        UniqueConstraint("instrument", "date", name="uq_market_prices_instrument_date"),
+    )
+    
+    instrument = Column(String(50), nullable=False)
+    date = Column(Date, nullable=False, index=True)
+    price = Column(Float, nullable=False)
+    source = Column(String(50), nullable=False)  # Price provider name
+    
+    def __repr__(self) -> str:
+        return f"<MarketPrice {self.instrument} {self.date} - {self.price}>"
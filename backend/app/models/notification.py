@@ -1,19 +1,29 @@
 """Notification model."""
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, Index, Text, Boolean
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
 
 class Notification(BaseModel):
-    """Notification model."""
+    """
+    Notification model.
+    
+    Range-partitioned by month on ``created_at`` in the database, see
+    ``app.repositories.partition``.
+    """
     
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Changed notifications for delta sync
+        Index("ix_notifications_user_updated_at", "user_id", "updated_at", "id"),
+    )
     
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
     notification_type = Column(String(50), nullable=False)  # info, warning, success, error
     is_read = Column(Boolean, default=False, nullable=False, index=True)
+    count = Column(Integer, default=1, server_default="1", nullable=False)  # Notifications merged into a digest
     
     # Relationship
     user = relationship("User", back_populates="notifications")
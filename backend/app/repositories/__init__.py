@@ -5,9 +5,16 @@ from app.repositories.finance import (
     DailyEntryRepository,
     InvestmentRepository,
     MonthlyGoalRepository,
+    MarketPriceRepository,
     daily_entry_repository,
     investment_repository,
     monthly_goal_repository,
+    market_price_repository,
+)
+from app.repositories.partition import (
+    PartitionRepository,
+    daily_entry_partitions,
+    notification_partitions,
 )
 
 __all__ = [
@@ -20,4 +27,9 @@ __all__ = [
     "daily_entry_repository",
     "investment_repository",
     "monthly_goal_repository",
+    "MarketPriceRepository",
+    "market_price_repository",
+    "PartitionRepository",
+    "daily_entry_partitions",
+    "notification_partitions",
 ]
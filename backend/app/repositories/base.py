@@ -1,8 +1,10 @@
 """Base repository with common CRUD operations."""
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from datetime import datetime
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.base import BaseModel
+from app.utils.pagination import keyset_page
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
@@ -73,6 +75,35 @@ class BaseRepository(Generic[ModelType]):
         result = await db.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_changes(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 1000,
+    ) -> Tuple[List[ModelType], bool]:
+        """
+        Get a user's records written after a position, in write order.
+        
+        Soft-deleted records are included so that deletions can be synced.
+        Only for models with ``user_id``, backed by a (user_id, updated_at,
+        id) index.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            after: (updated_at, ID) of the last record seen, None for all
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (model instances, whether more records follow)
+        """
+        stmt = select(self.model).where(self.model.user_id == user_id)
+        stmt = keyset_page(stmt, self.model.updated_at, self.model.id, False, after, limit)
+        result = await db.execute(stmt)
+        records = list(result.scalars().all())
+        return records[:limit], len(records) > limit
+    
     async def create(self, db: AsyncSession, obj_in: Dict[str, Any]) -> ModelType:
         """
         Create a new record.
@@ -1,10 +1,64 @@
 """Finance repositories."""
-from typing import List, Optional
-from datetime import date
-from sqlalchemy import select, and_, func
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from sqlalchemy import (
+    Select, select, update, values, column, bindparam, and_, or_, case, func, cast, literal,
+    ColumnElement, Date, DateTime, Float, Integer, Text
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.finance import DailyEntry, Investment, MonthlyGoal, InvestmentType
+from app.models.finance import (
+    DailyEntry,
+    Investment,
+    MonthlyGoal,
+    MarketPrice,
+    InvestmentType,
+    ExpenseCategory,
+    DEFAULT_INSTRUMENTS,
+)
 from app.repositories.base import BaseRepository
+from app.utils.pagination import keyset_page
+
+
+# Columns of daily entries set by statement imports
+IMPORTED_ENTRY_COLUMNS = (
+    "user_id",
+    "date",
+    "income",
+    "income_description",
+    "expense",
+    "expense_category",
+    "expense_description",
+    "gold_grams",
+    "silver_grams",
+    "notes",
+    "import_hash",
+)
+
+# Text columns of daily entries matched by searches, each with a GIN trigram index
+ENTRY_SEARCH_COLUMNS = (
+    DailyEntry.income_description,
+    DailyEntry.expense_description,
+    DailyEntry.notes,
+)
+
+
+def search_match(query: str, columns: Sequence[Any]) -> ColumnElement:
+    """
+    Condition matching rows with a word similar to the query in any column.
+    
+    Uses the pg_trgm ``%>`` operator, true where ``word_similarity`` is
+    above ``pg_trgm.word_similarity_threshold``, which GIN trigram
+    indexes of the columns can serve.
+    """
+    return or_(*(column.bool_op("%>")(query) for column in columns))
+
+
+def search_rank(query: str, columns: Sequence[Any]) -> ColumnElement:
+    """Relevance of a row to a query, the best word similarity among columns."""
+    return func.greatest(
+        *(func.word_similarity(query, column) for column in columns), type_=Float
+    )
 
 
 class DailyEntryRepository(BaseRepository[DailyEntry]):
@@ -19,19 +73,201 @@ class DailyEntryRepository(BaseRepository[DailyEntry]):
         user_id: int,
         start_date: date,
         end_date: date,
+        limit: Optional[int] = None,
     ) -> List[DailyEntry]:
         """Get entries within date range for user."""
-        stmt = select(DailyEntry).where(
+        stmt = self._date_range_query(user_id, start_date, end_date)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def stream_by_date_range(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[List[DailyEntry]]:
+        """
+        Stream entries within date range in chunks.
+        
+        Uses a server-side cursor, so only ``chunk_size`` rows are held in
+        memory at a time regardless of how wide the range is.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+            chunk_size: Number of rows fetched per round trip
+            
+        Yields:
+            Lists of at most ``chunk_size`` entries
+        """
+        stmt = self._date_range_query(user_id, start_date, end_date).execution_options(
+            yield_per=chunk_size
+        )
+        result = await db.stream_scalars(stmt)
+        async for chunk in result.partitions(chunk_size):
+            yield chunk
+    
+    async def get_by_date_range_json(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+    ) -> Tuple[bytes, int]:
+        """
+        Get entries within date range as a JSON array built by PostgreSQL.
+        
+        Rows are aggregated with ``json_agg(row_to_json(...))`` so no ORM
+        objects are created; ``fields`` selects the exact keys of every
+        element and should match the response schema.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First day of the range (inclusive)
+            end_date: Last day of the range (inclusive)
+            fields: Column names to include in each JSON object
+            limit: Maximum number of entries, newest first
+            
+        Returns:
+            Tuple of (UTF-8 encoded JSON array, number of entries in it)
+        """
+        rows = select(*(getattr(DailyEntry, field) for field in fields)).where(
             and_(
                 DailyEntry.user_id == user_id,
                 DailyEntry.date >= start_date,
                 DailyEntry.date <= end_date,
                 DailyEntry.is_deleted == False
             )
-        ).order_by(DailyEntry.date.desc())
+        ).order_by(DailyEntry.date.desc(), DailyEntry.id.desc()).limit(limit).subquery("entry")
+        
+        stmt = select(
+            func.coalesce(
+                cast(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.row_to_json(rows.table_valued()),
+                            rows.c.date.desc(),
+                        )
+                    ),
+                    Text,
+                ),
+                literal("[]"),
+            ),
+            func.count(),
+        ).select_from(rows)
         
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        content, count = result.one()
+        return content.encode("utf-8"), count
+    
+    async def insert_imported(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert imported entries, skipping ones imported before.
+        
+        Every column is bound as one array and unnested by PostgreSQL in a
+        single ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` against the
+        import hash index. The statement is the same for any number of rows,
+        so it is compiled once, and duplicates are dropped by the database
+        without a lookup per row.
+        
+        Args:
+            db: Database session
+            rows: Entry column values, each with ``user_id`` and ``import_hash``
+            
+        Returns:
+            Number of inserted entries
+        """
+        if not rows:
+            return 0
+        table = DailyEntry.__table__
+        source = select(
+            *(
+                func.unnest(bindparam(name, type_=ARRAY(table.c[name].type))).label(name)
+                for name in IMPORTED_ENTRY_COLUMNS
+            ),
+            bindparam("now", type_=DateTime).label("created_at"),
+            bindparam("now", type_=DateTime).label("updated_at"),
+            literal(False).label("is_deleted"),
+        )
+        stmt = pg_insert(table).from_select(
+            [*IMPORTED_ENTRY_COLUMNS, "created_at", "updated_at", "is_deleted"], source
+        ).on_conflict_do_nothing(
+            index_elements=[table.c.user_id, table.c.date, table.c.import_hash]
+        ).returning(table.c.id)
+        
+        params = {name: [row.get(name) for row in rows] for name in IMPORTED_ENTRY_COLUMNS}
+        params["now"] = datetime.utcnow()
+        result = await db.execute(stmt, params)
+        return len(result.scalars().all())
+    
+    def _date_range_query(self, user_id: int, start_date: date, end_date: date) -> Select:
+        """Build the date range query shared by list and stream reads."""
+        return select(DailyEntry).where(
+            and_(
+                DailyEntry.user_id == user_id,
+                DailyEntry.date >= start_date,
+                DailyEntry.date <= end_date,
+                DailyEntry.is_deleted == False
+            )
+        ).order_by(DailyEntry.date.desc(), DailyEntry.id.desc())
+    
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = 50,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[ExpenseCategory] = None,
+    ) -> Tuple[List[Tuple[DailyEntry, float]], bool]:
+        """
+        Get one page of a user's entries matching a search query.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Search text
+            after: (relevance, ID) of the last row of the previous page
+            limit: Page size
+            start_date: Optional first day
+            end_date: Optional last day
+            category: Optional expense category filter
+            
+        Returns:
+            Tuple of (pairs of entry and relevance, most relevant first,
+            whether more pages follow)
+        """
+        rank = search_rank(query, ENTRY_SEARCH_COLUMNS)
+        conditions = [
+            DailyEntry.user_id == user_id,
+            DailyEntry.is_deleted == False,
+            search_match(query, ENTRY_SEARCH_COLUMNS),
+        ]
+        if start_date:
+            conditions.append(DailyEntry.date >= start_date)
+        if end_date:
+            conditions.append(DailyEntry.date <= end_date)
+        if category:
+            conditions.append(DailyEntry.expense_category == category)
+        
+        stmt = keyset_page(
+            select(DailyEntry, rank).where(and_(*conditions)), rank, DailyEntry.id, True, after, limit
+        )
+        result = await db.execute(stmt)
+        rows = [(entry, score) for entry, score in result.all()]
+        return rows[:limit], len(rows) > limit
     
     async def get_by_month(
         self,
@@ -52,6 +288,57 @@ class DailyEntryRepository(BaseRepository[DailyEntry]):
         
         result = await db.execute(stmt)
         return list(result.scalars().all())
+    
+    async def get_month_totals_by_users(
+        self,
+        db: AsyncSession,
+        user_ids: Sequence[int],
+        year: int,
+        month: int,
+    ) -> List[Any]:
+        """
+        Get month totals per user and expense category in one query.
+        
+        Args:
+            db: Database session
+            user_ids: User IDs
+            year: Year
+            month: Month
+            
+        Returns:
+            Rows of (user_id, expense_category, income, expense, gold, silver)
+        """
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        stmt = select(
+            DailyEntry.user_id,
+            DailyEntry.expense_category,
+            func.sum(DailyEntry.income).label("income"),
+            func.sum(DailyEntry.expense).label("expense"),
+            func.sum(DailyEntry.gold_grams).label("gold"),
+            func.sum(DailyEntry.silver_grams).label("silver"),
+        ).where(
+            and_(
+                DailyEntry.user_id.in_(user_ids),
+                DailyEntry.date >= start,
+                DailyEntry.date < end,
+                DailyEntry.is_deleted == False
+            )
+        ).group_by(DailyEntry.user_id, DailyEntry.expense_category)
+        
+        result = await db.execute(stmt)
+        return list(result.all())
+
+
+# Sort keys of investment listings, each backed by a (user_id, key, id) index
+INVESTMENT_SORT_KEYS = {
+    "purchase_date": Investment.purchase_date,
+    "amount": Investment.amount,
+    "name": Investment.name,
+}
+
+# Text columns of investments matched by searches, each with a GIN trigram index
+INVESTMENT_SEARCH_COLUMNS = (Investment.name, Investment.notes)
 
 
 class InvestmentRepository(BaseRepository[Investment]):
@@ -81,34 +368,422 @@ class InvestmentRepository(BaseRepository[Investment]):
         result = await db.execute(stmt)
         return list(result.scalars().all())
     
+    def _listing_filters(
+        self,
+        user_id: int,
+        investment_type: Optional[InvestmentType],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> list:
+        """Conditions shared by investment pages and their count."""
+        conditions = [Investment.user_id == user_id, Investment.is_deleted == False]
+        if investment_type:
+            conditions.append(Investment.investment_type == investment_type)
+        if start_date:
+            conditions.append(Investment.purchase_date >= start_date)
+        if end_date:
+            conditions.append(Investment.purchase_date <= end_date)
+        return conditions
+    
+    async def get_page(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        sort: str = "purchase_date",
+        descending: bool = True,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: int = 50,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Investment], bool]:
+        """
+        Get one page of a user's investments.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            sort: Key of ``INVESTMENT_SORT_KEYS``
+            descending: Sort direction
+            after: (sort value, ID) of the last row of the previous page
+            limit: Page size
+            investment_type: Optional type filter
+            start_date: Optional first purchase date
+            end_date: Optional last purchase date
+            
+        Returns:
+            Tuple of (investments, whether more pages follow)
+        """
+        stmt = select(Investment).where(
+            and_(*self._listing_filters(user_id, investment_type, start_date, end_date))
+        )
+        stmt = keyset_page(stmt, INVESTMENT_SORT_KEYS[sort], Investment.id, descending, after, limit)
+        result = await db.execute(stmt)
+        investments = list(result.scalars().all())
+        return investments[:limit], len(investments) > limit
+    
+    async def count_by_user(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """Count a user's investments matching listing filters."""
+        stmt = select(func.count(Investment.id)).where(
+            and_(*self._listing_filters(user_id, investment_type, start_date, end_date))
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one()
+    
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        after: Optional[Tuple[float, int]] = None,
+        limit: int = 50,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Tuple[Investment, float]], bool]:
+        """
+        Get one page of a user's investments matching a search query.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Search text
+            after: (relevance, ID) of the last row of the previous page
+            limit: Page size
+            investment_type: Optional type filter
+            start_date: Optional first purchase date
+            end_date: Optional last purchase date
+            
+        Returns:
+            Tuple of (pairs of investment and relevance, most relevant first,
+            whether more pages follow)
+        """
+        rank = search_rank(query, INVESTMENT_SEARCH_COLUMNS)
+        conditions = self._listing_filters(user_id, investment_type, start_date, end_date)
+        conditions.append(search_match(query, INVESTMENT_SEARCH_COLUMNS))
+        
+        stmt = keyset_page(
+            select(Investment, rank).where(and_(*conditions)), rank, Investment.id, True, after, limit
+        )
+        result = await db.execute(stmt)
+        rows = [(investment, score) for investment, score in result.all()]
+        return rows[:limit], len(rows) > limit
+    
     async def get_summary_by_type(
         self,
         db: AsyncSession,
         user_id: int,
+        today: Optional[date] = None,
     ) -> List[dict]:
-        """Get investment summary grouped by type."""
+        """
+        Get investment summary grouped by type.
+        
+        Investments without a current value are valued at their amount.
+        Portfolio weights use a window over the grouped rows, so the whole
+        summary is computed in a single query.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            today: Day holding periods are measured to, defaults to today
+            
+        Returns:
+            Summary rows ordered by market value, largest first
+        """
+        total_amount = func.sum(Investment.amount)
+        market_value = func.sum(func.coalesce(Investment.current_value, Investment.amount))
+        holding_days = literal(today or date.today(), Date) - Investment.purchase_date
+        
         stmt = select(
             Investment.investment_type,
-            func.sum(Investment.amount).label('total_amount'),
+            total_amount.label('total_amount'),
             func.sum(Investment.current_value).label('total_current_value'),
-            func.count(Investment.id).label('count')
+            func.count(Investment.id).label('count'),
+            market_value.label('market_value'),
+            (market_value - total_amount).label('unrealized_pl'),
+            ((market_value - total_amount) / func.nullif(total_amount, 0) * 100).label('return_percentage'),
+            (market_value / func.nullif(func.sum(market_value).over(), 0) * 100).label('weight'),
+            func.min(Investment.purchase_date).label('oldest_purchase_date'),
+            func.max(Investment.purchase_date).label('newest_purchase_date'),
+            func.avg(holding_days).label('average_holding_days'),
         ).where(
             and_(
                 Investment.user_id == user_id,
                 Investment.is_deleted == False
             )
-        ).group_by(Investment.investment_type)
+        ).group_by(Investment.investment_type).order_by(market_value.desc())
         
         result = await db.execute(stmt)
         return [
             {
-                "investment_type": row[0],
-                "total_amount": float(row[1] or 0),
-                "total_current_value": float(row[2] or 0),
-                "count": row[3]
+                "investment_type": row.investment_type,
+                "total_amount": float(row.total_amount or 0),
+                "total_current_value": float(row.total_current_value or 0),
+                "count": row.count,
+                "market_value": float(row.market_value or 0),
+                "unrealized_pl": float(row.unrealized_pl or 0),
+                "return_percentage": float(row.return_percentage or 0),
+                "weight": float(row.weight or 0),
+                "oldest_purchase_date": row.oldest_purchase_date,
+                "newest_purchase_date": row.newest_purchase_date,
+                "average_holding_days": float(row.average_holding_days or 0),
             }
             for row in result
         ]
+    
+    @staticmethod
+    def instrument_expression() -> ColumnElement[Optional[str]]:
+        """SQL expression for the market instrument of an investment."""
+        return func.coalesce(
+            Investment.symbol,
+            case(
+                *((Investment.investment_type == type_, symbol) for type_, symbol in DEFAULT_INSTRUMENTS.items()),
+                else_=None,
+            ),
+        )
+    
+    def _valuable_filter(self) -> ColumnElement[bool]:
+        """Investments which can be valued from a market price."""
+        return and_(
+            Investment.is_deleted == False,
+            Investment.quantity.isnot(None),
+            self.instrument_expression().isnot(None)
+        )
+    
+    async def get_instruments(self, db: AsyncSession) -> List[str]:
+        """
+        Get distinct instruments of all investments with a quantity.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Sorted list of instruments
+        """
+        instrument = self.instrument_expression()
+        stmt = select(instrument).where(self._valuable_filter()).distinct().order_by(instrument)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def get_valuation_batch(
+        self,
+        db: AsyncSession,
+        after_id: int,
+        limit: int,
+    ) -> List[Tuple[int, str, float]]:
+        """
+        Get a keyset page of investments to revalue.
+        
+        Args:
+            db: Database session
+            after_id: Return investments with ID greater than this one
+            limit: Maximum number of rows
+            
+        Returns:
+            Rows of (id, instrument, quantity) ordered by ID
+        """
+        stmt = select(
+            Investment.id,
+            self.instrument_expression(),
+            Investment.quantity,
+        ).where(
+            and_(Investment.id > after_id, self._valuable_filter())
+        ).order_by(Investment.id).limit(limit)
+        result = await db.execute(stmt)
+        return [tuple(row) for row in result]
+    
+    async def get_positions(
+        self,
+        db: AsyncSession,
+        user_id: int,
+    ) -> List[Tuple[Optional[str], date, Optional[float], float]]:
+        """
+        Get purchases of a user for valuation over time.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            Rows of (instrument, purchase date, quantity, amount) ordered by
+            purchase date; instrument or quantity is None for investments
+            without a market price
+        """
+        stmt = select(
+            self.instrument_expression(),
+            Investment.purchase_date,
+            Investment.quantity,
+            Investment.amount,
+        ).where(
+            and_(
+                Investment.user_id == user_id,
+                Investment.is_deleted == False
+            )
+        ).order_by(Investment.purchase_date)
+        result = await db.execute(stmt)
+        return [tuple(row) for row in result]
+    
+    async def update_current_values(
+        self,
+        db: AsyncSession,
+        current_values: Sequence[Tuple[int, float]],
+    ) -> int:
+        """
+        Set current values of many investments in one statement.
+        
+        Issues a single ``UPDATE investments ... FROM (VALUES ...)``.
+        
+        Args:
+            db: Database session
+            current_values: Pairs of (investment ID, current value)
+            
+        Returns:
+            Number of updated investments
+        """
+        if not current_values:
+            return 0
+        
+        new_values = values(
+            column("id", Integer), column("current_value", Float), name="new_values"
+        ).data(list(current_values))
+        stmt = update(Investment).where(
+            Investment.id == new_values.c.id
+        ).values(
+            current_value=new_values.c.current_value,
+            updated_at=datetime.utcnow(),
+        ).execution_options(synchronize_session=False)
+        result = await db.execute(stmt)
+        return result.rowcount
+
+
+class MarketPriceRepository(BaseRepository[MarketPrice]):
+    """Market price repository."""
+    
+    def __init__(self) -> None:
+        super().__init__(MarketPrice)
+    
+    async def get_prices(
+        self,
+        db: AsyncSession,
+        instruments: Sequence[str],
+        day: date,
+    ) -> Dict[str, float]:
+        """
+        Get stored prices of instruments for a day.
+        
+        Args:
+            db: Database session
+            instruments: Instruments to look up
+            day: Price date
+            
+        Returns:
+            Prices keyed by instrument, instruments without a price are left out
+        """
+        stmt = select(MarketPrice.instrument, MarketPrice.price).where(
+            and_(
+                MarketPrice.instrument.in_(instruments),
+                MarketPrice.date == day,
+                MarketPrice.is_deleted == False
+            )
+        )
+        result = await db.execute(stmt)
+        return {instrument: price for instrument, price in result}
+    
+    async def get_price_history(
+        self,
+        db: AsyncSession,
+        instruments: Sequence[str],
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[str, date, float]]:
+        """
+        Get stored prices of instruments within a date range.
+        
+        The latest price before the range is included for every instrument,
+        so prices can be carried forward from the first day.
+        
+        Args:
+            db: Database session
+            instruments: Instruments to look up
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Rows of (instrument, date, price) ordered by date
+        """
+        if not instruments:
+            return []
+        
+        active = and_(MarketPrice.instrument.in_(instruments), MarketPrice.is_deleted == False)
+        previous = select(
+            MarketPrice.instrument, MarketPrice.date, MarketPrice.price
+        ).where(
+            and_(active, MarketPrice.date < start_date)
+        ).distinct(MarketPrice.instrument).order_by(
+            MarketPrice.instrument, MarketPrice.date.desc()
+        ).subquery("previous")
+        in_range = select(
+            MarketPrice.instrument, MarketPrice.date, MarketPrice.price
+        ).where(
+            and_(active, MarketPrice.date >= start_date, MarketPrice.date <= end_date)
+        )
+        prices = select(previous).union_all(in_range).subquery("prices")
+        result = await db.execute(select(prices).order_by(prices.c.date))
+        return [tuple(row) for row in result]
+    
+    async def upsert_prices(
+        self,
+        db: AsyncSession,
+        day: date,
+        prices: Dict[str, float],
+        source: str,
+    ) -> None:
+        """
+        Store prices of a day, replacing existing ones.
+        
+        Args:
+            db: Database session
+            day: Price date
+            prices: Prices keyed by instrument
+            source: Price provider name
+        """
+        if not prices:
+            return
+        
+        now = datetime.utcnow()
+        stmt = pg_insert(MarketPrice).values([
+            {
+                "instrument": instrument,
+                "date": day,
+                "price": price,
+                "source": source,
+                "is_deleted": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for instrument, price in prices.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MarketPrice.instrument, MarketPrice.date],
+            set_={
+                "price": stmt.excluded.price,
+                "source": stmt.excluded.source,
+                "is_deleted": False,
+                "updated_at": now,
+            },
+        )
+        await db.execute(stmt)
+
+
+# Columns of the unique (user_id, year, month) constraint used as upsert target
+GOAL_KEY = [MonthlyGoal.user_id, MonthlyGoal.year, MonthlyGoal.month]
 
 
 class MonthlyGoalRepository(BaseRepository[MonthlyGoal]):
@@ -137,6 +812,26 @@ class MonthlyGoalRepository(BaseRepository[MonthlyGoal]):
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_by_month_for_users(
+        self,
+        db: AsyncSession,
+        user_ids: Sequence[int],
+        year: int,
+        month: int,
+    ) -> List[MonthlyGoal]:
+        """Get goals for a specific month of several users."""
+        stmt = select(MonthlyGoal).where(
+            and_(
+                MonthlyGoal.user_id.in_(user_ids),
+                MonthlyGoal.year == year,
+                MonthlyGoal.month == month,
+                MonthlyGoal.is_deleted == False
+            )
+        )
+        
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
     async def get_by_year(
         self,
         db: AsyncSession,
@@ -154,9 +849,120 @@ class MonthlyGoalRepository(BaseRepository[MonthlyGoal]):
         
         result = await db.execute(stmt)
         return list(result.scalars().all())
+    
+    async def create_missing(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        year: int,
+        months: Sequence[int],
+        values: Dict[str, Any],
+    ) -> List[MonthlyGoal]:
+        """
+        Create goals for the given months of a year unless they exist.
+        
+        Issues a single multi-row ``INSERT ... ON CONFLICT DO UPDATE
+        RETURNING``, so concurrent callers cannot create duplicates.
+        Soft-deleted goals are restored with the given values, live goals
+        are left untouched.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            year: Year
+            months: Months (1-12) to create goals for
+            values: Goal values
+            
+        Returns:
+            Newly created or restored goals; months that had one are skipped
+        """
+        stmt = pg_insert(MonthlyGoal).values([
+            {"user_id": user_id, "year": year, "month": month, **values}
+            for month in months
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=GOAL_KEY,
+            set_={
+                **{field: stmt.excluded[field] for field in values},
+                "is_deleted": False,
+                "updated_at": datetime.utcnow(),
+            },
+            where=MonthlyGoal.is_deleted == True,
+        ).returning(MonthlyGoal).execution_options(populate_existing=True)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def create_if_missing(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int,
+        values: Dict[str, Any],
+    ) -> Optional[MonthlyGoal]:
+        """Create or restore goal for specific month, None if the month already had one."""
+        created = await self.create_missing(db, user_id, year, [month], values)
+        return created[0] if created else None
+    
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        year: int,
+        months: Sequence[int],
+        defaults: Dict[str, Any],
+        values: Dict[str, Any],
+    ) -> List[MonthlyGoal]:
+        """
+        Create or update goals for the given months of a year in one statement.
+        
+        Uses a multi-row ``INSERT ... ON CONFLICT DO UPDATE RETURNING``: new
+        goals get ``defaults`` overridden by ``values``, existing ones only
+        ``values``.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            year: Year
+            months: Months (1-12) to write
+            defaults: Goal values used when a goal does not exist yet
+            values: Goal values to set
+            
+        Returns:
+            Created or updated goals ordered by month
+        """
+        stmt = pg_insert(MonthlyGoal).values([
+            {"user_id": user_id, "year": year, "month": month, **defaults, **values}
+            for month in months
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=GOAL_KEY,
+            set_={
+                **{field: stmt.excluded[field] for field in values},
+                "is_deleted": False,
+                "updated_at": datetime.utcnow(),
+            },
+        ).returning(MonthlyGoal).execution_options(populate_existing=True)
+        
+        result = await db.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda goal: goal.month)
+    
+    async def upsert(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        year: int,
+        month: int,
+        defaults: Dict[str, Any],
+        values: Dict[str, Any],
+    ) -> MonthlyGoal:
+        """Create or update goal for specific month in one statement."""
+        goals = await self.upsert_many(db, user_id, year, [month], defaults, values)
+        return goals[0]
 
 
 # Repository instances
 daily_entry_repository = DailyEntryRepository()
 investment_repository = InvestmentRepository()
 monthly_goal_repository = MonthlyGoalRepository()
+market_price_repository = MarketPriceRepository()
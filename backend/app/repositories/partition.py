@@ -0,0 +1,196 @@
+"""Partition maintenance for range-partitioned tables."""
+from typing import List, Optional, Tuple
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class PartitionRepository:
+    """
+    Partition repository for a table range-partitioned by date.
+    
+    Partitions are named ``<table>_y<YYYY>`` for yearly and
+    ``<table>_m<YYYY>_<MM>`` for monthly intervals, next to a
+    ``<table>_default`` partition that catches rows outside them.
+    """
+    
+    def __init__(self, table: str, column: str, interval: str):
+        """
+        Initialize repository.
+        
+        Args:
+            table: Partitioned table name
+            column: Partition key column
+            interval: Partition interval, ``year`` or ``month``
+        """
+        if interval not in ("year", "month"):
+            raise ValueError(f"Unsupported partition interval: {interval}")
+        self.table = table
+        self.column = column
+        self.interval = interval
+    
+    @property
+    def default_partition(self) -> str:
+        """Name of the default partition."""
+        return f"{self.table}_default"
+    
+    def bounds(self, day: date) -> Tuple[date, date]:
+        """
+        Get bounds of the partition containing a day.
+        
+        Args:
+            day: Any day within the partition
+            
+        Returns:
+            Tuple of (inclusive lower bound, exclusive upper bound)
+        """
+        if self.interval == "year":
+            return date(day.year, 1, 1), date(day.year + 1, 1, 1)
+        lower = date(day.year, day.month, 1)
+        upper = date(day.year + 1, 1, 1) if day.month == 12 else date(day.year, day.month + 1, 1)
+        return lower, upper
+    
+    def partition_name(self, day: date) -> str:
+        """Get name of the partition containing a day."""
+        if self.interval == "year":
+            return f"{self.table}_y{day.year}"
+        return f"{self.table}_m{day.year}_{day.month:02d}"
+    
+    def _parse_lower_bound(self, name: str) -> Optional[date]:
+        """Get lower bound from a partition name, None if not ours."""
+        suffix = name[len(self.table) + 1:]
+        try:
+            if self.interval == "year" and suffix.startswith("y"):
+                return date(int(suffix[1:]), 1, 1)
+            if self.interval == "month" and suffix.startswith("m"):
+                year, month = suffix[1:].split("_")
+                return date(int(year), int(month), 1)
+        except ValueError:
+            return None
+        return None
+    
+    async def is_partitioned(self, db: AsyncSession) -> bool:
+        """Check whether the table is a partitioned table."""
+        result = await db.execute(
+            text("SELECT relkind::text FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": self.table},
+        )
+        return result.scalar_one_or_none() == "p"
+    
+    async def get_partitions(self, db: AsyncSession) -> List[str]:
+        """
+        Get interval partitions of the table ordered by name.
+        
+        The default partition is not included.
+        """
+        result = await db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = to_regclass(:table) "
+                "ORDER BY child.relname"
+            ),
+            {"table": self.table},
+        )
+        return [name for name in result.scalars() if self._parse_lower_bound(name)]
+    
+    async def create_partition(self, db: AsyncSession, day: date) -> bool:
+        """
+        Create the partition containing a day if it does not exist.
+        
+        Rows already stored in the default partition for that range are
+        moved into the new partition before it is attached.
+        
+        Args:
+            db: Database session
+            day: Any day within the partition
+            
+        Returns:
+            True if the partition was created
+        """
+        name = self.partition_name(day)
+        if name in await self.get_partitions(db):
+            return False
+        
+        lower, upper = self.bounds(day)
+        await db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {self.table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        
+        default_exists = await db.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": self.default_partition}
+        )
+        if default_exists.scalar_one():
+            await db.execute(
+                text(
+                    f"WITH moved AS ("
+                    f"DELETE FROM {self.default_partition} "
+                    f"WHERE {self.column} >= :lower AND {self.column} < :upper "
+                    f"RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                {"lower": lower, "upper": upper},
+            )
+        
+        await db.execute(
+            text(
+                f"ALTER TABLE {self.table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+        return True
+    
+    async def ensure_partitions(self, db: AsyncSession, start: date, periods: int) -> List[str]:
+        """
+        Make sure partitions exist for a number of periods from a day on.
+        
+        Args:
+            db: Database session
+            start: Day within the first period
+            periods: Number of consecutive periods to cover
+            
+        Returns:
+            Names of newly created partitions
+        """
+        if not await self.is_partitioned(db):
+            return []
+        
+        created = []
+        day = start
+        for _ in range(periods):
+            if await self.create_partition(db, day):
+                created.append(self.partition_name(day))
+            day = self.bounds(day)[1]
+        return created
+    
+    async def drop_partitions_before(self, db: AsyncSession, cutoff: date) -> List[str]:
+        """
+        Detach and drop partitions that lie entirely before a cutoff.
+        
+        Args:
+            db: Database session
+            cutoff: Partitions whose upper bound is not after this day are dropped
+            
+        Returns:
+            Names of dropped partitions
+        """
+        if not await self.is_partitioned(db):
+            return []
+        
+        dropped = []
+        for name in await self.get_partitions(db):
+            lower = self._parse_lower_bound(name)
+            if self.bounds(lower)[1] > cutoff:
+                continue
+            await db.execute(text(f"ALTER TABLE {self.table} DETACH PARTITION {name}"))
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+        return dropped
+
+
+# Repository instances
+daily_entry_partitions = PartitionRepository("daily_entries", "date", "year")
+notification_partitions = PartitionRepository("notifications", "created_at", "month")
@@ -1,5 +1,5 @@
 """User repository."""
-from typing import Optional
+from typing import List, Optional, Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
@@ -73,6 +73,55 @@ class UserRepository(BaseRepository[User]):
         if not verify_password(password, user.hashed_password):
             return None
         return user
+    
+    async def get_active_ids_after(
+        self,
+        db: AsyncSession,
+        after_id: int,
+        limit: int,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> List[int]:
+        """
+        Get a keyset page of active user IDs.
+        
+        Args:
+            db: Database session
+            after_id: Return IDs greater than this one
+            limit: Maximum number of IDs to return
+            shard: Only return IDs with ``id % shards == shard``
+            shards: Number of shards
+            
+        Returns:
+            Ascending list of user IDs
+        """
+        stmt = select(User.id).where(
+            User.id > after_id,
+            User.id % shards == shard,
+            User.is_active == True,
+            User.is_deleted == False
+        ).order_by(User.id).limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    
+    async def get_many(self, db: AsyncSession, user_ids: Sequence[int]) -> List[User]:
+        """
+        Get active users by IDs.
+        
+        Args:
+            db: Database session
+            user_ids: User IDs
+            
+        Returns:
+            Users ordered by ID
+        """
+        stmt = select(User).where(
+            User.id.in_(user_ids),
+            User.is_active == True,
+            User.is_deleted == False
+        ).order_by(User.id)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
 
 
 user_repository = UserRepository()
@@ -9,6 +9,8 @@ from app.schemas.user import (
     ChangePassword,
     PasswordResetRequest,
     PasswordResetConfirm,
+    ExportTaskResponse,
+    ExportFileResponse,
 )
 from app.schemas.finance import (
     DailyEntryBase,
@@ -23,12 +25,21 @@ from app.schemas.finance import (
     MonthlyGoalBase,
     MonthlyGoalCreate,
     MonthlyGoalUpdate,
+    YearlyGoalUpdate,
     MonthlyGoalResponse,
     CategoryBreakdown,
     MonthlyAnalytics,
     AnnualAnalytics,
     DashboardStats,
 )
+from app.schemas.job import (
+    JobCreate,
+    ExportJobParams,
+    AnnualReportJobParams,
+    JobResponse,
+)
+from app.schemas.notification import NotificationResponse
+from app.schemas.sync import SyncChanges, SyncResponse
 
 __all__ = [
     "BaseSchema",
@@ -43,6 +54,8 @@ __all__ = [
     "ChangePassword",
     "PasswordResetRequest",
     "PasswordResetConfirm",
+    "ExportTaskResponse",
+    "ExportFileResponse",
     "DailyEntryBase",
     "DailyEntryCreate",
     "DailyEntryUpdate",
@@ -55,9 +68,17 @@ __all__ = [
     "MonthlyGoalBase",
     "MonthlyGoalCreate",
     "MonthlyGoalUpdate",
+    "YearlyGoalUpdate",
     "MonthlyGoalResponse",
     "CategoryBreakdown",
     "MonthlyAnalytics",
     "AnnualAnalytics",
     "DashboardStats",
+    "JobCreate",
+    "ExportJobParams",
+    "AnnualReportJobParams",
+    "JobResponse",
+    "NotificationResponse",
+    "SyncChanges",
+    "SyncResponse",
 ]
@@ -1,7 +1,8 @@
 """Finance schemas."""
-from typing import Optional, List
+import codecs
+from typing import Any, Literal, Optional, List
 from datetime import date
-from pydantic import Field
+from pydantic import Field, field_validator, model_validator
 from app.schemas.base import BaseSchema, BaseResponse
 from app.models.finance import ExpenseCategory, InvestmentType
 
@@ -45,12 +46,68 @@ class DailyEntryResponse(BaseResponse, DailyEntryBase):
     user_id: int
 
 
+class EntryImportMapping(BaseSchema):
+    """
+    Column mapping of CSV statement imports.
+    
+    Amounts come either from one signed column or from separate income and
+    expense columns; mapping ``income`` or ``expense`` without ``amount``
+    selects the latter. OFX statements have fixed fields and only use
+    ``encoding``.
+    """
+    
+    date: str = "date"
+    amount: Optional[str] = "amount"  # Signed, negative amounts are expenses
+    income: Optional[str] = None
+    expense: Optional[str] = None
+    description: Optional[str] = "description"
+    category: Optional[str] = None  # Values matching ExpenseCategory names
+    date_format: str = "%Y-%m-%d"
+    decimal_separator: Literal[".", ","] = "."
+    delimiter: Optional[str] = Field(None, min_length=1, max_length=1)  # Detected if not set
+    encoding: str = "utf-8-sig"
+    
+    @model_validator(mode="before")
+    @classmethod
+    def default_amount_column(cls, data: Any) -> Any:
+        # The signed column is only the default when no separate columns are mapped
+        if isinstance(data, dict) and "amount" not in data and (data.get("income") or data.get("expense")):
+            return {**data, "amount": None}
+        return data
+    
+    @field_validator("encoding")
+    @classmethod
+    def validate_encoding(cls, v: str) -> str:
+        try:
+            codecs.lookup(v)
+        except LookupError:
+            raise ValueError(f"Unknown encoding: {v}")
+        return v
+    
+    @model_validator(mode="after")
+    def validate_amount_columns(self) -> "EntryImportMapping":
+        if not (self.amount or self.income or self.expense):
+            raise ValueError("Map an amount column or income and expense columns")
+        return self
+
+
+class EntryImportResult(BaseSchema):
+    """Statement import result."""
+    
+    rows: int  # Transactions read from the file
+    inserted: int
+    duplicates: int  # Already imported before or repeated in the file
+    skipped: int  # Rows that could not be parsed
+    errors: List[str] = Field(default_factory=list)  # First parse errors with line numbers
+
+
 # Investment Schemas
 class InvestmentBase(BaseSchema):
     """Base investment schema."""
     
     investment_type: InvestmentType
     name: str = Field(..., max_length=255)
+    symbol: Optional[str] = Field(None, max_length=50)
     amount: float = Field(..., gt=0)
     quantity: Optional[float] = Field(None, gt=0)
     purchase_date: date
@@ -67,6 +124,7 @@ class InvestmentUpdate(BaseSchema):
     """Schema for updating investment."""
     
     name: Optional[str] = Field(None, max_length=255)
+    symbol: Optional[str] = Field(None, max_length=50)
     amount: Optional[float] = Field(None, gt=0)
     quantity: Optional[float] = Field(None, gt=0)
     current_value: Optional[float] = Field(None, ge=0)
@@ -86,6 +144,48 @@ class InvestmentSummary(BaseSchema):
     total_amount: float
     total_current_value: float
     count: int
+    market_value: float  # Current values, purchase amounts where unknown
+    unrealized_pl: float
+    return_percentage: float
+    weight: float  # Share of the portfolio market value in percent
+    oldest_purchase_date: date
+    newest_purchase_date: date
+    average_holding_days: float
+
+
+class PortfolioHistoryPoint(BaseSchema):
+    """Portfolio value on a day."""
+    
+    date: date
+    value: float  # Market value in PLN
+    invested: float  # Purchase amounts in PLN
+
+
+class PositionReturn(BaseSchema):
+    """Annualized return of an investment."""
+    
+    investment_id: int
+    name: str
+    investment_type: InvestmentType
+    xirr: Optional[float] = None  # None when it cannot be determined
+
+
+class TypeReturn(BaseSchema):
+    """Annualized return of all investments of a type."""
+    
+    investment_type: InvestmentType
+    xirr: Optional[float] = None
+
+
+class InvestmentReturns(BaseSchema):
+    """Investment returns, rates as fractions."""
+    
+    portfolio_xirr: Optional[float] = None
+    portfolio_twr: Optional[float] = None  # Time-weighted return since the first purchase
+    portfolio_twr_annualized: Optional[float] = None  # Only for periods of a year or longer
+    since: Optional[date] = None
+    by_type: List[TypeReturn]
+    positions: List[PositionReturn]
 
 
 # Monthly Goal Schemas
@@ -114,6 +214,19 @@ class MonthlyGoalUpdate(BaseSchema):
     investment_goal: Optional[float] = Field(None, ge=0)
 
 
+class YearlyGoalUpdate(MonthlyGoalUpdate):
+    """Schema for applying one goal template to several months."""
+    
+    months: List[int] = Field(default_factory=lambda: list(range(1, 13)), min_length=1)
+    
+    @field_validator("months")
+    @classmethod
+    def validate_months(cls, v: List[int]) -> List[int]:
+        if any(month < 1 or month > 12 for month in v):
+            raise ValueError("Months must be between 1 and 12")
+        return sorted(set(v))
+
+
 class MonthlyGoalResponse(BaseResponse, MonthlyGoalBase):
     """Monthly goal response schema."""
     
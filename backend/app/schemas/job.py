@@ -0,0 +1,44 @@
+"""Background job schemas."""
+from typing import Any, Dict, Literal, Optional
+from datetime import datetime
+from pydantic import Field
+from app.schemas.base import BaseSchema
+from app.schemas.finance import EntryImportMapping
+
+
+class JobCreate(BaseSchema):
+    """Schema for submitting a job."""
+    
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ExportJobParams(BaseSchema):
+    """Parameters of a data export job."""
+    
+    format: Literal["jsonl", "csv"] = "jsonl"
+
+
+class AnnualReportJobParams(BaseSchema):
+    """Parameters of an annual report job."""
+    
+    year: int = Field(..., ge=2000, le=2100)
+
+
+class ImportJobParams(BaseSchema):
+    """Parameters of a statement import job."""
+    
+    upload_id: str = Field(..., pattern="^[0-9a-f]{32}$")  # Stored by POST /entries/import
+    format: Literal["csv", "ofx"]
+    mapping: EntryImportMapping = Field(default_factory=EntryImportMapping)
+
+
+class JobResponse(BaseSchema):
+    """Job status response."""
+    
+    id: str
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    created_at: datetime
+    progress: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
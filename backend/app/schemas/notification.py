@@ -0,0 +1,12 @@
+"""Notification schemas."""
+from app.schemas.base import BaseResponse
+
+
+class NotificationResponse(BaseResponse):
+    """Notification response schema."""
+    user_id: int
+    title: str
+    message: str
+    notification_type: str
+    is_read: bool
+    count: int = 1
@@ -0,0 +1,26 @@
+"""Sync schemas."""
+from typing import Generic, List, TypeVar
+from pydantic import Field
+from app.schemas.base import BaseSchema
+from app.schemas.finance import DailyEntryResponse, InvestmentResponse, MonthlyGoalResponse
+from app.schemas.notification import NotificationResponse
+
+RowType = TypeVar("RowType")
+
+
+class SyncChanges(BaseSchema, Generic[RowType]):
+    """Rows of one table written since a sync token."""
+    
+    updated: List[RowType] = Field(default_factory=list)  # Created or updated rows
+    deleted: List[int] = Field(default_factory=list)  # IDs of soft-deleted rows
+
+
+class SyncResponse(BaseSchema):
+    """Changes of every user-owned table since a sync token."""
+    
+    token: str  # Pass as ``since`` to get the next changes
+    has_more: bool  # Some table had more changes than one page, sync again right away
+    entries: SyncChanges[DailyEntryResponse]
+    investments: SyncChanges[InvestmentResponse]
+    goals: SyncChanges[MonthlyGoalResponse]
+    notifications: SyncChanges[NotificationResponse]
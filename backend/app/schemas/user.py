@@ -73,3 +73,18 @@ class PasswordResetConfirm(BaseSchema):
     
     token: str
     new_password: str = Field(..., min_length=8, max_length=100)
+
+
+class ExportTaskResponse(BaseSchema):
+    """Queued data export."""
+    
+    task_id: str
+    format: str
+
+
+class ExportFileResponse(BaseSchema):
+    """Finished data export file."""
+    
+    file_name: str
+    size: int
+    created_at: datetime
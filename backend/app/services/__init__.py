@@ -4,6 +4,15 @@ from app.services.user import UserService, user_service
 from app.services.finance import FinanceService, finance_service
 from app.services.analytics import AnalyticsService, analytics_service
 from app.services.notification import NotificationService, notification_service
+from app.services.export import ExportService, export_service
+from app.services.jobs import JobService, job_service
+from app.services.prices import (
+    PriceProvider,
+    FilePriceProvider,
+    PriceService,
+    get_price_provider,
+    price_service,
+)
 
 __all__ = [
     "AuthService",
@@ -16,4 +25,13 @@ __all__ = [
     "analytics_service",
     "NotificationService",
     "notification_service",
+    "ExportService",
+    "export_service",
+    "JobService",
+    "job_service",
+    "PriceProvider",
+    "FilePriceProvider",
+    "PriceService",
+    "get_price_provider",
+    "price_service",
 ]
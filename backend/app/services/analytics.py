@@ -1,5 +1,5 @@
 """Analytics service."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from collections import defaultdict
@@ -124,6 +124,70 @@ class AnalyticsService:
             goal_progress=goal_response,
         )
     
+    async def get_monthly_analytics_for_users(
+        self,
+        db: AsyncSession,
+        user_ids: Sequence[int],
+        year: int,
+        month: int,
+    ) -> Dict[int, MonthlyAnalytics]:
+        """
+        Get monthly analytics for several users at once.
+        
+        Entry aggregates for all users come from a single grouped query and
+        goals from another, instead of two queries per user.
+        
+        Args:
+            db: Database session
+            user_ids: User IDs
+            year: Year
+            month: Month
+            
+        Returns:
+            Monthly analytics keyed by user ID, for every requested user
+        """
+        rows = await daily_entry_repository.get_month_totals_by_users(db, user_ids, year, month)
+        goals = {
+            goal.user_id: goal
+            for goal in await monthly_goal_repository.get_by_month_for_users(db, user_ids, year, month)
+        }
+        
+        totals: Dict[int, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        category_totals: Dict[int, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for row in rows:
+            user_totals = totals[row.user_id]
+            user_totals["income"] += row.income
+            user_totals["expense"] += row.expense
+            user_totals["gold"] += row.gold
+            user_totals["silver"] += row.silver
+            if row.expense > 0 and row.expense_category:
+                category_totals[row.user_id][row.expense_category.value] += row.expense
+        
+        analytics = {}
+        for user_id in user_ids:
+            user_totals = totals[user_id]
+            total_expense = user_totals["expense"]
+            goal = goals.get(user_id)
+            analytics[user_id] = MonthlyAnalytics(
+                year=year,
+                month=month,
+                total_income=user_totals["income"],
+                total_expense=total_expense,
+                net_income=user_totals["income"] - total_expense,
+                total_gold=user_totals["gold"],
+                total_silver=user_totals["silver"],
+                category_breakdown=[
+                    CategoryBreakdown(
+                        category=category,
+                        amount=amount,
+                        percentage=(amount / total_expense * 100) if total_expense > 0 else 0
+                    )
+                    for category, amount in category_totals[user_id].items()
+                ],
+                goal_progress=MonthlyGoalResponse.model_validate(goal) if goal else None,
+            )
+        return analytics
+    
     async def get_annual_analytics(
         self,
         db: AsyncSession,
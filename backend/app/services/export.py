@@ -0,0 +1,279 @@
+"""User data export service."""
+import csv
+import enum
+import gzip
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Type
+from datetime import date, datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, ValidationError
+from app.models.base import BaseModel
+from app.models.finance import DailyEntry, Investment, MonthlyGoal
+from app.models.notification import Notification
+
+
+EXPORT_FORMATS = ("jsonl", "csv")
+
+# Exported record types and their models, in file order
+EXPORT_SECTIONS: Dict[str, Type[BaseModel]] = {
+    "daily_entry": DailyEntry,
+    "investment": Investment,
+    "monthly_goal": MonthlyGoal,
+    "notification": Notification,
+}
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to a JSON/CSV friendly value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class ExportService:
+    """
+    User data export service.
+    
+    Exports are written to ``EXPORT_DIR`` as gzip-compressed JSON Lines or
+    CSV. Rows are read through server-side cursors as plain tuples and
+    written as they arrive, so memory use does not depend on account size.
+    """
+    
+    def _file_prefix(self, user_id: int) -> str:
+        """Prefix of export file names of a user."""
+        return f"export_{user_id}_"
+    
+    def file_name(self, user_id: int, format: str, created_at: datetime) -> str:
+        """
+        Get a new export file name.
+        
+        Names start with the export time and carry a random suffix, so
+        exports started within the same second do not overwrite each other.
+        
+        Args:
+            user_id: User ID
+            format: Export format
+            created_at: Export time
+            
+        Returns:
+            File name
+        """
+        return f"{self._file_prefix(user_id)}{created_at:%Y%m%d%H%M%S}_{uuid.uuid4().hex[:8]}.{format}.gz"
+    
+    def list_files(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        List finished exports of a user, newest first.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            File name, size and creation time of every export
+        """
+        export_dir = Path(settings.EXPORT_DIR)
+        if not export_dir.is_dir():
+            return []
+        
+        files = []
+        for path in export_dir.glob(f"{self._file_prefix(user_id)}*.gz"):
+            stat = path.stat()
+            files.append({
+                "file_name": path.name,
+                "size": stat.st_size,
+                "created_at": datetime.utcfromtimestamp(stat.st_mtime),
+            })
+        return sorted(files, key=lambda f: f["file_name"], reverse=True)
+    
+    def get_file(self, user_id: int, file_name: str) -> Path:
+        """
+        Get path of a finished export of a user.
+        
+        Args:
+            user_id: User ID
+            file_name: Export file name
+            
+        Returns:
+            Path to the export file
+            
+        Raises:
+            NotFoundError: If the file does not exist or belongs to another user
+        """
+        if Path(file_name).name != file_name or not file_name.startswith(self._file_prefix(user_id)):
+            raise NotFoundError("Export not found")
+        
+        path = Path(settings.EXPORT_DIR) / file_name
+        if not path.is_file():
+            raise NotFoundError("Export not found")
+        return path
+    
+    def delete_files(self, user_id: int) -> int:
+        """
+        Delete all exports and reports of a user.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Number of files deleted
+        """
+        export_dir = Path(settings.EXPORT_DIR)
+        if not export_dir.is_dir():
+            return 0
+        
+        deleted = 0
+        for path in export_dir.glob(f"{self._file_prefix(user_id)}*"):
+            path.unlink(missing_ok=True)
+            deleted += 1
+        return deleted
+    
+    def prune_files(self, max_age: int) -> int:
+        """
+        Delete exports, reports and abandoned partial files older than ``max_age``.
+        
+        Args:
+            max_age: Maximum file age in seconds
+            
+        Returns:
+            Number of files deleted
+        """
+        export_dir = Path(settings.EXPORT_DIR)
+        if not export_dir.is_dir():
+            return 0
+        
+        cutoff = time.time() - max_age
+        deleted = 0
+        for path in export_dir.glob("export_*"):
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+    
+    async def export_user_data(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        format: str = "jsonl",
+        on_progress: Optional[Callable[[str, int], None]] = None,
+    ) -> Path:
+        """
+        Export all data of a user to a compressed file.
+        
+        JSON Lines records carry a ``record_type`` key; CSV has a
+        ``record_type`` column followed by the union of all model columns.
+        The file is written under a temporary name and renamed when done.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            format: ``jsonl`` or ``csv``
+            on_progress: Called with record type and rows written so far after every chunk
+            
+        Returns:
+            Path to the export file
+            
+        Raises:
+            ValidationError: If the format is not supported
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValidationError(f"Unsupported export format: {format}")
+        
+        export_dir = Path(settings.EXPORT_DIR)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        path = export_dir / self.file_name(user_id, format, datetime.utcnow())
+        partial = path.with_name(path.name + ".partial")
+        
+        columns: List[str] = []
+        for model in EXPORT_SECTIONS.values():
+            columns += [c.name for c in model.__table__.columns if c.name not in columns]
+        
+        try:
+            with gzip.open(partial, "wt", encoding="utf-8", newline="") as file:
+                write = self._writer(file, format, ["record_type"] + columns)
+                for record_type, model in EXPORT_SECTIONS.items():
+                    await self._export_section(db, user_id, record_type, model, write, on_progress)
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return path
+    
+    def write_report(self, user_id: int, name: str, content: str) -> Path:
+        """
+        Write a rendered report of a user to a compressed file.
+        
+        Reports are stored next to exports, so they are listed and
+        downloaded the same way. The file is written under a temporary
+        name and renamed when done.
+        
+        Args:
+            user_id: User ID
+            name: Report name with extension, e.g. ``annual-2025.html``
+            content: Rendered report
+            
+        Returns:
+            Path to the report file
+        """
+        export_dir = Path(settings.EXPORT_DIR)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        path = export_dir / self.file_name(user_id, name, datetime.utcnow())
+        partial = path.with_name(path.name + ".partial")
+        
+        try:
+            with gzip.open(partial, "wt", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        return path
+    
+    def _writer(self, file: TextIO, format: str, columns: List[str]) -> Callable[[Dict[str, Any]], None]:
+        """Get a function writing one record to the file."""
+        if format == "csv":
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            return writer.writerow
+        
+        def write_line(record: Dict[str, Any]) -> None:
+            file.write(json.dumps(record, ensure_ascii=False))
+            file.write("\n")
+        return write_line
+    
+    async def _export_section(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        record_type: str,
+        model: Type[BaseModel],
+        write: Callable[[Dict[str, Any]], None],
+        on_progress: Optional[Callable[[str, int], None]],
+    ) -> None:
+        """Stream rows of one model of a user into the writer."""
+        table = model.__table__
+        stmt = select(table).where(
+            table.c.user_id == user_id,
+            table.c.is_deleted == False
+        ).order_by(table.c.id).execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+        
+        written = 0
+        result = await db.stream(stmt)
+        async for rows in result.partitions():
+            for row in rows:
+                record = {"record_type": record_type}
+                record.update((key, _plain(value)) for key, value in row._mapping.items())
+                write(record)
+            written += len(rows)
+            if on_progress:
+                on_progress(record_type, written)
+
+
+export_service = ExportService()
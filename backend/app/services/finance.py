@@ -1,12 +1,18 @@
 """Finance service."""
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import NotFoundError, AuthorizationError
+from app.core.cache import bump_generation, cache_delete, cache_get, cache_set, get_generation
+from app.core.exceptions import NotFoundError, AuthorizationError, ValidationError
 from app.core.config import settings
-from app.models.finance import DailyEntry, Investment, MonthlyGoal
+from app.core.database import AsyncSessionLocal, after_commit
+from app.models.finance import DailyEntry, ExpenseCategory, Investment, InvestmentType, MonthlyGoal
 from app.repositories.finance import (
+    ENTRY_SEARCH_COLUMNS,
+    INVESTMENT_SEARCH_COLUMNS,
+    INVESTMENT_SORT_KEYS,
+    search_rank,
     daily_entry_repository,
     investment_repository,
     monthly_goal_repository,
@@ -18,8 +24,22 @@ from app.schemas.finance import (
     InvestmentUpdate,
     MonthlyGoalCreate,
     MonthlyGoalUpdate,
+    YearlyGoalUpdate,
     InvestmentSummary,
+    DailyEntryResponse,
 )
+from app.services.portfolio import portfolio_service
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Cache namespace of investment summaries, keyed by generation, user and day
+SUMMARY_CACHE = "investments:summary"
+
+# Cache namespace of investment listing counts, keyed by generation, user,
+# the user's own generation and filters
+COUNT_CACHE = "investments:count"
+
+# Sort key of search cursors, followed by the query they were issued for
+SEARCH_SORT = "relevance"
 
 
 class FinanceService:
@@ -60,15 +80,127 @@ class FinanceService:
         skip: int = 0,
         limit: int = 100,
     ) -> List[DailyEntry]:
-        """Get user's daily entries."""
+        """
+        Get user's daily entries.
+        
+        Date range reads are not paginated, so they are capped at
+        ``ENTRIES_MAX_RESULTS``; wider ranges must be streamed.
+        
+        Raises:
+            ValidationError: If the date range exceeds the cap
+        """
         if start_date and end_date:
-            return await daily_entry_repository.get_by_date_range(
-                db, user_id, start_date, end_date
+            max_results = settings.ENTRIES_MAX_RESULTS
+            entries = await daily_entry_repository.get_by_date_range(
+                db, user_id, start_date, end_date, limit=max_results + 1
             )
+            if len(entries) > max_results:
+                raise ValidationError(
+                    f"Date range contains more than {max_results} entries, "
+                    "request application/x-ndjson to stream it"
+                )
+            return entries
         return await daily_entry_repository.get_multi(
             db, skip=skip, limit=limit, filters={"user_id": user_id}
         )
     
+    async def get_entries_json(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> bytes:
+        """
+        Get user's daily entries in date range as pre-serialized JSON.
+        
+        Capped at ``ENTRIES_MAX_RESULTS`` like ``get_entries``.
+        
+        Raises:
+            ValidationError: If the date range exceeds the cap
+        """
+        max_results = settings.ENTRIES_MAX_RESULTS
+        content, count = await daily_entry_repository.get_by_date_range_json(
+            db, user_id, start_date, end_date, list(DailyEntryResponse.model_fields),
+            limit=max_results + 1,
+        )
+        if count > max_results:
+            raise ValidationError(
+                f"Date range contains more than {max_results} entries, "
+                "request application/x-ndjson to stream it"
+            )
+        return content
+    
+    async def stream_entries_ndjson(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream user's daily entries in date range as NDJSON chunks.
+        
+        Opens its own session because the response body is produced after
+        the request-scoped session has been closed.
+        """
+        async with AsyncSessionLocal() as db:
+            async for chunk in daily_entry_repository.stream_by_date_range(
+                db, user_id, start_date, end_date, settings.ENTRIES_STREAM_CHUNK_SIZE
+            ):
+                yield b"".join(
+                    DailyEntryResponse.model_validate(entry).model_dump_json().encode() + b"\n"
+                    for entry in chunk
+                )
+    
+    async def search_entries(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[ExpenseCategory] = None,
+    ) -> Tuple[List[DailyEntry], Optional[str]]:
+        """
+        Search user's daily entries by description and notes.
+        
+        Entries are matched by trigram word similarity, so typos and
+        partial words still match, and ranked by it.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Search text
+            cursor: Cursor returned with the previous page
+            limit: Page size
+            start_date: Optional first day
+            end_date: Optional last day
+            category: Optional expense category filter
+            
+        Returns:
+            Tuple of (entries, most relevant first, next page cursor or None)
+            
+        Raises:
+            ValidationError: If the query is blank or the cursor is invalid
+        """
+        query = query.strip()
+        if not query:
+            raise ValidationError("Search query must not be blank")
+        sort = f"{SEARCH_SORT}:{query}"
+        rank = search_rank(query, ENTRY_SEARCH_COLUMNS)
+        after = decode_cursor(cursor, sort, rank) if cursor else None
+        
+        rows, has_more = await daily_entry_repository.search(
+            db, user_id, query, after, limit, start_date, end_date, category
+        )
+        next_cursor = None
+        if has_more:
+            last, score = rows[-1]
+            next_cursor = encode_cursor(sort, score, last.id)
+        return [entry for entry, _ in rows], next_cursor
+    
     async def update_entry(
         self,
         db: AsyncSession,
@@ -101,7 +233,9 @@ class FinanceService:
         """Create investment."""
         investment_data = investment_create.model_dump()
         investment_data["user_id"] = user_id
-        return await investment_repository.create(db, investment_data)
+        investment = await investment_repository.create(db, investment_data)
+        await self.invalidate_investment_caches(user_id, db)
+        return investment
     
     async def get_investment(
         self,
@@ -117,22 +251,193 @@ class FinanceService:
             raise AuthorizationError("Not authorized to access this investment")
         return investment
     
-    async def get_investments(
+    async def get_investment_page(
         self,
         db: AsyncSession,
         user_id: int,
-    ) -> List[Investment]:
-        """Get user's investments."""
-        return await investment_repository.get_by_user(db, user_id)
+        sort: str = "-purchase_date",
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Investment], int, Optional[str]]:
+        """
+        Get one page of user's investments.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            sort: Sort key, prefixed with ``-`` for descending order
+            cursor: Cursor returned with the previous page
+            limit: Page size
+            investment_type: Optional type filter
+            start_date: Optional first purchase date
+            end_date: Optional last purchase date
+            
+        Returns:
+            Tuple of (investments, total matching count, next page cursor or None)
+            
+        Raises:
+            ValidationError: If the sort key or cursor is invalid
+        """
+        descending = sort.startswith("-")
+        key = sort.lstrip("-")
+        if key not in INVESTMENT_SORT_KEYS:
+            raise ValidationError(
+                f"Invalid sort key, expected one of: {', '.join(INVESTMENT_SORT_KEYS)}"
+            )
+        after = decode_cursor(cursor, sort, INVESTMENT_SORT_KEYS[key]) if cursor else None
+        
+        filters = {
+            "investment_type": investment_type,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        investments, has_more = await investment_repository.get_page(
+            db, user_id, key, descending, after, limit, **filters
+        )
+        total = await self.count_investments(db, user_id, **filters)
+        
+        next_cursor = None
+        if has_more:
+            last = investments[-1]
+            next_cursor = encode_cursor(sort, getattr(last, key), last.id)
+        return investments, total, next_cursor
+    
+    async def count_investments(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """
+        Count user's investments matching listing filters.
+        
+        Counts are cached per filter combination and dropped together by
+        bumping the user's count generation on investment writes.
+        """
+        key = ":".join([
+            COUNT_CACHE,
+            str(await get_generation(COUNT_CACHE)),
+            str(user_id),
+            str(await get_generation(f"{COUNT_CACHE}:{user_id}")),
+            investment_type.value if investment_type else "",
+            start_date.isoformat() if start_date else "",
+            end_date.isoformat() if end_date else "",
+        ])
+        cached = await cache_get(key)
+        if cached is not None:
+            return cached
+        
+        count = await investment_repository.count_by_user(
+            db, user_id, investment_type, start_date, end_date
+        )
+        await cache_set(key, count, settings.INVESTMENT_COUNT_CACHE_TTL)
+        return count
+    
+    async def search_investments(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        investment_type: Optional[InvestmentType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[List[Investment], Optional[str]]:
+        """
+        Search user's investments by name and notes.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Search text
+            cursor: Cursor returned with the previous page
+            limit: Page size
+            investment_type: Optional type filter
+            start_date: Optional first purchase date
+            end_date: Optional last purchase date
+            
+        Returns:
+            Tuple of (investments, most relevant first, next page cursor or None)
+            
+        Raises:
+            ValidationError: If the query is blank or the cursor is invalid
+        """
+        query = query.strip()
+        if not query:
+            raise ValidationError("Search query must not be blank")
+        sort = f"{SEARCH_SORT}:{query}"
+        rank = search_rank(query, INVESTMENT_SEARCH_COLUMNS)
+        after = decode_cursor(cursor, sort, rank) if cursor else None
+        
+        rows, has_more = await investment_repository.search(
+            db, user_id, query, after, limit, investment_type, start_date, end_date
+        )
+        next_cursor = None
+        if has_more:
+            last, score = rows[-1]
+            next_cursor = encode_cursor(sort, score, last.id)
+        return [investment for investment, _ in rows], next_cursor
+    
+    async def _summary_cache_key(self, user_id: int) -> str:
+        """Cache key of a user's investment summary of today."""
+        generation = await get_generation(SUMMARY_CACHE)
+        return f"{SUMMARY_CACHE}:{generation}:{user_id}:{date.today().isoformat()}"
+    
+    async def invalidate_investment_caches(
+        self,
+        user_id: Optional[int] = None,
+        db: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        Invalidate cached investment summaries, counts and portfolio history.
+        
+        Args:
+            user_id: User whose investments changed, every user if None
+            db: Session of the write, invalidates again once it commits
+        """
+        if db is not None:
+            after_commit(db, lambda: self.invalidate_investment_caches(user_id))
+        if user_id is None:
+            await bump_generation(SUMMARY_CACHE)
+            await bump_generation(COUNT_CACHE)
+            await portfolio_service.invalidate_all_history()
+            return
+        await cache_delete(await self._summary_cache_key(user_id))
+        await bump_generation(f"{COUNT_CACHE}:{user_id}")
+        await portfolio_service.invalidate_history(user_id)
     
     async def get_investment_summary(
         self,
         db: AsyncSession,
         user_id: int,
     ) -> List[InvestmentSummary]:
-        """Get investment summary by type."""
-        summary_data = await investment_repository.get_summary_by_type(db, user_id)
-        return [InvestmentSummary(**item) for item in summary_data]
+        """
+        Get investment summary by type.
+        
+        Summaries are cached for the day and invalidated by investment
+        writes and revaluations.
+        """
+        key = await self._summary_cache_key(user_id)
+        cached = await cache_get(key)
+        if cached is not None:
+            return [InvestmentSummary(**item) for item in cached]
+        
+        summary = [
+            InvestmentSummary(**item)
+            for item in await investment_repository.get_summary_by_type(db, user_id)
+        ]
+        await cache_set(
+            key,
+            [item.model_dump(mode="json") for item in summary],
+            settings.INVESTMENT_SUMMARY_CACHE_TTL,
+        )
+        return summary
     
     async def update_investment(
         self,
@@ -144,7 +449,9 @@ class FinanceService:
         """Update investment."""
         investment = await self.get_investment(db, investment_id, user_id)
         update_data = investment_update.model_dump(exclude_unset=True)
-        return await investment_repository.update(db, investment, update_data)
+        investment = await investment_repository.update(db, investment, update_data)
+        await self.invalidate_investment_caches(user_id, db)
+        return investment
     
     async def delete_investment(
         self,
@@ -154,9 +461,20 @@ class FinanceService:
     ) -> bool:
         """Delete investment."""
         investment = await self.get_investment(db, investment_id, user_id)
-        return await investment_repository.delete(db, investment_id)
+        deleted = await investment_repository.delete(db, investment_id)
+        await self.invalidate_investment_caches(user_id, db)
+        return deleted
     
     # Monthly Goals
+    def _default_goal_values(self) -> dict:
+        """Get default monthly goal values."""
+        return {
+            "income_goal": settings.DEFAULT_MONTHLY_INCOME_GOAL,
+            "gold_goal": settings.DEFAULT_MONTHLY_GOLD_GOAL,
+            "silver_goal": settings.DEFAULT_MONTHLY_SILVER_GOAL,
+            "investment_goal": settings.DEFAULT_MONTHLY_INVESTMENT_GOAL,
+        }
+    
     async def get_or_create_monthly_goal(
         self,
         db: AsyncSession,
@@ -168,17 +486,13 @@ class FinanceService:
         goal = await monthly_goal_repository.get_by_month(db, user_id, year, month)
         
         if not goal:
-            # Create with default values
-            goal_data = {
-                "user_id": user_id,
-                "year": year,
-                "month": month,
-                "income_goal": settings.DEFAULT_MONTHLY_INCOME_GOAL,
-                "gold_goal": settings.DEFAULT_MONTHLY_GOLD_GOAL,
-                "silver_goal": settings.DEFAULT_MONTHLY_SILVER_GOAL,
-                "investment_goal": settings.DEFAULT_MONTHLY_INVESTMENT_GOAL,
-            }
-            goal = await monthly_goal_repository.create(db, goal_data)
+            goal = await monthly_goal_repository.create_if_missing(
+                db, user_id, year, month, self._default_goal_values()
+            )
+        
+        if not goal:
+            # Created concurrently by another request, the insert waited for it
+            goal = await monthly_goal_repository.get_by_month(db, user_id, year, month)
         
         return goal
     
@@ -190,19 +504,51 @@ class FinanceService:
         month: int,
         goal_update: MonthlyGoalUpdate,
     ) -> MonthlyGoal:
-        """Update monthly goal."""
-        goal = await self.get_or_create_monthly_goal(db, user_id, year, month)
-        update_data = goal_update.model_dump(exclude_unset=True)
-        return await monthly_goal_repository.update(db, goal, update_data)
+        """Update monthly goal, creating it with defaults if needed."""
+        update_data = {
+            field: value
+            for field, value in goal_update.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        return await monthly_goal_repository.upsert(
+            db, user_id, year, month, self._default_goal_values(), update_data
+        )
     
     async def get_yearly_goals(
         self,
         db: AsyncSession,
         user_id: int,
         year: int,
+        materialize: bool = False,
     ) -> List[MonthlyGoal]:
-        """Get all goals for a year."""
+        """
+        Get all goals for a year.
+        
+        With ``materialize`` every missing month is first created with
+        default values in a single multi-row insert.
+        """
+        if materialize:
+            await monthly_goal_repository.create_missing(
+                db, user_id, year, range(1, 13), self._default_goal_values()
+            )
         return await monthly_goal_repository.get_by_year(db, user_id, year)
+    
+    async def update_yearly_goals(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        year: int,
+        goal_template: YearlyGoalUpdate,
+    ) -> List[MonthlyGoal]:
+        """Apply one goal template to selected months of a year in one statement."""
+        update_data = {
+            field: value
+            for field, value in goal_template.model_dump(exclude_unset=True, exclude={"months"}).items()
+            if value is not None
+        }
+        return await monthly_goal_repository.upsert_many(
+            db, user_id, year, goal_template.months, self._default_goal_values(), update_data
+        )
 
 
 finance_service = FinanceService()
@@ -0,0 +1,202 @@
+"""Background job service."""
+import asyncio
+import uuid
+from typing import AsyncIterator, Dict, Tuple, Type
+from datetime import datetime
+from celery.result import AsyncResult
+from pydantic import ValidationError as PydanticValidationError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, RateLimitError, ValidationError
+from app.core.redis import RedisClient
+from app.schemas.base import BaseSchema
+from app.schemas.job import AnnualReportJobParams, ExportJobParams, ImportJobParams, JobResponse
+
+
+# Job kinds with their task name and parameter schema; tasks take the user ID first
+JOB_KINDS: Dict[str, Tuple[str, Type[BaseSchema]]] = {
+    "export": ("app.tasks.report_tasks.export_user_data", ExportJobParams),
+    "annual_report": ("app.tasks.report_tasks.generate_annual_report", AnnualReportJobParams),
+    "import": ("app.tasks.data_tasks.import_entries", ImportJobParams),
+}
+
+# Celery states grouped into job statuses
+JOB_STATUSES = {
+    "PENDING": "queued",
+    "RECEIVED": "queued",
+    "STARTED": "running",
+    "PROGRESS": "running",
+    "RETRY": "running",
+    "SUCCESS": "succeeded",
+    "FAILURE": "failed",
+    "REVOKED": "failed",
+}
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+
+class JobService:
+    """
+    Background job service.
+    
+    Jobs are Celery tasks whose state lives in ``CELERY_RESULT_BACKEND``.
+    Redis additionally keeps the owner and kind of every job and the set of
+    unfinished jobs per user, which enforces
+    ``JOBS_MAX_CONCURRENT_PER_USER``.
+    """
+    
+    def _job_key(self, job_id: str) -> str:
+        return f"jobs:{job_id}"
+    
+    def _active_key(self, user_id: int) -> str:
+        return f"jobs:user:{user_id}:active"
+    
+    async def submit(self, user_id: int, kind: str, params: dict) -> JobResponse:
+        """
+        Submit a job.
+        
+        Args:
+            user_id: User ID
+            kind: Job kind
+            params: Job parameters
+            
+        Returns:
+            Queued job
+            
+        Raises:
+            NotFoundError: If the job kind is unknown
+            ValidationError: If the parameters are invalid
+            RateLimitError: If the user already runs the maximum number of jobs
+        """
+        if kind not in JOB_KINDS:
+            raise NotFoundError(f"Unknown job kind: {kind}")
+        task_name, params_schema = JOB_KINDS[kind]
+        try:
+            job_params = params_schema(**params).model_dump()
+        except PydanticValidationError as e:
+            raise ValidationError(f"Invalid job parameters: {e.errors()}")
+        
+        redis = await RedisClient.get_client()
+        active_key = self._active_key(user_id)
+        for active_id in await redis.smembers(active_key):
+            # Jobs whose record expired or whose result is gone count as finished
+            if (
+                not await redis.exists(self._job_key(active_id))
+                or await self._status(active_id) in FINISHED_STATUSES
+            ):
+                await redis.srem(active_key, active_id)
+        
+        # The job record is written before its slot is claimed, so cleanup in
+        # concurrent submits never mistakes the claim for an expired job
+        job_id = str(uuid.uuid4())
+        created_at = datetime.utcnow()
+        await redis.hset(
+            self._job_key(job_id),
+            mapping={"user_id": user_id, "kind": kind, "created_at": created_at.isoformat()},
+        )
+        await redis.expire(self._job_key(job_id), settings.JOBS_RESULT_EXPIRES)
+        
+        # Claim a slot before checking the limit, so concurrent submits
+        # cannot all pass the check; a claim over the limit is undone
+        pipe = redis.pipeline()
+        pipe.sadd(active_key, job_id)
+        pipe.scard(active_key)
+        _, active = await pipe.execute()
+        if active > settings.JOBS_MAX_CONCURRENT_PER_USER:
+            await redis.srem(active_key, job_id)
+            await redis.delete(self._job_key(job_id))
+            raise RateLimitError("Too many running jobs, wait for one to finish")
+        await redis.expire(active_key, settings.JOBS_RESULT_EXPIRES)
+        
+        try:
+            await run_in_threadpool(
+                celery_app.send_task, task_name, args=[user_id], kwargs=job_params, task_id=job_id
+            )
+        except Exception:
+            await redis.srem(active_key, job_id)
+            await redis.delete(self._job_key(job_id))
+            raise
+        return JobResponse(id=job_id, kind=kind, status="queued", created_at=created_at)
+    
+    async def _status(self, job_id: str) -> str:
+        """Get job status from the result backend."""
+        state = await run_in_threadpool(lambda: AsyncResult(job_id, app=celery_app).state)
+        return JOB_STATUSES.get(state, "running")
+    
+    async def get(self, user_id: int, job_id: str) -> JobResponse:
+        """
+        Get job status and progress.
+        
+        Args:
+            user_id: User ID
+            job_id: Job ID
+            
+        Returns:
+            Job
+            
+        Raises:
+            NotFoundError: If the job does not exist, expired or belongs to another user
+        """
+        redis = await RedisClient.get_client()
+        job = await redis.hgetall(self._job_key(job_id))
+        if not job or int(job["user_id"]) != user_id:
+            raise NotFoundError("Job not found")
+        
+        def read_result() -> Tuple[str, object]:
+            result = AsyncResult(job_id, app=celery_app)
+            return result.state, result.info
+        
+        state, info = await run_in_threadpool(read_result)
+        response = JobResponse(
+            id=job_id,
+            kind=job["kind"],
+            status=JOB_STATUSES.get(state, "running"),
+            created_at=datetime.fromisoformat(job["created_at"]),
+        )
+        if state == "PROGRESS" and isinstance(info, dict):
+            response.progress = info
+        elif state == "SUCCESS" and isinstance(info, dict):
+            response.result = info
+        elif state == "FAILURE":
+            response.error = str(info)
+        return response
+    
+    async def stream_events(self, user_id: int, job_id: str) -> AsyncIterator[bytes]:
+        """
+        Stream job updates as server-sent events.
+        
+        A ``progress`` event is sent whenever the job changes and a final
+        ``done`` event once it finished; the stream ends after
+        ``JOBS_EVENTS_TIMEOUT`` seconds at the latest, or without a ``done``
+        event if the job expires meanwhile.
+        
+        Args:
+            user_id: User ID
+            job_id: Job ID
+            
+        Yields:
+            Encoded server-sent events
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.JOBS_EVENTS_TIMEOUT
+        last = None
+        while True:
+            try:
+                job = await self.get(user_id, job_id)
+            except NotFoundError:
+                # The job record expired, headers were sent already
+                return
+            finished = job.status in FINISHED_STATUSES
+            data = job.model_dump_json()
+            if data != last:
+                event = "done" if finished else "progress"
+                yield f"event: {event}\ndata: {data}\n\n".encode()
+                last = data
+            if finished or loop.time() >= deadline:
+                return
+            await asyncio.sleep(settings.JOBS_EVENTS_POLL_INTERVAL)
+
+
+job_service = JobService()
@@ -1,12 +1,34 @@
 """Notification service."""
-from typing import List
-from sqlalchemy import select, and_, func
+import json
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import date, datetime, timedelta
+from sqlalchemy import select, insert, and_, or_, func, case, cast, literal, ColumnElement, Float, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import bump_generation, cache_delete, cache_get, cache_set, get_generation
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.redis import RedisClient
+from app.models.finance import DailyEntry, Investment, MonthlyGoal
 from app.models.notification import Notification
+from app.models.user import User
 from app.core.exceptions import NotFoundError, AuthorizationError
 
 
+GOAL_REMINDER_TITLE = "Monthly goal reminder"
+
+# Cache namespace of unread counts, keyed by generation and user
+UNREAD_COUNT_CACHE = "notifications:unread"
+
+# Set of ``<day>:<user_id>`` digest buffers with pending notifications
+DIGEST_PENDING_KEY = "notifications:digest:pending"
+
+
+def _digest_keys(buffer_id: str) -> tuple[str, str]:
+    """Redis hashes of a digest buffer, holding counts and latest payloads."""
+    return f"notifications:digest:{buffer_id}:counts", f"notifications:digest:{buffer_id}:payloads"
+
+
 class NotificationService:
     """Notification service."""
     
@@ -28,8 +50,346 @@ class NotificationService:
         db.add(notification)
         await db.flush()
         await db.refresh(notification)
+        await self.invalidate_unread_counts([user_id], db)
         return notification
     
+    async def create_notifications(self, db: AsyncSession, notifications: List[Dict]) -> int:
+        """
+        Create many notifications with one bulk insert.
+        
+        Args:
+            db: Database session
+            notifications: Notification column values
+            
+        Returns:
+            Number of notifications created
+        """
+        if not notifications:
+            return 0
+        now = datetime.utcnow()
+        rows = [
+            {
+                "notification_type": "info",
+                "count": 1,
+                "is_read": False,
+                "is_deleted": False,
+                "created_at": now,
+                "updated_at": now,
+                **notification,
+            }
+            for notification in notifications
+        ]
+        await db.execute(insert(Notification), rows)
+        await self.invalidate_unread_counts({row["user_id"] for row in rows}, db)
+        return len(rows)
+    
+    async def create_notifications_bulk(
+        self,
+        db: AsyncSession,
+        title: str,
+        message: str,
+        notification_type: str = "info",
+        user_ids: Optional[Sequence[int]] = None,
+    ) -> int:
+        """
+        Send one notification to many users with a single statement.
+        
+        Rows are produced by ``INSERT ... SELECT`` over active users, so an
+        announcement to every user costs one round trip.
+        
+        Args:
+            db: Database session
+            title: Notification title
+            message: Notification message
+            notification_type: Type of notification
+            user_ids: Recipients, all active users if None
+            
+        Returns:
+            Number of notifications created
+        """
+        now = datetime.utcnow()
+        recipients = select(
+            User.id,
+            literal(title),
+            literal(message),
+            literal(notification_type),
+            literal(False),
+            literal(False),
+            literal(now),
+            literal(now),
+        ).where(
+            and_(
+                User.is_active == True,
+                User.is_deleted == False
+            )
+        )
+        if user_ids is not None:
+            if not user_ids:
+                return 0
+            recipients = recipients.where(User.id.in_(user_ids))
+        
+        stmt = insert(Notification).from_select(
+            [
+                Notification.user_id,
+                Notification.title,
+                Notification.message,
+                Notification.notification_type,
+                Notification.is_read,
+                Notification.is_deleted,
+                Notification.created_at,
+                Notification.updated_at,
+            ],
+            recipients,
+        )
+        result = await db.execute(stmt)
+        await self.invalidate_unread_counts(user_ids, db)
+        return result.rowcount
+    
+    def queue_notification(
+        self,
+        user_id: int,
+        title: str,
+        message: str,
+        notification_type: str = "info",
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        Buffer a notification for the next digest flush.
+        
+        Notifications of a user with the same type and title within one
+        ``NOTIFICATION_DIGEST_WINDOW`` are merged into a single row carrying
+        their count and the latest message. Buffers live in Redis per user
+        and day; uses the synchronous client, so call from tasks only.
+        
+        Args:
+            user_id: User ID
+            title: Notification title
+            message: Notification message
+            notification_type: Type of notification
+            now: Time of the notification, defaults to now
+        """
+        now = now or datetime.utcnow()
+        window = int(now.timestamp()) // settings.NOTIFICATION_DIGEST_WINDOW
+        buffer_id = f"{now.date().isoformat()}:{user_id}"
+        counts_key, payloads_key = _digest_keys(buffer_id)
+        field = json.dumps([window, notification_type, title])
+        
+        pipe = RedisClient.get_sync_client().pipeline()
+        pipe.hincrby(counts_key, field, 1)
+        pipe.hset(payloads_key, field, json.dumps({"message": message, "at": now.isoformat()}))
+        pipe.expire(counts_key, settings.NOTIFICATION_DIGEST_TTL)
+        pipe.expire(payloads_key, settings.NOTIFICATION_DIGEST_TTL)
+        pipe.sadd(DIGEST_PENDING_KEY, buffer_id)
+        pipe.execute()
+    
+    async def flush_digests(self, db: AsyncSession, now: Optional[datetime] = None) -> int:
+        """
+        Write buffered notifications of closed digest windows.
+        
+        Digests are inserted in batches of ``NOTIFICATION_DIGEST_BATCH_SIZE``
+        and removed from Redis once their batch is committed, so a failed
+        flush is retried by the next one.
+        
+        Args:
+            db: Database session
+            now: Windows ending before this time are flushed, defaults to now
+            
+        Returns:
+            Number of digest rows created
+        """
+        now = now or datetime.utcnow()
+        open_window = int(now.timestamp()) // settings.NOTIFICATION_DIGEST_WINDOW
+        redis = RedisClient.get_sync_client()
+        
+        created = 0
+        rows: List[Dict] = []
+        flushed: List[tuple[str, str]] = []
+        
+        async def write() -> None:
+            nonlocal created
+            created += await self.create_notifications(db, rows)
+            await db.commit()
+            pipe = redis.pipeline()
+            for buffer_id, field in flushed:
+                counts_key, payloads_key = _digest_keys(buffer_id)
+                pipe.hdel(counts_key, field)
+                pipe.hdel(payloads_key, field)
+            pipe.execute()
+            rows.clear()
+            flushed.clear()
+        
+        for buffer_id in redis.sscan_iter(DIGEST_PENDING_KEY):
+            counts_key, payloads_key = _digest_keys(buffer_id)
+            counts = redis.hgetall(counts_key)
+            payloads = redis.hgetall(payloads_key)
+            day, _, user_id = buffer_id.partition(":")
+            if not counts:
+                if day < now.date().isoformat():
+                    redis.srem(DIGEST_PENDING_KEY, buffer_id)
+                continue
+            
+            for field, count in counts.items():
+                window, notification_type, title = json.loads(field)
+                if window >= open_window or field not in payloads:
+                    continue
+                payload = json.loads(payloads[field])
+                created_at = datetime.fromisoformat(payload["at"])
+                rows.append({
+                    "user_id": int(user_id),
+                    "title": title,
+                    "message": payload["message"],
+                    "notification_type": notification_type,
+                    "count": int(count),
+                    # Written now, so updated_at is left to the insert for delta syncs
+                    "created_at": created_at,
+                })
+                flushed.append((buffer_id, field))
+                if len(rows) >= settings.NOTIFICATION_DIGEST_BATCH_SIZE:
+                    await write()
+        
+        if rows:
+            await write()
+        return created
+    
+    async def create_goal_reminders(
+        self,
+        db: AsyncSession,
+        today: date,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> int:
+        """
+        Create reminders for all users behind on their current month goals.
+        
+        Progress is compared against the elapsed share of the month scaled by
+        ``GOAL_REMINDER_TOLERANCE``. Entry totals, the amount invested during
+        the month, goals (or the defaults when a month has none) and the
+        reminder rows are all handled by a single ``INSERT ... SELECT``
+        statement, whatever the number of users.
+        
+        Args:
+            db: Database session
+            today: Day the reminders are computed for
+            shard: Only handle users with ``id % shards == shard``
+            shards: Number of shards
+            
+        Returns:
+            Number of reminders created
+        """
+        if today.day < settings.GOAL_REMINDER_START_DAY:
+            return 0
+        
+        month_start = today.replace(day=1)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        expected = today.day / (next_month - month_start).days * settings.GOAL_REMINDER_TOLERANCE
+        now = datetime.utcnow()
+        
+        totals = select(
+            DailyEntry.user_id,
+            func.sum(DailyEntry.income).label("income"),
+            func.sum(DailyEntry.gold_grams).label("gold"),
+            func.sum(DailyEntry.silver_grams).label("silver"),
+        ).where(
+            and_(
+                DailyEntry.date >= month_start,
+                DailyEntry.date < next_month,
+                DailyEntry.is_deleted == False
+            )
+        ).group_by(DailyEntry.user_id).subquery("totals")
+        
+        invested = select(
+            Investment.user_id,
+            func.sum(Investment.amount).label("amount"),
+        ).where(
+            and_(
+                Investment.purchase_date >= month_start,
+                Investment.purchase_date < next_month,
+                Investment.is_deleted == False
+            )
+        ).group_by(Investment.user_id).subquery("invested")
+        
+        def progress(total: Any, goal: Any, default: float) -> ColumnElement[float]:
+            goal = func.coalesce(goal, default)
+            return case(
+                (goal > 0, func.coalesce(total, 0) / cast(goal, Float)),
+                else_=literal(1.0),
+            )
+        
+        def percent(value: ColumnElement[float]) -> ColumnElement[int]:
+            return cast(func.round(value * 100), Integer)
+        
+        income = progress(totals.c.income, MonthlyGoal.income_goal, settings.DEFAULT_MONTHLY_INCOME_GOAL)
+        gold = progress(totals.c.gold, MonthlyGoal.gold_goal, settings.DEFAULT_MONTHLY_GOLD_GOAL)
+        silver = progress(totals.c.silver, MonthlyGoal.silver_goal, settings.DEFAULT_MONTHLY_SILVER_GOAL)
+        investment = progress(
+            invested.c.amount, MonthlyGoal.investment_goal, settings.DEFAULT_MONTHLY_INVESTMENT_GOAL
+        )
+        
+        recently_reminded = select(Notification.id).where(
+            and_(
+                Notification.user_id == User.id,
+                Notification.title == GOAL_REMINDER_TITLE,
+                Notification.created_at >= now - timedelta(days=settings.GOAL_REMINDER_INTERVAL_DAYS),
+            )
+        ).exists()
+        
+        reminders = select(
+            User.id,
+            literal(GOAL_REMINDER_TITLE),
+            func.format(
+                "You have reached %s%% of your income, %s%% of your gold, %s%% of "
+                "your silver and %s%% of your investment goal with %s%% of the "
+                "month elapsed.",
+                percent(income),
+                percent(gold),
+                percent(silver),
+                percent(investment),
+                round(today.day / (next_month - month_start).days * 100),
+            ),
+            literal("warning"),
+            literal(False),
+            literal(False),
+            literal(now),
+            literal(now),
+        ).select_from(User).outerjoin(
+            totals, totals.c.user_id == User.id
+        ).outerjoin(
+            invested, invested.c.user_id == User.id
+        ).outerjoin(
+            MonthlyGoal,
+            and_(
+                MonthlyGoal.user_id == User.id,
+                MonthlyGoal.year == today.year,
+                MonthlyGoal.month == today.month,
+                MonthlyGoal.is_deleted == False
+            )
+        ).where(
+            and_(
+                User.is_active == True,
+                User.is_deleted == False,
+                User.id % shards == shard,
+                or_(income < expected, gold < expected, silver < expected, investment < expected),
+                ~recently_reminded,
+            )
+        )
+        
+        stmt = insert(Notification).from_select(
+            [
+                Notification.user_id,
+                Notification.title,
+                Notification.message,
+                Notification.notification_type,
+                Notification.is_read,
+                Notification.is_deleted,
+                Notification.created_at,
+                Notification.updated_at,
+            ],
+            reminders,
+        )
+        result = await db.execute(stmt)
+        await self.invalidate_unread_counts(db=db)
+        return result.rowcount
+    
     async def get_notifications(
         self,
         db: AsyncSession,
@@ -53,8 +413,44 @@ class NotificationService:
         result = await db.execute(stmt)
         return list(result.scalars().all())
     
+    async def _unread_count_key(self, user_id: int) -> str:
+        """Cache key of a user's unread count."""
+        generation = await get_generation(UNREAD_COUNT_CACHE)
+        return f"{UNREAD_COUNT_CACHE}:{generation}:{user_id}"
+    
+    async def invalidate_unread_counts(
+        self,
+        user_ids: Optional[Sequence[int]] = None,
+        db: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        Invalidate cached unread counts.
+        
+        Args:
+            user_ids: Users whose counts changed, every user if None
+            db: Session of the write, invalidates again once it commits so
+                counts read before the commit are not kept cached
+        """
+        if db is not None:
+            user_ids = None if user_ids is None else list(user_ids)
+            after_commit(db, lambda: self.invalidate_unread_counts(user_ids))
+        if user_ids is None:
+            await bump_generation(UNREAD_COUNT_CACHE)
+            return
+        await cache_delete(*[await self._unread_count_key(user_id) for user_id in user_ids])
+    
     async def get_unread_count(self, db: AsyncSession, user_id: int) -> int:
-        """Get count of unread notifications."""
+        """
+        Get count of unread notifications.
+        
+        Counts are cached for ``NOTIFICATION_UNREAD_CACHE_TTL`` seconds and
+        invalidated by every write affecting them.
+        """
+        key = await self._unread_count_key(user_id)
+        cached = await cache_get(key)
+        if cached is not None:
+            return cached
+        
         stmt = select(func.count(Notification.id)).where(
             and_(
                 Notification.user_id == user_id,
@@ -63,7 +459,9 @@ class NotificationService:
             )
         )
         result = await db.execute(stmt)
-        return result.scalar() or 0
+        count = result.scalar() or 0
+        await cache_set(key, count, settings.NOTIFICATION_UNREAD_CACHE_TTL)
+        return count
     
     async def mark_as_read(
         self,
@@ -85,6 +483,7 @@ class NotificationService:
         notification.is_read = True
         await db.flush()
         await db.refresh(notification)
+        await self.invalidate_unread_counts([user_id], db)
         return notification
     
     async def mark_all_as_read(self, db: AsyncSession, user_id: int) -> int:
@@ -105,6 +504,7 @@ class NotificationService:
             count += 1
         
         await db.flush()
+        await self.invalidate_unread_counts([user_id], db)
         return count
     
     async def delete_notification(
@@ -126,6 +526,7 @@ class NotificationService:
         
         notification.is_deleted = True
         await db.flush()
+        await self.invalidate_unread_counts([user_id], db)
         return True
 
 
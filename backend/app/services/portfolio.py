@@ -0,0 +1,180 @@
+"""Portfolio valuation service."""
+from typing import Dict, List, Tuple
+from datetime import date, timedelta
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import bump_generation, cache_delete, cache_get, cache_set, get_generation
+from app.core.config import settings
+from app.repositories.finance import investment_repository, market_price_repository
+from app.schemas.finance import PortfolioHistoryPoint
+
+# Cache namespace of daily portfolio series, keyed by generation, user and day
+HISTORY_CACHE = "portfolio:history"
+
+
+class PortfolioService:
+    """Portfolio valuation service."""
+    
+    async def _cache_key(self, user_id: int, today: date) -> str:
+        """Cache key of a user's daily series computed on a day."""
+        generation = await get_generation(HISTORY_CACHE)
+        return f"{HISTORY_CACHE}:{generation}:{user_id}:{today.isoformat()}"
+    
+    async def invalidate_history(self, user_id: int) -> None:
+        """Drop the cached daily series of a user after investment writes."""
+        await cache_delete(await self._cache_key(user_id, date.today()))
+    
+    async def invalidate_all_history(self) -> None:
+        """Drop cached daily series of every user after price updates."""
+        await bump_generation(HISTORY_CACHE)
+    
+    async def _build_daily_series(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        today: date,
+    ) -> Tuple[date, np.ndarray, np.ndarray]:
+        """
+        Value a user's portfolio on every day from the first purchase to today.
+        
+        Holdings and prices are laid out as dense day x instrument matrices:
+        holdings are cumulative sums of purchased quantities, prices are
+        stored prices carried forward. Days without any known price are
+        valued at the average purchase price, and investments without a
+        market instrument at their purchase amount.
+        
+        Returns:
+            Tuple of (first day, daily values, daily invested amounts)
+        """
+        positions = await investment_repository.get_positions(db, user_id)
+        positions = [p for p in positions if p[1] <= today]
+        if not positions:
+            return today, np.zeros(1), np.zeros(1)
+        
+        start = positions[0][1]
+        days = (today - start).days + 1
+        
+        # Investments without a market price get a column of their own each,
+        # holding their amount as quantity at a constant price of 1
+        columns: Dict[str, int] = {}
+        rows, cols, quantities, amounts = [], [], [], []
+        for index, (instrument, purchase_date, quantity, amount) in enumerate(positions):
+            if instrument is None or quantity is None:
+                instrument, quantity = f"#{index}", amount
+            rows.append((purchase_date - start).days)
+            cols.append(columns.setdefault(instrument, len(columns)))
+            quantities.append(quantity)
+            amounts.append(amount)
+        
+        holdings = np.zeros((days, len(columns)))
+        np.add.at(holdings, (rows, cols), quantities)
+        holdings = np.cumsum(holdings, axis=0)
+        
+        invested = np.zeros((days, len(columns)))
+        np.add.at(invested, (rows, cols), amounts)
+        invested = np.cumsum(invested, axis=0)
+        
+        prices = np.full((days, len(columns)), np.nan)
+        history = await market_price_repository.get_price_history(
+            db, [c for c in columns if not c.startswith("#")], start, today
+        )
+        for instrument, day, price in history:
+            prices[max((day - start).days, 0), columns[instrument]] = price
+        
+        # Carry the last known price forward: index of the latest filled row per cell
+        filled = np.where(np.isnan(prices), 0, np.arange(days)[:, None])
+        np.maximum.accumulate(filled, axis=0, out=filled)
+        prices = prices[filled, np.arange(len(columns))]
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            average_cost = np.where(holdings > 0, invested / holdings, 0.0)
+        prices = np.where(np.isnan(prices), average_cost, prices)
+        
+        values = np.einsum("di,di->d", holdings, prices)
+        return start, values, invested.sum(axis=1)
+    
+    async def get_daily_series(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        today: date,
+    ) -> Tuple[date, List[float], List[float]]:
+        """
+        Get a user's daily value series, from cache when computed already today.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            today: Last day of the series
+            
+        Returns:
+            Tuple of (first day, daily values, daily invested amounts)
+        """
+        key = await self._cache_key(user_id, today)
+        cached = await cache_get(key)
+        if cached is not None:
+            return date.fromisoformat(cached["start"]), cached["values"], cached["invested"]
+        
+        start, values, invested = await self._build_daily_series(db, user_id, today)
+        series = {
+            "start": start.isoformat(),
+            "values": np.round(values, 2).tolist(),
+            "invested": np.round(invested, 2).tolist(),
+        }
+        await cache_set(key, series, settings.PORTFOLIO_HISTORY_CACHE_TTL)
+        return start, series["values"], series["invested"]
+    
+    async def get_history(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        step: str = "day",
+    ) -> List[PortfolioHistoryPoint]:
+        """
+        Get portfolio value over time.
+        
+        The full daily series of a user is computed once a day and cached;
+        requests only slice and sample it.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            start_date: First day, days before the first purchase are skipped
+            end_date: Last day, not after today
+            step: Sampling, ``day``, ``week`` or ``month``; weeks and months
+                are represented by their last day within the range
+                
+        Returns:
+            Portfolio value per sampled day
+        """
+        today = date.today()
+        end_date = min(end_date, today)
+        if start_date > end_date:
+            return []
+        
+        first, values, invested = await self.get_daily_series(db, user_id, today)
+        # The portfolio is empty before its series starts
+        start_date = max(start_date, first)
+        if start_date > end_date:
+            return []
+        
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if step == "week":
+            days = [d for d in days if d.weekday() == 6 or d == end_date]
+        elif step == "month":
+            days = [d for d in days if (d + timedelta(days=1)).day == 1 or d == end_date]
+        
+        return [
+            PortfolioHistoryPoint(
+                date=day,
+                value=values[(day - first).days],
+                invested=invested[(day - first).days],
+            )
+            for day in days
+        ]
+
+
+portfolio_service = PortfolioService()
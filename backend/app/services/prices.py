@@ -0,0 +1,186 @@
+"""Market prices and investment revaluation service."""
+import csv
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.repositories.finance import investment_repository, market_price_repository
+from app.services.finance import finance_service
+
+
+class PriceProvider(ABC):
+    """Source of market prices."""
+    
+    name: str = "provider"
+    
+    @abstractmethod
+    async def get_prices(self, instruments: Sequence[str], day: date) -> Dict[str, float]:
+        """
+        Get prices of instruments for a day.
+        
+        Args:
+            instruments: Distinct instruments to price
+            day: Price date
+            
+        Returns:
+            Prices in PLN per unit keyed by instrument, unknown instruments are left out
+        """
+
+
+class FilePriceProvider(PriceProvider):
+    """
+    Price provider reading a local CSV file.
+    
+    The file has ``instrument,date,price`` columns; the latest price on or
+    before the requested day is used. Without a file no prices are known.
+    Meant for development and tests.
+    """
+    
+    name = "file"
+    
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize provider.
+        
+        Args:
+            path: Path to the CSV file, None if not configured
+        """
+        self.path = Path(path) if path else None
+        self._prices: Optional[Dict[str, Tuple[List[date], List[float]]]] = None
+    
+    def _load(self) -> None:
+        """Load and index the price file once."""
+        self._prices = {}
+        if self.path is None or not self.path.is_file():
+            logger.warning("Price file not found, no prices available", path=str(self.path or ""))
+            return
+        
+        rows: Dict[str, List[Tuple[date, float]]] = {}
+        with self.path.open(newline="") as file:
+            for row in csv.DictReader(file):
+                rows.setdefault(row["instrument"], []).append(
+                    (date.fromisoformat(row["date"]), float(row["price"]))
+                )
+        for instrument, history in rows.items():
+            history.sort()
+            self._prices[instrument] = ([d for d, _ in history], [p for _, p in history])
+    
+    async def get_prices(self, instruments: Sequence[str], day: date) -> Dict[str, float]:
+        """Get latest prices on or before a day from the file."""
+        if self._prices is None:
+            self._load()
+        
+        prices = {}
+        for instrument in instruments:
+            if instrument not in self._prices:
+                continue
+            dates, values = self._prices[instrument]
+            index = bisect_right(dates, day)
+            if index:
+                prices[instrument] = values[index - 1]
+        return prices
+
+
+def get_price_provider() -> PriceProvider:
+    """
+    Get the configured price provider.
+    
+    Returns:
+        Price provider instance
+    """
+    if settings.PRICE_PROVIDER == "file":
+        return FilePriceProvider(settings.PRICE_FILE_PATH)
+    raise ValueError(f"Unknown price provider: {settings.PRICE_PROVIDER}")
+
+
+class PriceService:
+    """Market price service."""
+    
+    async def get_prices(
+        self,
+        db: AsyncSession,
+        provider: PriceProvider,
+        instruments: Sequence[str],
+        day: date,
+    ) -> Dict[str, float]:
+        """
+        Get prices of a day, fetching only those not stored yet.
+        
+        Fetched prices are stored in ``market_prices``.
+        
+        Args:
+            db: Database session
+            provider: Price provider
+            instruments: Distinct instruments
+            day: Price date
+            
+        Returns:
+            Prices keyed by instrument
+        """
+        prices = await market_price_repository.get_prices(db, instruments, day)
+        missing = [instrument for instrument in instruments if instrument not in prices]
+        if missing:
+            fetched = await provider.get_prices(missing, day)
+            await market_price_repository.upsert_prices(db, day, fetched, provider.name)
+            prices.update(fetched)
+        return prices
+    
+    async def revalue_investments(
+        self,
+        db: AsyncSession,
+        provider: PriceProvider,
+        day: date,
+        batch_size: int = 1000,
+    ) -> dict:
+        """
+        Set current value of all investments to quantity times price.
+        
+        Each instrument is priced once per run. Investments are read in
+        keyset batches and written with one bulk update per batch.
+        
+        Args:
+            db: Database session
+            provider: Price provider
+            day: Price date
+            batch_size: Investments updated per statement
+            
+        Returns:
+            Revaluation statistics
+        """
+        instruments = await investment_repository.get_instruments(db)
+        prices = await self.get_prices(db, provider, instruments, day)
+        missing = sorted(set(instruments) - set(prices))
+        if missing:
+            logger.warning("Missing market prices", day=day, instruments=missing)
+        
+        updated = 0
+        after_id = 0
+        while True:
+            batch = await investment_repository.get_valuation_batch(db, after_id, batch_size)
+            if not batch:
+                break
+            after_id = batch[-1][0]
+            updated += await investment_repository.update_current_values(
+                db,
+                [
+                    (investment_id, quantity * prices[instrument])
+                    for investment_id, instrument, quantity in batch
+                    if instrument in prices
+                ],
+            )
+            await db.commit()
+        
+        await finance_service.invalidate_investment_caches()
+        return {
+            "updated_count": updated,
+            "instruments": len(instruments),
+            "missing_instruments": missing,
+        }
+
+
+price_service = PriceService()
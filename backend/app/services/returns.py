@@ -0,0 +1,284 @@
+"""Investment returns service."""
+from collections import defaultdict
+from typing import List, Optional, Sequence, Tuple
+from datetime import date
+import math
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.finance import Investment
+from app.repositories.finance import investment_repository
+from app.schemas.finance import InvestmentReturns, PositionReturn, TypeReturn
+from app.services.portfolio import portfolio_service
+
+# Cash flow series: pairs of (amount, years since the first flow), outflows negative
+CashFlows = Sequence[Tuple[float, float]]
+
+# Search range of annual rates, -99.99% to 1,000,000%
+XIRR_LOWER = -0.9999
+XIRR_UPPER = 1e4
+XIRR_TOLERANCE = 1e-9
+XIRR_MAX_ITERATIONS = 100
+
+
+def xirr_batch(amounts: np.ndarray, times: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Solve the XIRR of many cash flow series at once.
+    
+    Series are rows of padded arrays. Every row is solved for the log
+    growth ``x = log(1 + rate)``, where the net present value is a smooth
+    sum of exponentials, by Newton steps safeguarded by bisection: ``x``
+    is bracketed between values with opposite net present value signs,
+    and steps leaving the bracket or converging too slowly fall back to
+    its midpoint. All unconverged rows advance together in each iteration.
+    
+    Args:
+        amounts: Cash flows, shape (series, flows), outflows negative
+        times: Years since the first flow of the series, same shape
+        mask: True for real flows, False for padding, same shape
+        
+    Returns:
+        Annual rate per series, NaN where no rate exists in the search range
+    """
+    amounts = np.where(mask, amounts, 0.0)
+    times = np.where(mask, times, 0.0)
+    
+    def npv(rows: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        with np.errstate(over="ignore", invalid="ignore"):
+            discounted = amounts[rows] * np.exp(-times[rows] * x[:, None])
+        return discounted.sum(axis=1), (-times[rows] * discounted).sum(axis=1)
+    
+    everything = np.arange(len(amounts))
+    lower = np.full(len(amounts), math.log1p(XIRR_LOWER))
+    upper = np.full(len(amounts), math.log1p(XIRR_UPPER))
+    lower_value, _ = npv(everything, lower)
+    upper_value, _ = npv(everything, upper)
+    solvable = np.sign(lower_value) * np.sign(upper_value) < 0
+    
+    # Start from the growth of the mean outflow into the mean inflow
+    inflows = np.where(amounts > 0, amounts, 0.0)
+    outflows = np.where(amounts < 0, -amounts, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        years = (inflows * times).sum(axis=1) / inflows.sum(axis=1) - (
+            (outflows * times).sum(axis=1) / outflows.sum(axis=1)
+        )
+        x = np.log(inflows.sum(axis=1) / outflows.sum(axis=1)) / np.maximum(years, 1 / 365)
+    x = np.where(np.isfinite(x) & (x > lower) & (x < upper), x, 0.0)
+    
+    # Newton steps must at least halve the step before last, as in rtsafe
+    step = upper - lower
+    last_step = step.copy()
+    
+    # Only rows still converging are evaluated in each iteration
+    active = np.flatnonzero(solvable)
+    for _ in range(XIRR_MAX_ITERATIONS):
+        if not len(active):
+            break
+        value, derivative = npv(active, x[active])
+        
+        # Keep the bracket around the root
+        same_side = np.sign(value) == np.sign(lower_value[active])
+        lower[active] = np.where(same_side, x[active], lower[active])
+        upper[active] = np.where(same_side, upper[active], x[active])
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = x[active] - value / derivative
+        accepted = (
+            np.isfinite(newton)
+            & (newton > lower[active])
+            & (newton < upper[active])
+            & (np.abs(newton - x[active]) <= np.abs(last_step[active]) / 2)
+        )
+        new_x = np.where(accepted, newton, (lower[active] + upper[active]) / 2)
+        
+        last_step[active] = step[active]
+        step[active] = new_x - x[active]
+        x[active] = new_x
+        active = active[np.abs(step[active]) >= XIRR_TOLERANCE]
+    
+    return np.where(solvable, np.expm1(x), np.nan)
+
+
+def xirr_scalar(flows: CashFlows) -> Optional[float]:
+    """
+    Solve the XIRR of one cash flow series.
+    
+    Reference implementation of ``xirr_batch`` in plain Python, used to
+    check and benchmark it.
+    
+    Args:
+        flows: Pairs of (amount, years since the first flow)
+        
+    Returns:
+        Annual rate, None where no rate exists in the search range
+    """
+    def npv(x: float) -> Tuple[float, float]:
+        value = derivative = 0.0
+        for amount, t in flows:
+            discounted = amount * math.exp(-t * x)
+            value += discounted
+            derivative -= t * discounted
+        return value, derivative
+    
+    lower, upper = math.log1p(XIRR_LOWER), math.log1p(XIRR_UPPER)
+    lower_value = npv(lower)[0]
+    if lower_value * npv(upper)[0] >= 0:
+        return None
+    
+    inflow = sum(amount for amount, _ in flows if amount > 0)
+    outflow = -sum(amount for amount, _ in flows if amount < 0)
+    years = (
+        sum(amount * t for amount, t in flows if amount > 0) / inflow
+        + sum(amount * t for amount, t in flows if amount < 0) / outflow
+    )
+    x = math.log(inflow / outflow) / max(years, 1 / 365)
+    if not lower < x < upper:
+        x = 0.0
+    
+    step = last_step = upper - lower
+    for _ in range(XIRR_MAX_ITERATIONS):
+        value, derivative = npv(x)
+        if (value > 0) == (lower_value > 0):
+            lower = x
+        else:
+            upper = x
+        newton = x - value / derivative if derivative else math.inf
+        if not lower < newton < upper or abs(newton - x) > abs(last_step) / 2:
+            newton = (lower + upper) / 2
+        last_step, step, x = step, newton - x, newton
+        if abs(step) < XIRR_TOLERANCE:
+            break
+    return math.expm1(x)
+
+
+def pad_cash_flows(series: Sequence[CashFlows]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay out cash flow series as padded arrays for ``xirr_batch``.
+    
+    Args:
+        series: Cash flow series
+        
+    Returns:
+        Tuple of (amounts, times, mask) arrays
+    """
+    width = max((len(flows) for flows in series), default=0)
+    amounts = np.zeros((len(series), width))
+    times = np.zeros((len(series), width))
+    mask = np.zeros((len(series), width), dtype=bool)
+    for row, flows in enumerate(series):
+        if flows:
+            amounts[row, :len(flows)], times[row, :len(flows)] = zip(*flows)
+            mask[row, :len(flows)] = True
+    return amounts, times, mask
+
+
+def time_weighted_return(values: Sequence[float], invested: Sequence[float]) -> Optional[float]:
+    """
+    Compute the time-weighted return of a daily value series.
+    
+    Each day's return excludes the money invested that day, so the result
+    does not depend on the timing of purchases.
+    
+    Args:
+        values: Portfolio value at the end of each day
+        invested: Cumulative invested amount at the end of each day
+        
+    Returns:
+        Return over the whole series, None without a value to start from
+    """
+    values = np.asarray(values, dtype=float)
+    invested = np.asarray(invested, dtype=float)
+    flows = np.diff(invested, prepend=0.0)
+    base = np.concatenate(([0.0], values[:-1])) + flows
+    valid = base > 0
+    if not valid.any():
+        return None
+    return float(np.prod(values[valid] / base[valid]) - 1)
+
+
+class ReturnsService:
+    """Investment returns service."""
+    
+    async def get_returns(
+        self,
+        db: AsyncSession,
+        user_id: int,
+    ) -> InvestmentReturns:
+        """
+        Get annualized returns of every investment, type and the portfolio.
+        
+        Every investment is a purchase outflow followed by its market value
+        today (the current value, or the amount where unknown). Type and
+        portfolio series combine the flows of their investments, and all
+        XIRRs are solved in one batch. The time-weighted return is
+        computed from the daily portfolio value series.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            Investment returns
+        """
+        today = date.today()
+        investments = [
+            investment
+            for investment in await investment_repository.get_by_user(db, user_id)
+            if investment.purchase_date < today
+        ]
+        
+        def flows(items: List[Investment]) -> List[Tuple[float, float]]:
+            first = min(item.purchase_date for item in items)
+            value = sum(
+                item.current_value if item.current_value is not None else item.amount
+                for item in items
+            )
+            purchases = [
+                (-item.amount, (item.purchase_date - first).days / 365.0) for item in items
+            ]
+            return purchases + [(value, (today - first).days / 365.0)]
+        
+        by_type = defaultdict(list)
+        for investment in investments:
+            by_type[investment.investment_type].append(investment)
+        
+        series = [flows([investment]) for investment in investments]
+        series += [flows(items) for items in by_type.values()]
+        if investments:
+            series.append(flows(investments))
+        
+        rates = xirr_batch(*pad_cash_flows(series)) if series else np.array([])
+        rates = [None if np.isnan(rate) else float(rate) for rate in rates]
+        
+        positions = [
+            PositionReturn(
+                investment_id=investment.id,
+                name=investment.name,
+                investment_type=investment.investment_type,
+                xirr=rate,
+            )
+            for investment, rate in zip(investments, rates)
+        ]
+        types = [
+            TypeReturn(investment_type=investment_type, xirr=rate)
+            for investment_type, rate in zip(by_type, rates[len(investments):])
+        ]
+        
+        start, values, invested = await portfolio_service.get_daily_series(db, user_id, today)
+        twr = time_weighted_return(values, invested) if investments else None
+        days = (today - start).days
+        annualized_twr = None
+        if twr is not None and days >= 365:
+            annualized_twr = (1 + twr) ** (365.0 / days) - 1
+        
+        return InvestmentReturns(
+            portfolio_xirr=rates[-1] if investments else None,
+            portfolio_twr=twr,
+            portfolio_twr_annualized=annualized_twr,
+            since=start if investments else None,
+            by_type=types,
+            positions=positions,
+        )
+
+
+returns_service = ReturnsService()
@@ -0,0 +1,302 @@
+"""Bank statement import service."""
+import csv
+import hashlib
+import html
+import io
+import re
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+from datetime import date, datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.models.finance import ExpenseCategory
+from app.repositories.finance import daily_entry_repository
+from app.schemas.finance import DailyEntryCreate, EntryImportMapping, EntryImportResult
+
+
+IMPORT_FORMATS = ("csv", "ofx")
+
+# Transaction read from a statement: date, signed amount, description,
+# category and the bank's own transaction ID where the format has one
+Transaction = Tuple[date, float, Optional[str], Optional[str], Optional[str]]
+
+# OFX element with its text; SGML statements (OFX 1.x) leave most elements unclosed
+OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+# Characters read from OFX statements at a time
+OFX_CHUNK_SIZE = 65536
+
+
+def _parse_amount(value: str, decimal_separator: str) -> float:
+    """Parse an amount with optional thousands separators and currency."""
+    value = re.sub(r"[^\d,.+-]", "", value)
+    thousands = "." if decimal_separator == "," else ","
+    value = value.replace(thousands, "").replace(decimal_separator, ".")
+    if not value:
+        raise ValueError("Missing amount")
+    return float(value)
+
+
+def _parse_category(value: Optional[str]) -> Optional[str]:
+    """Map a category cell to an expense category, OTHER if unknown."""
+    if not value or not value.strip():
+        return None
+    name = value.strip().upper()
+    return name if name in ExpenseCategory.__members__ else ExpenseCategory.OTHER.value
+
+
+class StatementImportService:
+    """
+    Bank statement import service.
+    
+    Statements are parsed incrementally from the uploaded file, so memory
+    use does not depend on statement size. Every transaction gets an
+    import hash and entries are inserted in batches that skip hashes
+    already imported, which makes importing overlapping statements safe.
+    """
+    
+    def upload_path(self, user_id: int, upload_id: str) -> Path:
+        """Path of an upload stored for a background import."""
+        return Path(settings.IMPORT_DIR) / f"import_{user_id}_{upload_id}"
+    
+    def delete_uploads(self, user_id: int) -> int:
+        """
+        Delete all stored uploads of a user.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Number of uploads deleted
+        """
+        import_dir = Path(settings.IMPORT_DIR)
+        if not import_dir.is_dir():
+            return 0
+        
+        deleted = 0
+        for path in import_dir.glob(f"import_{user_id}_*"):
+            path.unlink(missing_ok=True)
+            deleted += 1
+        return deleted
+    
+    def store_upload(self, user_id: int, file: BinaryIO) -> str:
+        """
+        Store an upload in ``IMPORT_DIR`` for a background import.
+        
+        Args:
+            user_id: User ID
+            file: Uploaded file
+            
+        Returns:
+            Upload ID
+        """
+        upload_id = uuid.uuid4().hex
+        path = self.upload_path(user_id, upload_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file.seek(0)
+        with path.open("wb") as target:
+            shutil.copyfileobj(file, target)
+        return upload_id
+    
+    def _csv_transactions(
+        self,
+        text: TextIO,
+        mapping: EntryImportMapping,
+    ) -> Iterator[Tuple[int, Callable[[], Transaction]]]:
+        """Yield CSV line numbers with parsers of their transactions."""
+        delimiter = mapping.delimiter
+        if delimiter is None:
+            sample = text.read(8192)
+            text.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+            except csv.Error:
+                delimiter = ","
+        
+        reader = csv.DictReader(text, delimiter=delimiter)
+        columns = [mapping.date, mapping.amount, mapping.income, mapping.expense,
+                   mapping.description, mapping.category]
+        missing = [c for c in columns if c and c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValidationError(f"Columns missing from the file: {', '.join(missing)}")
+        
+        def parse_date(value: str) -> date:
+            if mapping.date_format == "%Y-%m-%d":
+                return date.fromisoformat(value)
+            return datetime.strptime(value, mapping.date_format).date()
+        
+        def parse(row: Dict[str, Optional[str]]) -> Transaction:
+            def cell(column: str) -> str:
+                # Cells past the end of short rows, such as footers, are None
+                value = row.get(column)
+                if value is None:
+                    raise KeyError(column)
+                return value
+            
+            day = parse_date(cell(mapping.date).strip())
+            if mapping.amount:
+                amount = _parse_amount(cell(mapping.amount), mapping.decimal_separator)
+            else:
+                income = cell(mapping.income) if mapping.income else ""
+                expense = cell(mapping.expense) if mapping.expense else ""
+                amount = (
+                    (_parse_amount(income, mapping.decimal_separator) if income.strip() else 0.0)
+                    - (abs(_parse_amount(expense, mapping.decimal_separator)) if expense.strip() else 0.0)
+                )
+            description = cell(mapping.description).strip() if mapping.description else None
+            category = _parse_category(cell(mapping.category)) if mapping.category else None
+            return day, amount, description or None, category, None
+        
+        for row in reader:
+            yield reader.line_num, lambda row=row: parse(row)
+    
+    def _ofx_transactions(self, text: TextIO) -> Iterator[Tuple[int, Callable[[], Transaction]]]:
+        """Yield OFX transaction numbers with parsers of their transactions."""
+        def parse(fields: Dict[str, str]) -> Transaction:
+            day = datetime.strptime(fields["DTPOSTED"][:8], "%Y%m%d").date()
+            amount = _parse_amount(fields["TRNAMT"], "," if "," in fields["TRNAMT"] else ".")
+            description = " ".join(
+                fields[tag] for tag in ("NAME", "MEMO") if fields.get(tag)
+            )
+            return day, amount, description or None, None, fields.get("FITID") or None
+        
+        number = 0
+        fields: Optional[Dict[str, str]] = None
+        buffer = ""
+        while True:
+            chunk = text.read(OFX_CHUNK_SIZE)
+            buffer += chunk
+            # Only elements followed by the next tag are known to be complete
+            end = max(buffer.rfind("<"), 0) if chunk else len(buffer)
+            for closing, tag, value in OFX_TAG.findall(buffer, 0, end):
+                tag = tag.upper()
+                if tag == "STMTTRN":
+                    if closing and fields is not None:
+                        number += 1
+                        yield number, lambda fields=fields: parse(fields)
+                    fields = None if closing else {}
+                elif fields is not None and not closing:
+                    fields[tag] = html.unescape(value.strip())
+            buffer = buffer[end:]
+            if not chunk:
+                break
+    
+    def _entry_row(
+        self,
+        user_id: int,
+        transaction: Transaction,
+        occurrences: Dict[str, int],
+    ) -> Dict[str, Any]:
+        """Build entry column values of a transaction."""
+        day, amount, description, category, bank_id = transaction
+        if amount == 0:
+            raise ValueError("Zero amount")
+        entry = DailyEntryCreate(
+            date=day,
+            income=max(amount, 0.0),
+            income_description=description if amount > 0 else None,
+            expense=max(-amount, 0.0),
+            expense_category=(category or ExpenseCategory.OTHER.value) if amount < 0 else None,
+            expense_description=description if amount < 0 else None,
+        )
+        
+        # Bank IDs identify transactions; otherwise identical transactions of
+        # one statement are told apart by their order
+        if bank_id:
+            key = f"id|{bank_id}"
+        else:
+            content = f"{day.isoformat()}|{amount:.2f}|{description or ''}"
+            occurrences[content] = occurrences.get(content, 0) + 1
+            key = f"{content}|{occurrences[content]}"
+        return {
+            **entry.model_dump(),
+            "user_id": user_id,
+            "import_hash": hashlib.sha256(key.encode()).hexdigest(),
+        }
+    
+    async def import_file(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        file: BinaryIO,
+        format: str,
+        mapping: Optional[EntryImportMapping] = None,
+        on_progress: Optional[Callable[[EntryImportResult], None]] = None,
+    ) -> EntryImportResult:
+        """
+        Import a bank statement as daily entries.
+        
+        Positive amounts become income and negative ones expenses. Entries
+        are inserted and committed every ``IMPORT_BATCH_SIZE`` rows; rows
+        that cannot be parsed are skipped and reported.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            file: Binary statement file
+            format: Statement format, csv or ofx
+            mapping: CSV column mapping and file encoding
+            on_progress: Called with the counts so far after every batch
+            
+        Returns:
+            Import result
+            
+        Raises:
+            ValidationError: If the format is unsupported, mapped columns are
+                missing or the file does not match its encoding
+        """
+        if format not in IMPORT_FORMATS:
+            raise ValidationError(f"Unsupported import format: {format}")
+        mapping = mapping or EntryImportMapping()
+        
+        counts = {"rows": 0, "inserted": 0, "duplicates": 0, "skipped": 0}
+        errors: List[str] = []
+        occurrences: Dict[str, int] = {}
+        batch: List[Dict[str, Any]] = []
+        
+        async def flush() -> None:
+            inserted = await daily_entry_repository.insert_imported(db, batch)
+            await db.commit()
+            counts["inserted"] += inserted
+            counts["duplicates"] += len(batch) - inserted
+            batch.clear()
+            if on_progress:
+                on_progress(EntryImportResult(**counts, errors=errors))
+        
+        file.seek(0)
+        text = io.TextIOWrapper(file, encoding=mapping.encoding, newline="")
+        try:
+            if format == "csv":
+                transactions = self._csv_transactions(text, mapping)
+            else:
+                transactions = self._ofx_transactions(text)
+            
+            for number, parse in transactions:
+                counts["rows"] += 1
+                try:
+                    batch.append(self._entry_row(user_id, parse(), occurrences))
+                except (KeyError, ValueError) as e:
+                    counts["skipped"] += 1
+                    if len(errors) < settings.IMPORT_MAX_ERRORS:
+                        reason = f"missing {e}" if isinstance(e, KeyError) else str(e).splitlines()[0]
+                        errors.append(f"Row {number}: {reason}")
+                    continue
+                
+                if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                    await flush()
+        except UnicodeDecodeError:
+            raise ValidationError(f"File is not valid {mapping.encoding}, set the mapping encoding")
+        finally:
+            # Keep the caller's file open
+            text.detach()
+        
+        if batch:
+            await flush()
+        return EntryImportResult(**counts, errors=errors)
+
+
+statement_import_service = StatementImportService()
@@ -0,0 +1,115 @@
+"""Delta sync service."""
+import base64
+import binascii
+import json
+from typing import Dict, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.models.notification import Notification
+from app.repositories.base import BaseRepository
+from app.repositories.finance import (
+    daily_entry_repository,
+    investment_repository,
+    monthly_goal_repository,
+)
+from app.schemas.sync import SyncResponse
+
+# Synced user-owned tables by response field
+SYNC_REPOSITORIES = {
+    "entries": daily_entry_repository,
+    "investments": investment_repository,
+    "goals": monthly_goal_repository,
+    "notifications": BaseRepository(Notification),
+}
+
+# Position of a table in a sync token, (updated_at, ID) of the last row read
+Position = Tuple[datetime, int]
+
+
+def encode_token(positions: Dict[str, Position]) -> str:
+    """Encode table positions as an opaque URL-safe sync token."""
+    payload = json.dumps(
+        {table: [updated_at.isoformat(), id] for table, (updated_at, id) in positions.items()},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_token(token: str) -> Dict[str, Position]:
+    """
+    Decode a token created by ``encode_token``.
+    
+    Tables missing from the token are synced from the start.
+    
+    Raises:
+        ValidationError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        return {
+            table: (datetime.fromisoformat(payload[table][0]), int(payload[table][1]))
+            for table in SYNC_REPOSITORIES
+            if table in payload
+        }
+    except (binascii.Error, ValueError, TypeError, KeyError, IndexError) as e:
+        raise ValidationError("Invalid sync token") from e
+
+
+class SyncService:
+    """Delta sync service."""
+    
+    async def get_changes(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        since: Optional[str] = None,
+    ) -> SyncResponse:
+        """
+        Get rows of every user-owned table written since a sync token.
+        
+        Every table is read in (updated_at, id) order from its position in
+        the token, at most ``SYNC_PAGE_SIZE`` rows. A table with more rows
+        keeps the position of its last row and ``has_more`` asks for another
+        sync right away. A table read to the end moves to the request time
+        minus ``SYNC_OVERLAP_SECONDS``, never backwards: rows written by
+        transactions still open during the read carry an earlier
+        ``updated_at`` than their commit, so the next sync sends the recent
+        window again and clients apply rows by ID.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            since: Token of the previous sync, None for a full sync
+            
+        Returns:
+            Changed rows, soft-deleted ones as IDs, and the next token
+            
+        Raises:
+            ValidationError: If the token is malformed
+        """
+        positions = decode_token(since) if since else {}
+        caught_up = (datetime.utcnow() - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS), 0)
+        
+        has_more = False
+        changes = {}
+        for table, repository in SYNC_REPOSITORIES.items():
+            after = positions.get(table)
+            rows, more = await repository.get_changes(db, user_id, after, settings.SYNC_PAGE_SIZE)
+            if more:
+                has_more = True
+                positions[table] = (rows[-1].updated_at, rows[-1].id)
+            else:
+                positions[table] = max(after, caught_up) if after else caught_up
+            changes[table] = {
+                "updated": [row for row in rows if not row.is_deleted],
+                "deleted": [row.id for row in rows if row.is_deleted],
+            }
+        
+        return SyncResponse(token=encode_token(positions), has_more=has_more, **changes)
+
+
+sync_service = SyncService()
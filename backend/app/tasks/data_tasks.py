@@ -1,13 +1,57 @@
 """Data maintenance tasks."""
+from typing import Optional
 from datetime import datetime, timedelta
+from celery import Task
+from sqlalchemy import select
+
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.logging import logger
+from app.models.finance import DailyEntry, Investment, MonthlyGoal
+from app.models.notification import Notification
+from app.models.user import User
+from app.repositories.partition import daily_entry_partitions, notification_partitions
+from app.schemas.finance import EntryImportMapping, EntryImportResult
+from app.services.export import export_service
+from app.services.prices import get_price_provider, price_service
+from app.services.statement_import import statement_import_service
+from app.tasks.runtime import async_task, task_session
+from app.utils.purge import BatchedPurge
 
 
-@celery_app.task(name="app.tasks.data_tasks.cleanup_old_notifications")
-def cleanup_old_notifications(days: int = 90) -> dict:
+@celery_app.task(acks_late=True, name="app.tasks.data_tasks.maintain_partitions")
+@async_task
+async def maintain_partitions() -> dict:
     """
-    Clean up old read notifications.
+    Pre-create upcoming partitions of partitioned tables.
+    
+    Returns:
+        Task result with created partition names
+    """
+    logger.info("Starting partition maintenance")
+    
+    today = datetime.utcnow().date()
+    
+    async with task_session() as db:
+        created = await daily_entry_partitions.ensure_partitions(
+            db, today, settings.PARTITION_ENTRIES_YEARS_AHEAD + 1
+        )
+        created += await notification_partitions.ensure_partitions(
+            db, today, settings.PARTITION_NOTIFICATIONS_MONTHS_AHEAD + 1
+        )
+    
+    logger.info("Partition maintenance completed", created=created)
+    return {"status": "success", "created_partitions": created}
+
+
+@celery_app.task(acks_late=True, name="app.tasks.data_tasks.cleanup_old_notifications")
+@async_task
+async def cleanup_old_notifications(days: int = 90) -> dict:
+    """
+    Clean up old notifications.
+    
+    Monthly notification partitions lying entirely before the cutoff are
+    detached and dropped whole; remaining older rows are purged in batches.
     
     Args:
         days: Delete notifications older than this many days
@@ -18,20 +62,40 @@ def cleanup_old_notifications(days: int = 90) -> dict:
     logger.info("Starting notification cleanup", days=days)
     
     cutoff_date = datetime.utcnow() - timedelta(days=days)
+    purge = BatchedPurge()
     
-    # TODO: Delete old read notifications
-    # Query notifications older than cutoff_date and is_read = True
-    # Delete them
+    async with task_session() as db:
+        dropped = await notification_partitions.drop_partitions_before(db, cutoff_date.date())
+        await db.commit()
+        finished = await purge.purge(db, Notification, Notification.created_at < cutoff_date)
+    deleted_count = purge.deleted.get(Notification.__tablename__, 0)
     
-    logger.info("Notification cleanup completed", cutoff_date=cutoff_date)
-    return {"status": "success", "deleted_count": 0}
+    logger.info(
+        "Notification cleanup completed",
+        cutoff_date=cutoff_date,
+        dropped=dropped,
+        deleted_count=deleted_count,
+        finished=finished,
+    )
+    return {
+        "status": "success" if finished else "partial",
+        "dropped_partitions": dropped,
+        "deleted_count": deleted_count,
+    }
 
 
-@celery_app.task(name="app.tasks.data_tasks.cleanup_deleted_users")
-def cleanup_deleted_users(days: int = 30) -> dict:
+@celery_app.task(acks_late=True, name="app.tasks.data_tasks.cleanup_deleted_users")
+@async_task
+async def cleanup_deleted_users(days: int = 30) -> dict:
     """
     Permanently delete soft-deleted users after grace period.
     
+    Export files and stored uploads of the users are deleted first.
+    Entries, investments, goals and notifications are then purged in
+    batches; the user rows are only removed once nothing of theirs is left,
+    so the foreign key cascade never has to delete in bulk. A run that
+    exhausts its time budget is continued by the next one.
+    
     Args:
         days: Delete users soft-deleted more than this many days ago
         
@@ -41,33 +105,125 @@ def cleanup_deleted_users(days: int = 30) -> dict:
     logger.info("Starting deleted users cleanup", days=days)
     
     cutoff_date = datetime.utcnow() - timedelta(days=days)
+    expired_users = (User.is_deleted == True, User.updated_at < cutoff_date)
+    expired_user_ids = select(User.id).where(*expired_users)
+    purge = BatchedPurge()
     
-    # TODO: Query soft-deleted users older than cutoff_date
-    # Permanently delete them and their related data
+    async with task_session() as db:
+        user_ids = (await db.execute(expired_user_ids)).scalars().all()
+        deleted_files = sum(
+            export_service.delete_files(user_id) + statement_import_service.delete_uploads(user_id)
+            for user_id in user_ids
+        )
+        for model in (DailyEntry, Investment, MonthlyGoal, Notification):
+            finished = await purge.purge(db, model, model.user_id.in_(expired_user_ids))
+            if not finished:
+                break
+        else:
+            finished = await purge.purge(db, User, *expired_users)
+    deleted_count = purge.deleted.get(User.__tablename__, 0)
     
-    logger.info("Deleted users cleanup completed", cutoff_date=cutoff_date)
-    return {"status": "success", "deleted_count": 0}
+    logger.info(
+        "Deleted users cleanup completed",
+        cutoff_date=cutoff_date,
+        deleted=purge.deleted,
+        deleted_files=deleted_files,
+        finished=finished,
+    )
+    return {
+        "status": "success" if finished else "partial",
+        "deleted_count": deleted_count,
+        "deleted_rows": purge.deleted,
+        "deleted_files": deleted_files,
+    }
 
 
-@celery_app.task(name="app.tasks.data_tasks.update_investment_values")
-def update_investment_values() -> dict:
+@celery_app.task(name="app.tasks.data_tasks.cleanup_old_exports")
+def cleanup_old_exports() -> dict:
     """
-    Update current values of investments (placeholder for API integration).
+    Delete exports and reports older than ``EXPORT_RETENTION``.
+    
+    Returns:
+        Task result
+    """
+    deleted_count = export_service.prune_files(settings.EXPORT_RETENTION)
+    
+    logger.info("Export cleanup completed", deleted_count=deleted_count)
+    return {"status": "success", "deleted_count": deleted_count}
+
+
+@celery_app.task(acks_late=True, name="app.tasks.data_tasks.update_investment_values")
+@async_task
+async def update_investment_values() -> dict:
+    """
+    Update current values of investments from market prices.
     
     Returns:
         Task result
     """
     logger.info("Starting investment values update")
     
-    # TODO: Query all investments
-    # For each investment type, fetch current market prices
-    # Update current_value field based on quantity and current price
+    today = datetime.utcnow().date()
+    provider = get_price_provider()
+    
+    async with task_session() as db:
+        stats = await price_service.revalue_investments(
+            db, provider, today, settings.REVALUATION_BATCH_SIZE
+        )
+    
+    logger.info("Investment values update completed", **stats)
+    return {"status": "success", **stats}
+
+
+@celery_app.task(bind=True, acks_late=True, name="app.tasks.data_tasks.import_entries")
+@async_task
+async def import_entries(
+    self: Task,
+    user_id: int,
+    upload_id: str,
+    format: str,
+    mapping: Optional[dict] = None,
+) -> dict:
+    """
+    Import a bank statement uploaded to ``IMPORT_DIR``.
+    
+    The upload is removed once imported. Batches are committed as they
+    go and skip entries imported before, so a redelivered task resumes
+    without duplicating entries.
+    
+    Args:
+        user_id: User ID
+        upload_id: Upload ID returned by ``store_upload``
+        format: Statement format (csv, ofx)
+        mapping: CSV column mapping
+        
+    Returns:
+        Task result with import counts
+    """
+    logger.info("Importing statement", user_id=user_id, upload_id=upload_id, format=format)
+    
+    def on_progress(result: EntryImportResult) -> None:
+        if self.request.id:
+            self.update_state(
+                state="PROGRESS",
+                meta={"user_id": user_id, **result.model_dump(exclude={"errors"})},
+            )
+    
+    path = statement_import_service.upload_path(user_id, upload_id)
+    try:
+        with path.open("rb") as file:
+            async with task_session() as db:
+                result = await statement_import_service.import_file(
+                    db, user_id, file, format, EntryImportMapping(**(mapping or {})), on_progress
+                )
+    finally:
+        path.unlink(missing_ok=True)
     
-    logger.info("Investment values update completed")
-    return {"status": "success", "updated_count": 0}
+    logger.info("Statement imported", user_id=user_id, **result.model_dump(exclude={"errors"}))
+    return {"status": "success", "user_id": user_id, **result.model_dump()}
 
 
-@celery_app.task(name="app.tasks.data_tasks.database_backup")
+@celery_app.task(acks_late=True, name="app.tasks.data_tasks.database_backup")
 def database_backup() -> dict:
     """
     Create database backup.
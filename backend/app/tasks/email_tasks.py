@@ -1,12 +1,34 @@
 """Email tasks."""
+from email.message import EmailMessage
+from typing import List
+from celery import Task
+
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.logging import logger
+from app.schemas.finance import MonthlyAnalytics
+from app.tasks.runtime import async_task
+from app.utils.email import build_message, send_email, send_messages
+from app.utils.templates import render_email
+
 
+def _monthly_report_message(email: str, report_data: dict) -> EmailMessage:
+    """Build the monthly report email of a user."""
+    report = MonthlyAnalytics.model_validate(report_data)
+    subject, body, html = render_email("monthly_report", report=report)
+    return build_message(email, subject, body, html)
 
-@celery_app.task(name="app.tasks.email_tasks.send_welcome_email")
-def send_welcome_email(email: str, username: str) -> dict:
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.email_tasks.send_welcome_email",
+    max_retries=settings.EMAIL_TASK_MAX_RETRIES,
+    default_retry_delay=settings.EMAIL_TASK_RETRY_DELAY,
+)
+@async_task
+async def send_welcome_email(self: Task, email: str, username: str) -> dict:
     """
-    Send welcome email to new user.
+    Send welcome email to new user, retried later if not delivered.
     
     Args:
         email: User email
@@ -17,17 +39,25 @@ def send_welcome_email(email: str, username: str) -> dict:
     """
     logger.info("Sending welcome email", email=email, username=username)
     
-    # TODO: Implement actual email sending using SMTP
-    # This is a placeholder implementation
+    subject, body, html = render_email("welcome", username=username)
+    if not await send_email(email, subject, body, html):
+        logger.warning("Welcome email not sent", email=email, retries=self.request.retries)
+        raise self.retry()
     
     logger.info("Welcome email sent successfully", email=email)
     return {"status": "success", "email": email}
 
 
-@celery_app.task(name="app.tasks.email_tasks.send_password_reset_email")
-def send_password_reset_email(email: str, reset_token: str) -> dict:
+@celery_app.task(
+    bind=True,
+    name="app.tasks.email_tasks.send_password_reset_email",
+    max_retries=settings.EMAIL_TASK_MAX_RETRIES,
+    default_retry_delay=settings.EMAIL_TASK_RETRY_DELAY,
+)
+@async_task
+async def send_password_reset_email(self: Task, email: str, reset_token: str) -> dict:
     """
-    Send password reset email.
+    Send password reset email, retried later if not delivered.
     
     Args:
         email: User email
@@ -38,16 +68,25 @@ def send_password_reset_email(email: str, reset_token: str) -> dict:
     """
     logger.info("Sending password reset email", email=email)
     
-    # TODO: Implement actual email sending
+    subject, body, html = render_email("password_reset", reset_token=reset_token)
+    if not await send_email(email, subject, body, html):
+        logger.warning("Password reset email not sent", email=email, retries=self.request.retries)
+        raise self.retry()
     
     logger.info("Password reset email sent successfully", email=email)
     return {"status": "success", "email": email}
 
 
-@celery_app.task(name="app.tasks.email_tasks.send_monthly_report")
-def send_monthly_report(email: str, report_data: dict) -> dict:
+@celery_app.task(
+    bind=True,
+    name="app.tasks.email_tasks.send_monthly_report",
+    max_retries=settings.EMAIL_TASK_MAX_RETRIES,
+    default_retry_delay=settings.EMAIL_TASK_RETRY_DELAY,
+)
+@async_task
+async def send_monthly_report(self: Task, email: str, report_data: dict) -> dict:
     """
-    Send monthly financial report email.
+    Send monthly financial report email, retried later if not delivered.
     
     Args:
         email: User email
@@ -58,7 +97,49 @@ def send_monthly_report(email: str, report_data: dict) -> dict:
     """
     logger.info("Sending monthly report email", email=email)
     
-    # TODO: Implement actual email sending with report
+    if await send_messages([_monthly_report_message(email, report_data)]):
+        logger.warning("Monthly report email not sent", email=email, retries=self.request.retries)
+        raise self.retry()
     
     logger.info("Monthly report email sent successfully", email=email)
     return {"status": "success", "email": email}
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.email_tasks.send_monthly_reports",
+    max_retries=settings.EMAIL_TASK_MAX_RETRIES,
+    default_retry_delay=settings.EMAIL_TASK_RETRY_DELAY,
+)
+@async_task
+async def send_monthly_reports(self: Task, reports: List[list]) -> dict:
+    """
+    Send monthly financial report emails to many users.
+    
+    Messages are delivered concurrently over the pooled SMTP connections.
+    Reports not delivered are retried later, without resending the
+    delivered ones.
+    
+    Args:
+        reports: Pairs of (email, report data)
+        
+    Returns:
+        Task result
+    """
+    logger.info("Sending monthly report emails", count=len(reports))
+    
+    messages = [_monthly_report_message(email, report_data) for email, report_data in reports]
+    undelivered = {id(message) for message in await send_messages(messages)}
+    
+    if undelivered:
+        remaining = [report for report, message in zip(reports, messages) if id(message) in undelivered]
+        logger.warning(
+            "Monthly report emails not all sent",
+            count=len(reports),
+            failed=len(remaining),
+            retries=self.request.retries,
+        )
+        raise self.retry(args=[remaining])
+    
+    logger.info("Monthly report emails sent", count=len(reports))
+    return {"status": "success", "sent": len(reports)}
@@ -1,30 +1,78 @@
 """Notification tasks."""
+import time
 from datetime import datetime
+
+from typing import Optional
+
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.logging import logger
+from app.services.notification import notification_service
+from app.tasks.runtime import async_task, task_session
+from app.tasks.scheduling import daily_lock, dispatch_shards, task_lock
 
 
-@celery_app.task(name="app.tasks.notification_tasks.send_goal_reminders")
-def send_goal_reminders() -> dict:
+@celery_app.task(acks_late=True, name="app.tasks.notification_tasks.send_goal_reminders")
+@async_task
+async def send_goal_reminders(shard: Optional[int] = None, shards: Optional[int] = None) -> dict:
     """
     Send reminders for monthly goals.
     
+    Called without a shard (as beat does), the run is split into
+    ``SCHEDULE_SHARDS`` shard tasks spread over ``SCHEDULE_WINDOW_SECONDS``.
+    Every shard runs at most once a day across all replicas.
+    
+    Args:
+        shard: Shard of users to handle
+        shards: Number of shards
+        
     Returns:
         Task result
     """
-    logger.info("Starting goal reminders task")
+    today = datetime.now().date()
     
-    # TODO: Query users and check their goal progress
-    # Create notifications for users who are behind on their goals
+    if shard is None:
+        with daily_lock("send_goal_reminders", today) as acquired:
+            if not acquired:
+                return {"status": "skipped"}
+            dispatch_shards(send_goal_reminders, settings.SCHEDULE_SHARDS, settings.SCHEDULE_WINDOW_SECONDS)
+        return {"status": "dispatched", "shards": settings.SCHEDULE_SHARDS}
     
-    logger.info("Goal reminders task completed")
-    return {"status": "success", "reminders_sent": 0}
+    with daily_lock(f"send_goal_reminders:{shard}/{shards}", today) as acquired:
+        if not acquired:
+            logger.info("Goal reminders shard already handled", shard=shard, shards=shards)
+            return {"status": "skipped", "shard": shard}
+        
+        logger.info("Starting goal reminders task", shard=shard, shards=shards)
+        
+        started = time.monotonic()
+        async with task_session() as db:
+            reminders_sent = await notification_service.create_goal_reminders(
+                db, today, shard, shards
+            )
+        duration = time.monotonic() - started
+    
+    logger.info(
+        "Goal reminders task completed",
+        shard=shard,
+        reminders_sent=reminders_sent,
+        duration=f"{duration:.3f}s",
+    )
+    return {
+        "status": "success",
+        "shard": shard,
+        "reminders_sent": reminders_sent,
+        "duration_seconds": round(duration, 3),
+    }
 
 
 @celery_app.task(name="app.tasks.notification_tasks.create_notification")
 def create_notification(user_id: int, title: str, message: str, notification_type: str = "info") -> dict:
     """
-    Create a notification for a user.
+    Queue a notification for a user.
+    
+    The notification is merged into a digest with others of the same type
+    and title and written by ``flush_notification_digests``.
     
     Args:
         user_id: User ID
@@ -36,16 +84,15 @@ def create_notification(user_id: int, title: str, message: str, notification_typ
         Task result
     """
     logger.info(
-        "Creating notification",
+        "Queueing notification",
         user_id=user_id,
         title=title,
         notification_type=notification_type
     )
     
-    # TODO: Create notification in database
+    notification_service.queue_notification(user_id, title, message, notification_type)
     
-    logger.info("Notification created", user_id=user_id)
-    return {"status": "success", "user_id": user_id}
+    return {"status": "queued", "user_id": user_id}
 
 
 @celery_app.task(name="app.tasks.notification_tasks.send_achievement_notification")
@@ -62,7 +109,32 @@ def send_achievement_notification(user_id: int, achievement: str) -> dict:
     """
     logger.info("Sending achievement notification", user_id=user_id, achievement=achievement)
     
-    # TODO: Create achievement notification
+    notification_service.queue_notification(user_id, "Achievement unlocked", achievement, "success")
+    
+    return {"status": "queued", "user_id": user_id}
+
+
+@celery_app.task(acks_late=True, name="app.tasks.notification_tasks.flush_notification_digests")
+@async_task
+async def flush_notification_digests() -> dict:
+    """
+    Write notification digests of closed windows with bulk inserts.
+    
+    Runs hold a lock, so an overlapping run skips instead of writing the
+    same digests again.
+    
+    Returns:
+        Task result
+    """
+    with task_lock("flush_notification_digests") as acquired:
+        if not acquired:
+            logger.info("Notification digests flush already running")
+            return {"status": "skipped"}
+        
+        started = time.monotonic()
+        async with task_session() as db:
+            created = await notification_service.flush_digests(db)
+        duration = time.monotonic() - started
     
-    logger.info("Achievement notification sent", user_id=user_id)
-    return {"status": "success", "user_id": user_id}
+    logger.info("Notification digests flushed", created=created, duration=f"{duration:.3f}s")
+    return {"status": "success", "created": created, "duration_seconds": round(duration, 3)}
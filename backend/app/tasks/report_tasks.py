@@ -1,69 +1,332 @@
 """Report generation tasks."""
-from datetime import datetime
+import uuid
+from typing import List, Optional
+from datetime import date, timedelta
+from celery import Task, chord
+from celery.result import AsyncResult
+
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.logging import logger
+from app.core.redis import RedisClient
+from app.repositories.user import user_repository
+from app.services.analytics import analytics_service
+from app.services.export import export_service
+from app.tasks.email_tasks import send_monthly_reports
+from app.tasks.runtime import async_task, task_session
+from app.tasks.scheduling import daily_lock, dispatch_shards
+from app.utils.templates import render_annual_report
+
+
+def _state_key(year: int, month: int, shard: int) -> str:
+    """Redis hash holding the progress of a monthly reports shard."""
+    return f"reports:monthly:{year}-{month:02d}:shard:{shard}"
+
+
+def _done_key(year: int, month: int) -> str:
+    """Redis set of users whose monthly report was already sent."""
+    return f"reports:monthly:{year}-{month:02d}:done"
+
+
+def get_monthly_reports_progress(year: int, month: int, shards: Optional[int] = None) -> List[dict]:
+    """
+    Get progress of a monthly reports run.
+    
+    Args:
+        year: Report year
+        month: Report month
+        shards: Number of shards of the run, defaults to ``SCHEDULE_SHARDS``
+        
+    Returns:
+        State of every shard with status, total and completed user counts
+    """
+    redis = RedisClient.get_sync_client()
+    shards = shards or settings.SCHEDULE_SHARDS
+    return [redis.hgetall(_state_key(year, month, shard)) for shard in range(shards)]
 
 
-@celery_app.task(name="app.tasks.report_tasks.generate_monthly_reports")
-def generate_monthly_reports() -> dict:
+@celery_app.task(bind=True, acks_late=True, name="app.tasks.report_tasks.generate_monthly_reports")
+@async_task
+async def generate_monthly_reports(
+    self: Task,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    shard: Optional[int] = None,
+    shards: Optional[int] = None,
+) -> dict:
     """
     Generate monthly financial reports for all users.
     
+    Called without a shard (as beat does), the run is split into
+    ``SCHEDULE_SHARDS`` shard runs spread over ``SCHEDULE_WINDOW_SECONDS``.
+    A shard run pages its active users by ID and dispatches them in chunks
+    of ``REPORTS_CHUNK_SIZE`` to ``generate_monthly_report_chunk`` subtasks
+    joined by a chord. Users who already got the month's report are
+    skipped, so a run that failed part-way only processes the rest when
+    started again.
+    
+    Args:
+        year: Report year, defaults to the previous month's year
+        month: Report month, defaults to the previous month
+        shard: Shard of users to handle
+        shards: Number of shards
+        
+    Returns:
+        Task result
+    """
+    if year is None or month is None:
+        previous = date.today().replace(day=1) - timedelta(days=1)
+        year, month = previous.year, previous.month
+    
+    if shard is None:
+        with daily_lock(f"generate_monthly_reports:{year}-{month:02d}", date.today()) as acquired:
+            if not acquired:
+                return {"status": "skipped", "year": year, "month": month}
+            dispatch_shards(
+                generate_monthly_reports,
+                settings.SCHEDULE_SHARDS,
+                settings.SCHEDULE_WINDOW_SECONDS,
+                year=year,
+                month=month,
+            )
+        return {"status": "dispatched", "year": year, "month": month, "shards": settings.SCHEDULE_SHARDS}
+    
+    with daily_lock(f"generate_monthly_reports:{year}-{month:02d}:{shard}/{shards}", date.today()) as acquired:
+        if not acquired:
+            return {"status": "skipped", "year": year, "month": month, "shard": shard}
+        return await _generate_monthly_reports_shard(self, year, month, shard, shards)
+
+
+async def _generate_monthly_reports_shard(
+    task: Task,
+    year: int,
+    month: int,
+    shard: int,
+    shards: int,
+) -> dict:
+    """Dispatch report chunks of one shard of users."""
+    logger.info("Starting monthly reports generation", year=year, month=month, shard=shard)
+    
+    redis = RedisClient.get_sync_client()
+    state_key = _state_key(year, month, shard)
+    done_key = _done_key(year, month)
+    state = redis.hgetall(state_key)
+    
+    if state.get("status") == "completed":
+        logger.info("Monthly reports already generated", year=year, month=month, shard=shard)
+        return {"status": "skipped", "year": year, "month": month, "shard": shard}
+    if state.get("status") == "running" and not AsyncResult(state["callback_id"]).ready():
+        logger.info("Monthly reports generation already running", year=year, month=month, shard=shard)
+        return {"status": "skipped", "year": year, "month": month, "shard": shard}
+    
+    chunks: List[List[int]] = []
+    after_id = 0
+    async with task_session() as db:
+        while True:
+            user_ids = await user_repository.get_active_ids_after(
+                db, after_id, settings.REPORTS_CHUNK_SIZE, shard, shards
+            )
+            if not user_ids:
+                break
+            after_id = user_ids[-1]
+            done = redis.smismember(done_key, user_ids)
+            pending = [user_id for user_id, is_done in zip(user_ids, done) if not is_done]
+            if pending:
+                chunks.append(pending)
+    
+    pending_users = sum(len(chunk) for chunk in chunks)
+    
+    if not chunks:
+        return finalize_monthly_reports([], year, month, shard)
+    
+    # State is written before dispatch, chunks and the callback update it
+    callback_id = str(uuid.uuid4())
+    redis.hset(
+        state_key,
+        mapping={
+            "status": "running",
+            "task_id": task.request.id or "",
+            "callback_id": callback_id,
+            "chunks": len(chunks),
+            "total": pending_users,
+            "completed": 0,
+        },
+    )
+    redis.expire(state_key, settings.REPORTS_STATE_TTL)
+    
+    callback = finalize_monthly_reports.s(year, month, shard).set(task_id=callback_id)
+    try:
+        chord(
+            generate_monthly_report_chunk.s(user_ids, year, month, shard) for user_ids in chunks
+        )(callback)
+    except Exception:
+        # Nothing was started, let the next run retry
+        redis.delete(state_key)
+        raise
+    
+    if task.request.id:
+        task.update_state(
+            state="PROGRESS",
+            meta={"year": year, "month": month, "shard": shard, "chunks": len(chunks), "total": pending_users},
+        )
+    
+    logger.info(
+        "Monthly reports dispatched",
+        year=year,
+        month=month,
+        shard=shard,
+        chunks=len(chunks),
+        users=pending_users,
+    )
+    return {
+        "status": "dispatched",
+        "year": year,
+        "month": month,
+        "shard": shard,
+        "chunks": len(chunks),
+        "users": pending_users,
+        "callback_id": callback_id,
+    }
+
+
+@celery_app.task(acks_late=True, name="app.tasks.report_tasks.generate_monthly_report_chunk")
+@async_task
+async def generate_monthly_report_chunk(user_ids: List[int], year: int, month: int, shard: int) -> dict:
+    """
+    Generate and send monthly reports for a chunk of users.
+    
+    Aggregates of all users in the chunk are loaded with a single query.
+    
+    Args:
+        user_ids: User IDs
+        year: Report year
+        month: Report month
+        shard: Shard the users belong to
+        
     Returns:
         Task result
     """
-    logger.info("Starting monthly reports generation")
+    async with task_session() as db:
+        users = await user_repository.get_many(db, user_ids)
+        analytics = await analytics_service.get_monthly_analytics_for_users(
+            db, [user.id for user in users], year, month
+        )
+    reports = [
+        (user.id, user.email, analytics[user.id].model_dump(mode="json"))
+        for user in users
+    ]
+    if reports:
+        send_monthly_reports.delay([[email, report_data] for _, email, report_data in reports])
     
-    now = datetime.now()
-    year = now.year
-    month = now.month
+    redis = RedisClient.get_sync_client()
+    pipe = redis.pipeline()
+    if reports:
+        pipe.sadd(_done_key(year, month), *(user_id for user_id, _, _ in reports))
+        pipe.expire(_done_key(year, month), settings.REPORTS_STATE_TTL)
+    pipe.hincrby(_state_key(year, month, shard), "completed", len(user_ids))
+    pipe.execute()
     
-    # TODO: Query all active users
-    # For each user, generate monthly report
-    # Send report via email
+    logger.info("Monthly report chunk generated", year=year, month=month, reports=len(reports))
+    return {"status": "success", "reports_generated": len(reports)}
+
+
+@celery_app.task(acks_late=True, name="app.tasks.report_tasks.finalize_monthly_reports")
+def finalize_monthly_reports(results: List[dict], year: int, month: int, shard: int) -> dict:
+    """
+    Mark a monthly reports shard as completed.
+    
+    Args:
+        results: Results of the chunk subtasks
+        year: Report year
+        month: Report month
+        shard: Shard of the run
+        
+    Returns:
+        Task result
+    """
+    reports_generated = sum(result["reports_generated"] for result in results)
     
-    logger.info("Monthly reports generation completed", year=year, month=month)
-    return {"status": "success", "reports_generated": 0}
+    redis = RedisClient.get_sync_client()
+    redis.hset(_state_key(year, month, shard), "status", "completed")
+    redis.expire(_state_key(year, month, shard), settings.REPORTS_STATE_TTL)
+    
+    logger.info(
+        "Monthly reports generation completed",
+        year=year,
+        month=month,
+        shard=shard,
+        reports_generated=reports_generated,
+    )
+    return {
+        "status": "success",
+        "year": year,
+        "month": month,
+        "shard": shard,
+        "reports_generated": reports_generated,
+    }
 
 
-@celery_app.task(name="app.tasks.report_tasks.generate_annual_report")
-def generate_annual_report(user_id: int, year: int) -> dict:
+@celery_app.task(acks_late=True, name="app.tasks.report_tasks.generate_annual_report")
+@async_task
+async def generate_annual_report(user_id: int, year: int) -> dict:
     """
     Generate annual financial report for a user.
     
+    The report is rendered as HTML and stored with the user's exports.
+    
     Args:
         user_id: User ID
         year: Year
         
     Returns:
-        Task result
+        Task result with file path
     """
     logger.info("Generating annual report", user_id=user_id, year=year)
     
-    # TODO: Generate comprehensive annual report
-    # Include all financial data, analytics, charts
+    async with task_session() as db:
+        analytics = await analytics_service.get_annual_analytics(db, user_id, year)
+    path = export_service.write_report(user_id, f"annual-{year}.html", render_annual_report(analytics))
     
     logger.info("Annual report generated", user_id=user_id, year=year)
-    return {"status": "success", "user_id": user_id, "year": year}
+    return {
+        "status": "success",
+        "user_id": user_id,
+        "year": year,
+        "file_path": str(path),
+        "file_name": path.name,
+    }
 
 
-@celery_app.task(name="app.tasks.report_tasks.export_user_data")
-def export_user_data(user_id: int, format: str = "json") -> dict:
+@celery_app.task(bind=True, acks_late=True, name="app.tasks.report_tasks.export_user_data")
+@async_task
+async def export_user_data(self: Task, user_id: int, format: str = "jsonl") -> dict:
     """
     Export all user data in specified format.
     
     Args:
         user_id: User ID
-        format: Export format (json, csv, pdf)
+        format: Export format (jsonl, csv)
         
     Returns:
         Task result with file path
     """
     logger.info("Exporting user data", user_id=user_id, format=format)
     
-    # TODO: Export all user data (entries, investments, goals)
-    # Create file in specified format
-    # Store in temporary location
+    records = {}
+    
+    def on_progress(record_type: str, written: int) -> None:
+        records[record_type] = written
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta={"user_id": user_id, "records": records})
+    
+    async with task_session() as db:
+        path = await export_service.export_user_data(db, user_id, format, on_progress)
     
-    logger.info("User data exported", user_id=user_id, format=format)
-    return {"status": "success", "user_id": user_id, "file_path": "/tmp/export.json"}
+    logger.info("User data exported", user_id=user_id, format=format, records=records)
+    return {
+        "status": "success",
+        "user_id": user_id,
+        "file_path": str(path),
+        "file_name": path.name,
+        "records": records,
+    }
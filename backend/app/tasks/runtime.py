@@ -0,0 +1,116 @@
+"""Async runtime for Celery worker processes."""
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+from app.core.database import run_after_commit
+from app.core.logging import logger
+
+T = TypeVar("T")
+
+# Event loop, engine and session factory of the current worker process
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+
+
+@worker_process_init.connect
+def init_runtime(**kwargs: Any) -> None:
+    """
+    Start the event loop and pooled engine of a worker process.
+    
+    Connected to ``worker_process_init``, so every prefork child gets its
+    own loop and pool; asyncpg connections cannot be shared across
+    processes or loops. Also called lazily outside of prefork workers.
+    """
+    global _loop, _engine, _session_factory
+    
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    _engine = create_async_engine(
+        str(settings.DATABASE_URL),
+        pool_pre_ping=True,
+        pool_size=settings.CELERY_DB_POOL_SIZE,
+        max_overflow=settings.CELERY_DB_MAX_OVERFLOW,
+    )
+    _session_factory = async_sessionmaker(
+        _engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    logger.info("Worker async runtime started")
+
+
+@worker_process_shutdown.connect
+def shutdown_runtime(**kwargs: Any) -> None:
+    """Dispose the engine and close the event loop of a worker process."""
+    global _loop, _engine, _session_factory
+    
+    if _loop is None:
+        return
+    if _engine is not None:
+        _loop.run_until_complete(_engine.dispose())
+    _loop.close()
+    _loop = _engine = _session_factory = None
+    logger.info("Worker async runtime stopped")
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the process event loop, starting the runtime if needed."""
+    if _loop is None:
+        init_runtime()
+    return _loop
+
+
+@asynccontextmanager
+async def task_session() -> AsyncIterator[AsyncSession]:
+    """
+    Open a session from the worker pool.
+    
+    The session is committed when the block exits and rolled back when it
+    raises.
+    
+    Yields:
+        Database session
+    """
+    async with _session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await run_after_commit(session)
+
+
+def async_task(func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    """
+    Run a coroutine function task on the worker event loop.
+    
+    Place below ``@celery_app.task`` so the task body can ``await``
+    services; open sessions with ``task_session()``. Tasks must not run
+    concurrently within a process, so use the prefork or solo pool.
+    
+    Args:
+        func: Coroutine function implementing the task
+        
+    Returns:
+        Synchronous function Celery can execute
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return _get_loop().run_until_complete(func(*args, **kwargs))
+    return wrapper
+
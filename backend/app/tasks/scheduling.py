@@ -0,0 +1,121 @@
+"""Sharded scheduling helpers for periodic tasks."""
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator
+from datetime import date
+from celery import Task, current_task
+
+from app.core.redis import RedisClient
+
+
+# Locks of running blocks expire quickly unless renewed, so the lock of a
+# killed worker does not outlive it for long
+LOCK_TTL = 60
+
+# Done markers outlive the day so late replicas still see them
+DAILY_DONE_TTL = 2 * 86400
+
+# Compare-and-set scripts, so a lock is only renewed or released by its holder
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+@contextmanager
+def task_lock(name: str) -> Iterator[bool]:
+    """
+    Hold a Redis lock while a block runs.
+    
+    The lock expires after ``LOCK_TTL`` seconds and is renewed by a
+    background thread until the block exits, so a lock of a killed worker
+    is gone soon after. It holds the current task ID, so a task
+    redelivered after its worker died takes over its own lock instead of
+    skipping.
+    
+    Args:
+        name: Lock name, e.g. task name
+        
+    Yields:
+        True if this caller acquired the lock
+    """
+    redis = RedisClient.get_sync_client()
+    lock_key = f"lock:{name}"
+    token = (current_task.request.id if current_task else None) or uuid.uuid4().hex
+    
+    acquired = bool(redis.set(lock_key, token, nx=True, ex=LOCK_TTL)) or redis.get(lock_key) == token
+    if not acquired:
+        yield False
+        return
+    
+    stop = threading.Event()
+    
+    def renew() -> None:
+        while not stop.wait(LOCK_TTL / 3):
+            redis.eval(_RENEW_SCRIPT, 1, lock_key, token, LOCK_TTL)
+    
+    renewer = threading.Thread(target=renew, name=f"lock:{name}", daemon=True)
+    renewer.start()
+    try:
+        yield True
+    finally:
+        stop.set()
+        renewer.join()
+        redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+
+
+@contextmanager
+def daily_lock(name: str, day: date) -> Iterator[bool]:
+    """
+    Run a block at most once per day across replicas.
+    
+    While the block runs, a ``task_lock`` is held; a per-day done marker
+    is set only once the block finished without raising. Callers get
+    ``False`` if the block already ran that day or another replica is
+    running it.
+    
+    Args:
+        name: Lock name, e.g. task name and shard
+        day: Day the lock is valid for
+        
+    Yields:
+        True if this caller should run the block
+    """
+    redis = RedisClient.get_sync_client()
+    done_key = f"done:{name}:{day.isoformat()}"
+    
+    with task_lock(f"{name}:{day.isoformat()}") as acquired:
+        if not acquired or redis.exists(done_key):
+            yield False
+            return
+        yield True
+        redis.set(done_key, 1, ex=DAILY_DONE_TTL)
+
+
+def dispatch_shards(task: Task, shards: int, window: int, **kwargs: Any) -> None:
+    """
+    Queue one run of a task per ``user_id % shards`` shard.
+    
+    Runs are spread evenly over the window with countdowns, so shard ``i``
+    starts ``i * window / shards`` seconds from now.
+    
+    Args:
+        task: Task accepting ``shard`` and ``shards`` keyword arguments
+        shards: Number of shards
+        window: Seconds to spread the runs over
+        **kwargs: Further task keyword arguments
+    """
+    for shard in range(shards):
+        task.apply_async(
+            kwargs={**kwargs, "shard": shard, "shards": shards},
+            countdown=round(shard * window / shards),
+        )
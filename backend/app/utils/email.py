@@ -1,9 +1,238 @@
-"""Email utilities (placeholder)."""
-from typing import List, Optional
+"""Email utilities."""
+import asyncio
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import AsyncIterator, List, Optional, Sequence
+
+import aiosmtplib
+
 from app.core.config import settings
 from app.core.logging import logger
 
 
+def build_message(
+    to_email: str,
+    subject: str,
+    body: str,
+    html: Optional[str] = None,
+) -> EmailMessage:
+    """
+    Build an email message from the configured sender.
+    
+    Args:
+        to_email: Recipient email
+        subject: Email subject
+        body: Plain text body
+        html: Optional HTML body
+        
+    Returns:
+        Email message
+    """
+    message = EmailMessage()
+    message["From"] = formataddr((settings.SMTP_FROM_NAME, settings.SMTP_FROM_EMAIL))
+    message["To"] = to_email
+    message["Subject"] = subject
+    message.set_content(body)
+    if html:
+        message.add_alternative(html, subtype="html")
+    return message
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a delivery error is worth retrying."""
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return all(400 <= r.code < 500 for r in error.recipients)
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 400 <= error.code < 500
+    return isinstance(error, (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, OSError, asyncio.TimeoutError))
+
+
+class _Connection:
+    """Pooled SMTP connection with the number of messages it carried."""
+    
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.sent = 0
+
+
+class SMTPPool:
+    """
+    Bounded pool of authenticated SMTP connections.
+    
+    At most ``size`` connections are open at a time. Connections are
+    returned to the pool after use and reused until they carried
+    ``max_messages`` messages; a connection that failed is discarded.
+    Borrowers must stop sending once ``sent`` reaches ``max_messages``.
+    """
+    
+    def __init__(self, size: int, max_messages: int):
+        """
+        Initialize pool.
+        
+        Args:
+            size: Maximum number of open connections
+            max_messages: Messages sent over one connection before it is replaced
+        """
+        self.size = size
+        self.max_messages = max_messages
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[_Connection] = []
+    
+    async def _connect(self) -> _Connection:
+        """Open and authenticate a connection."""
+        client = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER or None,
+            password=settings.SMTP_PASSWORD or None,
+            use_tls=settings.SMTP_USE_TLS,
+            start_tls=settings.SMTP_START_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+        )
+        await client.connect()
+        return _Connection(client)
+    
+    async def _close(self, connection: _Connection) -> None:
+        """Close a connection, ignoring errors."""
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
+    
+    @asynccontextmanager
+    async def connection(self, unavailable: Optional[asyncio.Event] = None) -> AsyncIterator[_Connection]:
+        """
+        Borrow a connection.
+        
+        Args:
+            unavailable: Set once the server was found unreachable; borrowers
+                waiting for a slot then fail instead of connecting again
+        
+        Yields:
+            Connected and authenticated connection
+            
+        Raises:
+            SMTPConnectError: If ``unavailable`` was set while waiting
+        """
+        async with self._slots:
+            if unavailable is not None and unavailable.is_set():
+                raise aiosmtplib.SMTPConnectError("SMTP server unavailable")
+            while self._idle and not self._idle[-1].client.is_connected:
+                self._idle.pop().client.close()
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                yield connection
+            except BaseException:
+                await self._close(connection)
+                raise
+            if connection.sent >= self.max_messages or not connection.client.is_connected:
+                await self._close(connection)
+            else:
+                self._idle.append(connection)
+    
+    async def close(self) -> None:
+        """Close all idle connections."""
+        while self._idle:
+            await self._close(self._idle.pop())
+
+
+_pool: Optional[SMTPPool] = None
+
+
+def get_pool() -> SMTPPool:
+    """
+    Get the SMTP pool of the running event loop.
+    
+    Returns:
+        SMTP connection pool
+    """
+    global _pool
+    if _pool is None or _pool.loop is not asyncio.get_running_loop():
+        _pool = SMTPPool(settings.SMTP_POOL_SIZE, settings.SMTP_MAX_MESSAGES_PER_CONNECTION)
+    return _pool
+
+
+async def _send_batch(
+    pool: SMTPPool,
+    messages: Sequence[EmailMessage],
+    unavailable: asyncio.Event,
+) -> List[EmailMessage]:
+    """
+    Send messages over one pooled connection, retrying transient failures.
+    
+    A failed attempt drops the connection and continues with the remaining
+    messages on a fresh one after an exponential backoff. A message failing
+    permanently or past ``SMTP_MAX_RETRIES`` is given up. Failing to connect
+    or log in gives up the rest of the batch instead, and sets
+    ``unavailable`` so the other batches stop trying as well.
+    
+    Returns:
+        Messages not delivered
+    """
+    undelivered: List[EmailMessage] = []
+    pending = list(messages)
+    attempt = 0
+    while pending:
+        connected = False
+        try:
+            async with pool.connection(unavailable) as connection:
+                connected = True
+                # A spent connection is replaced by the pool on the next borrow
+                while pending and connection.sent < pool.max_messages:
+                    await connection.client.send_message(pending[0])
+                    connection.sent += 1
+                    pending.pop(0)
+                    attempt = 0
+        except Exception as e:
+            retry = _is_transient(e) and attempt < settings.SMTP_MAX_RETRIES
+            if not connected and (unavailable.is_set() or not retry):
+                if not unavailable.is_set():
+                    logger.error("Failed to connect to SMTP server", error=str(e))
+                    unavailable.set()
+                return undelivered + pending
+            if not retry:
+                logger.error("Failed to send email", email=pending[0]["To"], error=str(e))
+                undelivered.append(pending.pop(0))
+                attempt = 0
+                continue
+            attempt += 1
+            await asyncio.sleep(settings.SMTP_RETRY_BACKOFF * 2 ** (attempt - 1))
+    return undelivered
+
+
+async def send_messages(messages: Sequence[EmailMessage]) -> List[EmailMessage]:
+    """
+    Send many messages concurrently over the connection pool.
+    
+    Messages are split into batches of ``SMTP_BATCH_SIZE`` sent back to back
+    over one connection; up to ``SMTP_POOL_SIZE`` batches run at once.
+    With ``SMTP_ENABLED`` off messages are only logged.
+    
+    Args:
+        messages: Email messages
+        
+    Returns:
+        Messages not delivered, in their original order
+    """
+    if not settings.SMTP_ENABLED:
+        for message in messages:
+            logger.info("Email delivery disabled", to_email=message["To"], subject=message["Subject"])
+        return []
+    
+    pool = get_pool()
+    unavailable = asyncio.Event()
+    size = settings.SMTP_BATCH_SIZE
+    results = await asyncio.gather(
+        *(_send_batch(pool, messages[i:i + size], unavailable) for i in range(0, len(messages), size))
+    )
+    undelivered = [message for batch in results for message in batch]
+    if undelivered:
+        logger.warning("Emails not delivered", count=len(messages), undelivered=len(undelivered))
+    return undelivered
+
+
 async def send_email(
     to_email: str,
     subject: str,
@@ -24,11 +253,11 @@ async def send_email(
     """
     logger.info("Sending email", to_email=to_email, subject=subject)
     
-    # TODO: Implement actual SMTP email sending
-    # using settings.SMTP_* configuration
+    undelivered = await send_messages([build_message(to_email, subject, body, html)])
     
-    logger.info("Email sent successfully", to_email=to_email)
-    return True
+    if not undelivered:
+        logger.info("Email sent successfully", to_email=to_email)
+    return not undelivered
 
 
 async def send_bulk_email(
@@ -49,12 +278,7 @@ async def send_bulk_email(
     Returns:
         Number of emails sent
     """
-    sent_count = 0
-    for email in recipients:
-        try:
-            await send_email(email, subject, body, html)
-            sent_count += 1
-        except Exception as e:
-            logger.error("Failed to send email", email=email, error=str(e))
-    
-    return sent_count
+    undelivered = await send_messages(
+        [build_message(email, subject, body, html) for email in recipients]
+    )
+    return len(recipients) - len(undelivered)
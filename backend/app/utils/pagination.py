@@ -0,0 +1,99 @@
+"""Keyset pagination helpers."""
+import base64
+import binascii
+import json
+from typing import Any, Optional, Tuple, Union
+from datetime import date, datetime
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.exceptions import ValidationError
+
+# Column or SQL expression rows are ordered by
+SortColumn = Union[InstrumentedAttribute, ColumnElement]
+
+
+def encode_cursor(sort: str, value: Any, id: int) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+    
+    Args:
+        sort: Sort key the page was ordered by
+        value: Sort column value of the last row
+        id: ID of the last row
+        
+    Returns:
+        URL-safe cursor
+    """
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    payload = json.dumps([sort, value, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, column: SortColumn) -> Tuple[Any, int]:
+    """
+    Decode a cursor created by ``encode_cursor``.
+    
+    Args:
+        cursor: Cursor from a previous page
+        sort: Sort key of the current request
+        column: Sort column or expression, used to restore the value type
+        
+    Returns:
+        Tuple of (sort column value, row ID)
+        
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for another sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, id = json.loads(base64.urlsafe_b64decode(padded))
+        python_type = column.type.python_type
+        if value is not None and python_type in (date, datetime):
+            value = python_type.fromisoformat(value)
+        elif value is not None:
+            value = python_type(value)
+        id = int(id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValidationError("Invalid cursor") from e
+    
+    if cursor_sort != sort:
+        raise ValidationError("Cursor was issued for a different sort order")
+    return value, id
+
+
+def keyset_page(
+    stmt: Select,
+    column: SortColumn,
+    id_column: InstrumentedAttribute,
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+) -> Select:
+    """
+    Order a query by a column and ID and restrict it to one page.
+    
+    The page starts right after the ``after`` position, compared as a row
+    value so that an index on (column, id) serves both the filter and the
+    order. One extra row is fetched to tell whether another page exists.
+    
+    Args:
+        stmt: Filtered query
+        column: Sort column or expression, not nullable
+        id_column: Unique tie breaker
+        descending: Sort direction
+        after: Position decoded from a cursor, None for the first page
+        limit: Page size
+        
+    Returns:
+        Query returning up to ``limit + 1`` rows
+    """
+    if after is not None:
+        position = tuple_(column, id_column)
+        stmt = stmt.where(position < tuple_(*after) if descending else position > tuple_(*after))
+    if descending:
+        stmt = stmt.order_by(column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(column.asc(), id_column.asc())
+    return stmt.limit(limit + 1)
@@ -0,0 +1,75 @@
+"""Batched deletes for large tables."""
+import asyncio
+import time
+from typing import Any, Dict, Optional, Type
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.models.base import BaseModel
+
+
+class BatchedPurge:
+    """
+    Delete rows in primary-key batches under a shared time budget.
+    
+    Every batch is a ``DELETE ... WHERE id IN (SELECT id ... LIMIT n)``
+    committed on its own, so locks are held briefly and WAL is written in
+    small pieces. Batches are separated by a pause to let replicas catch
+    up, and no new batch starts once the time budget is spent.
+    """
+    
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        pause: Optional[float] = None,
+        time_budget: Optional[float] = None,
+    ):
+        """
+        Initialize purge.
+        
+        Args:
+            batch_size: Rows deleted per batch, defaults to ``PURGE_BATCH_SIZE``
+            pause: Seconds to sleep between batches, defaults to ``PURGE_PAUSE_SECONDS``
+            time_budget: Seconds available for all purges, defaults to ``PURGE_TIME_BUDGET``
+        """
+        self.batch_size = batch_size or settings.PURGE_BATCH_SIZE
+        self.pause = settings.PURGE_PAUSE_SECONDS if pause is None else pause
+        budget = settings.PURGE_TIME_BUDGET if time_budget is None else time_budget
+        self.deadline = time.monotonic() + budget
+        self.deleted: Dict[str, int] = {}
+    
+    @property
+    def expired(self) -> bool:
+        """Whether the time budget is spent."""
+        return time.monotonic() >= self.deadline
+    
+    async def purge(self, db: AsyncSession, model: Type[BaseModel], *criteria: Any) -> bool:
+        """
+        Delete all rows of a model matching criteria.
+        
+        The session is committed after every batch.
+        
+        Args:
+            db: Database session
+            model: Model to delete from
+            *criteria: Filter expressions selecting the rows
+            
+        Returns:
+            True if all matching rows were deleted, False if the budget ran out
+        """
+        table = model.__tablename__
+        while not self.expired:
+            ids = select(model.id).where(*criteria).order_by(model.id).limit(self.batch_size)
+            stmt = delete(model).where(model.id.in_(ids.scalar_subquery()), *criteria)
+            result = await db.execute(stmt.execution_options(synchronize_session=False))
+            await db.commit()
+            
+            self.deleted[table] = self.deleted.get(table, 0) + result.rowcount
+            if result.rowcount < self.batch_size:
+                return True
+            await asyncio.sleep(self.pause)
+        
+        logger.warning("Purge time budget exhausted", table=table, deleted=self.deleted.get(table, 0))
+        return False
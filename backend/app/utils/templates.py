@@ -0,0 +1,133 @@
+"""Template rendering utilities."""
+import calendar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    select_autoescape,
+)
+
+from app.core.config import settings
+from app.schemas.finance import AnnualAnalytics, MonthlyAnalytics
+from app.utils.helpers import format_currency
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def format_grams(amount: float) -> str:
+    """Format a precious metal amount in grams."""
+    return f"{amount:,.2f} g"
+
+
+def month_name(month: int) -> str:
+    """Get English name of a month number."""
+    return calendar.month_name[month]
+
+
+@lru_cache
+def get_environment() -> Environment:
+    """
+    Get the template environment of the process.
+    
+    Templates are compiled on first use and kept in memory; compiled
+    bytecode is also cached on disk so new worker processes skip parsing.
+    HTML templates are autoescaped, text templates are not.
+    
+    Returns:
+        Template environment
+    """
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(["html"], default_for_string=False),
+        bytecode_cache=FileSystemBytecodeCache(settings.TEMPLATE_CACHE_DIR),
+        auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+        undefined=StrictUndefined,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    environment.filters["currency"] = format_currency
+    environment.filters["grams"] = format_grams
+    environment.filters["month_name"] = month_name
+    environment.globals["app_name"] = settings.APP_NAME
+    environment.globals["frontend_url"] = settings.FRONTEND_URL
+    return environment
+
+
+def get_template(name: str) -> Template:
+    """
+    Get a compiled template.
+    
+    Args:
+        name: Template path relative to the templates directory
+        
+    Returns:
+        Compiled template
+    """
+    return get_environment().get_template(name)
+
+
+def render(name: str, **context: Any) -> str:
+    """
+    Render a template.
+    
+    Args:
+        name: Template path relative to the templates directory
+        **context: Template variables
+        
+    Returns:
+        Rendered template
+    """
+    return get_template(name).render(**context)
+
+
+def render_email(name: str, **context: Any) -> Tuple[str, str, Optional[str]]:
+    """
+    Render an email from ``emails/<name>.txt`` and ``emails/<name>.html``.
+    
+    The subject is the first line of the text template.
+    
+    Args:
+        name: Email template name
+        **context: Template variables
+        
+    Returns:
+        Tuple of (subject, plain text body, HTML body)
+    """
+    subject, _, body = render(f"emails/{name}.txt", **context).partition("\n")
+    html = render(f"emails/{name}.html", **context)
+    return subject.strip(), body.lstrip("\n"), html
+
+
+def render_monthly_report(analytics: MonthlyAnalytics, format: str = "html") -> str:
+    """
+    Render a monthly report.
+    
+    Args:
+        analytics: Monthly analytics
+        format: Output format, ``html`` or ``txt``
+        
+    Returns:
+        Rendered report
+    """
+    return render(f"reports/monthly.{format}", report=analytics)
+
+
+def render_annual_report(analytics: AnnualAnalytics, format: str = "html") -> str:
+    """
+    Render an annual report.
+    
+    Args:
+        analytics: Annual analytics
+        format: Output format, ``html`` or ``txt``
+        
+    Returns:
+        Rendered report
+    """
+    return render(f"reports/annual.{format}", report=analytics)
@@ -0,0 +1,102 @@
+"""Partition daily_entries by year and notifications by month
+
+Revision ID: 002_partitioning
+Revises: 001_initial
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_partitioning'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+# table -> (partition column, interval, secondary indexes)
+PARTITIONED_TABLES = {
+    'daily_entries': ('date', 'year', ['user_id', 'date', 'is_deleted']),
+    'notifications': ('created_at', 'month', ['user_id', 'is_read', 'is_deleted']),
+}
+
+
+def _next_bound(lower: date, interval: str) -> date:
+    if interval == 'year':
+        return date(lower.year + 1, 1, 1)
+    if lower.month == 12:
+        return date(lower.year + 1, 1, 1)
+    return date(lower.year, lower.month + 1, 1)
+
+
+def _lower_bound(day: date, interval: str) -> date:
+    if interval == 'year':
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def _partition_name(table: str, lower: date, interval: str) -> str:
+    if interval == 'year':
+        return f'{table}_y{lower.year}'
+    return f'{table}_m{lower.year}_{lower.month:02d}'
+
+
+def _swap_tables(table: str, key: str, indexes: list, partitioned: bool) -> None:
+    """Rebuild a table as (non-)partitioned and copy its rows over."""
+    legacy = f'{table}_legacy'
+    for column in indexes:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+    op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+    op.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey')
+    op.execute(f'ALTER TABLE {legacy} RENAME CONSTRAINT {table}_user_id_fkey TO {legacy}_user_id_fkey')
+    
+    partition_clause = f' PARTITION BY RANGE ({key})' if partitioned else ''
+    op.execute(f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS){partition_clause}')
+    primary_key = f'id, {key}' if partitioned else 'id'
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})')
+    op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'], ondelete='CASCADE')
+    for column in indexes:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+
+def _finish_swap(table: str) -> None:
+    legacy = f'{table}_legacy'
+    op.execute(f'INSERT INTO {table} SELECT * FROM {legacy}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {legacy}')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    today = date.today()
+    
+    for table, (key, interval, indexes) in PARTITIONED_TABLES.items():
+        oldest = bind.execute(sa.text(f'SELECT min({key}) FROM {table}')).scalar()
+        if isinstance(oldest, datetime):
+            oldest = oldest.date()
+        start = _lower_bound(min(oldest or today, today), interval)
+        end = _next_bound(_lower_bound(today, interval), interval)
+        
+        _swap_tables(table, key, indexes, partitioned=True)
+        
+        lower = start
+        while lower <= end:
+            upper = _next_bound(lower, interval)
+            op.execute(
+                f'CREATE TABLE {_partition_name(table, lower, interval)} PARTITION OF {table} '
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            lower = upper
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+        
+        _finish_swap(table)
+
+
+def downgrade() -> None:
+    for table, (key, interval, indexes) in PARTITIONED_TABLES.items():
+        _swap_tables(table, key, indexes, partitioned=False)
+        _finish_swap(table)
@@ -0,0 +1,37 @@
+"""Unique monthly goal per user and month
+
+Revision ID: 003_goal_unique
+Revises: 002_partitioning
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_goal_unique'
+down_revision = '002_partitioning'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep one goal of each month, live goals before soft-deleted ones and
+    # then the oldest; duplicates come from concurrent first reads
+    op.execute(
+        'DELETE FROM monthly_goals WHERE id IN ('
+        'SELECT id FROM ('
+        'SELECT id, ROW_NUMBER() OVER ('
+        'PARTITION BY user_id, year, month ORDER BY is_deleted, id'
+        ') AS rank FROM monthly_goals'
+        ') ranked WHERE rank > 1'
+        ')'
+    )
+    op.create_unique_constraint(
+        'uq_monthly_goals_user_year_month', 'monthly_goals', ['user_id', 'year', 'month']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_monthly_goals_user_year_month', 'monthly_goals', type_='unique')
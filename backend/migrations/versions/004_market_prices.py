@@ -0,0 +1,49 @@
+"""Market prices and investment symbols
+
+Revision ID: 004_market_prices
+Revises: 003_goal_unique
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_market_prices'
+down_revision = '003_goal_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('investments', sa.Column('symbol', sa.String(length=50), nullable=True))
+    op.create_index(op.f('ix_investments_symbol'), 'investments', ['symbol'], unique=False)
+    
+    # Create market_prices table
+    op.create_table(
+        'market_prices',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.Column('instrument', sa.String(length=50), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('instrument', 'date', name='uq_market_prices_instrument_date')
+    )
+    op.create_index(op.f('ix_market_prices_id'), 'market_prices', ['id'], unique=False)
+    op.create_index(op.f('ix_market_prices_date'), 'market_prices', ['date'], unique=False)
+    op.create_index(op.f('ix_market_prices_is_deleted'), 'market_prices', ['is_deleted'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_market_prices_is_deleted'), table_name='market_prices')
+    op.drop_index(op.f('ix_market_prices_date'), table_name='market_prices')
+    op.drop_index(op.f('ix_market_prices_id'), table_name='market_prices')
+    op.drop_table('market_prices')
+    
+    op.drop_index(op.f('ix_investments_symbol'), table_name='investments')
+    op.drop_column('investments', 'symbol')
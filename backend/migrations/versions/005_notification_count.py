@@ -0,0 +1,28 @@
+"""Notification digest count
+
+Revision ID: 005_notification_count
+Revises: 004_market_prices
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_notification_count'
+down_revision = '004_market_prices'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Added to the partitioned parent, propagates to every partition
+    op.add_column(
+        'notifications',
+        sa.Column('count', sa.Integer(), server_default='1', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('notifications', 'count')
@@ -0,0 +1,35 @@
+"""Investment listing sort indexes
+
+Revision ID: 006_investment_sort_indexes
+Revises: 005_notification_count
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_investment_sort_indexes'
+down_revision = '005_notification_count'
+branch_labels = None
+depends_on = None
+
+# Sort keys of GET /investments, each paged by (user_id, key, id)
+SORT_COLUMNS = ['purchase_date', 'amount', 'name']
+
+
+def upgrade() -> None:
+    for column in SORT_COLUMNS:
+        op.create_index(
+            f'ix_investments_user_{column}',
+            'investments',
+            ['user_id', column, 'id'],
+            unique=False,
+            postgresql_where=sa.text('NOT is_deleted'),
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(SORT_COLUMNS):
+        op.drop_index(f'ix_investments_user_{column}', table_name='investments')
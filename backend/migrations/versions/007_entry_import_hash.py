@@ -0,0 +1,32 @@
+"""Import hash of daily entries
+
+Revision ID: 007_entry_import_hash
+Revises: 006_investment_sort_indexes
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_entry_import_hash'
+down_revision = '006_investment_sort_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('daily_entries', sa.Column('import_hash', sa.String(length=64), nullable=True))
+    # Created on the partitioned parent, so every partition gets it
+    op.create_index(
+        'uq_daily_entries_user_date_import_hash',
+        'daily_entries',
+        ['user_id', 'date', 'import_hash'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_daily_entries_user_date_import_hash', table_name='daily_entries')
+    op.drop_column('daily_entries', 'import_hash')
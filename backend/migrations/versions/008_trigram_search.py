@@ -0,0 +1,45 @@
+"""Trigram search indexes
+
+Revision ID: 008_trigram_search
+Revises: 007_entry_import_hash
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_trigram_search'
+down_revision = '007_entry_import_hash'
+branch_labels = None
+depends_on = None
+
+# Text columns matched by /entries/search and /investments/search
+SEARCH_COLUMNS = {
+    'daily_entries': ['income_description', 'expense_description', 'notes'],
+    'investments': ['name', 'notes'],
+}
+
+
+def upgrade() -> None:
+    # Enabled by the Docker init script only in the main database
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            # On daily_entries created on the partitioned parent, so every partition gets it
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_where=sa.text('NOT is_deleted'),
+            )
+
+
+def downgrade() -> None:
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
@@ -0,0 +1,34 @@
+"""Delta sync indexes
+
+Revision ID: 009_sync_indexes
+Revises: 008_trigram_search
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009_sync_indexes'
+down_revision = '008_trigram_search'
+branch_labels = None
+depends_on = None
+
+# User-owned tables read by GET /sync in (updated_at, id) order
+SYNC_TABLES = ['daily_entries', 'investments', 'monthly_goals', 'notifications']
+
+
+def upgrade() -> None:
+    for table in SYNC_TABLES:
+        # On partitioned tables created on the parent, so every partition gets it
+        op.create_index(
+            f'ix_{table}_user_updated_at',
+            table,
+            ['user_id', 'updated_at', 'id'],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for table in SYNC_TABLES:
+        op.drop_index(f'ix_{table}_user_updated_at', table_name=table)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark XIRR solving."""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from app.services.returns import pad_cash_flows, xirr_batch, xirr_scalar
+
+
+def random_flows(rng: random.Random, purchases: int):
+    """Build a series of purchases followed by a final value."""
+    flows = sorted(
+        ((-rng.uniform(10, 1000), rng.uniform(0, 10)) for _ in range(rng.randint(1, purchases))),
+        key=lambda flow: flow[1],
+    )
+    total = -sum(amount for amount, _ in flows)
+    return flows + [(total * rng.uniform(0.3, 3), flows[-1][1] + rng.uniform(0.1, 2))]
+
+
+def main():
+    """Compare the vectorized solver against the scalar reference."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--series", type=int, default=1000, help="Cash flow series to solve")
+    parser.add_argument("-p", "--purchases", type=int, default=12, help="Maximum purchases per series")
+    args = parser.parse_args()
+    
+    rng = random.Random(42)
+    series = [random_flows(rng, args.purchases) for _ in range(args.series)]
+    print(f"=== Solving {args.series} XIRRs of up to {args.purchases + 1} cash flows ===\n")
+    
+    start = time.perf_counter()
+    expected = [xirr_scalar(flows) for flows in series]
+    scalar = time.perf_counter() - start
+    print(f"{'Scalar reference':<20} {scalar * 1000:9.1f} ms")
+    
+    start = time.perf_counter()
+    rates = xirr_batch(*pad_cash_flows(series))
+    batch = time.perf_counter() - start
+    print(f"{'Vectorized batch':<20} {batch * 1000:9.1f} ms  ({scalar / batch:.1f}x)")
+    
+    error = max(
+        abs(rate - reference) for rate, reference in zip(rates, expected) if reference is not None
+    )
+    unsolved = sum(np.isnan(rates))
+    print(f"\nMax difference: {error:.2e}, unsolvable series: {unsolved}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark report template rendering."""
+import argparse
+import random
+import time
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app.schemas.finance import CategoryBreakdown, MonthlyAnalytics
+from app.utils.templates import TEMPLATES_DIR, get_environment, render_email
+
+
+def sample_report() -> MonthlyAnalytics:
+    """Build a monthly report with random figures."""
+    income = random.uniform(3000, 15000)
+    expense = random.uniform(1000, income)
+    categories = ["FOOD", "TRANSPORT", "HOUSING", "ENTERTAINMENT", "HEALTH"]
+    return MonthlyAnalytics(
+        year=2026,
+        month=random.randint(1, 12),
+        total_income=income,
+        total_expense=expense,
+        net_income=income - expense,
+        total_gold=random.uniform(0, 20),
+        total_silver=random.uniform(0, 200),
+        category_breakdown=[
+            CategoryBreakdown(category=c, amount=expense / len(categories), percentage=100 / len(categories))
+            for c in categories
+        ],
+    )
+
+
+def benchmark(label: str, render, reports) -> None:
+    """Render every report and print throughput."""
+    start = time.perf_counter()
+    for report in reports:
+        render(report)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms  {len(reports) / elapsed:10.0f} renders/s")
+
+
+def main():
+    """Compare cached templates against parsing on every render."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--renders", type=int, default=2000, help="Reports to render")
+    args = parser.parse_args()
+    
+    reports = [sample_report() for _ in range(args.renders)]
+    print(f"=== Rendering {args.renders} monthly report emails ===\n")
+    
+    def uncached(report):
+        environment = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            autoescape=select_autoescape(["html"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        environment.filters.update(get_environment().filters)
+        environment.globals.update(get_environment().globals)
+        for name in ("emails/monthly_report.txt", "emails/monthly_report.html"):
+            environment.get_template(name).render(report=report)
+    
+    benchmark("Parsed per render", uncached, reports)
+    
+    start = time.perf_counter()
+    render_email("monthly_report", report=reports[0])
+    print(f"{'First cached render':<28} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    
+    benchmark("Cached templates", lambda report: render_email("monthly_report", report=report), reports)
+
+
+if __name__ == "__main__":
+    main()
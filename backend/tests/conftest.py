@@ -7,6 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from app.core.config import settings
 from app.core.database import Base
 from app.models import *  # noqa
+from app.schemas.user import UserCreate
+from app.services.auth import auth_service
+from app.services.finance import finance_service
+from app.services.notification import notification_service
 
 
 # Test database URL
@@ -56,3 +60,11 @@ def test_user_data():
         "full_name": "Test User",
         "password": "testpassword123",
     }
+
+
+@pytest.fixture
+async def user(db: AsyncSession, test_user_data):
+    """Registered test user, with investment and unread count caches of earlier tests dropped."""
+    await finance_service.invalidate_investment_caches()
+    await notification_service.invalidate_unread_counts()
+    return await auth_service.register(db, UserCreate(**test_user_data))
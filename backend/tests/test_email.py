@@ -0,0 +1,171 @@
+"""Email delivery tests."""
+import socket
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from celery.exceptions import Retry
+
+from app.core.config import settings
+from app.schemas.finance import MonthlyAnalytics
+from app.tasks import email_tasks
+from app.utils import email
+
+
+class RecordingHandler:
+    """SMTP handler recording sessions and delivered messages."""
+    
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.sessions = 0
+        self.recipients = []
+    
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+    
+    async def handle_DATA(self, server, session, envelope):
+        if self.failures:
+            self.failures -= 1
+            return "451 Try again later"
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """Start a local SMTP server and point settings at it."""
+    servers = []
+    
+    def start(handler: RecordingHandler) -> RecordingHandler:
+        port = free_port()
+        controller = Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        servers.append(controller)
+        monkeypatch.setattr(settings, "SMTP_ENABLED", True)
+        monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "SMTP_PORT", port)
+        monkeypatch.setattr(settings, "SMTP_USER", "")
+        monkeypatch.setattr(settings, "SMTP_PASSWORD", "")
+        monkeypatch.setattr(settings, "SMTP_START_TLS", False)
+        monkeypatch.setattr(settings, "SMTP_POOL_SIZE", 2)
+        monkeypatch.setattr(settings, "SMTP_BATCH_SIZE", 5)
+        monkeypatch.setattr(settings, "SMTP_RETRY_BACKOFF", 0.01)
+        monkeypatch.setattr(email, "_pool", None)
+        return handler
+    
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_messages_reuses_connections(smtp_server):
+    """Test a large batch is delivered over a few pooled connections."""
+    handler = smtp_server(RecordingHandler())
+    recipients = [f"user{i}@test.com" for i in range(23)]
+    messages = [email.build_message(address, "Report", "Body") for address in recipients]
+    
+    undelivered = await email.send_messages(messages)
+    
+    assert undelivered == []
+    assert sorted(handler.recipients) == sorted(recipients)
+    assert handler.sessions <= settings.SMTP_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_send_messages_retries_transient_failures(smtp_server):
+    """Test a temporary 4xx rejection is retried until delivered."""
+    handler = smtp_server(RecordingHandler(failures=2))
+    
+    undelivered = await email.send_messages([email.build_message("retry@test.com", "Report", "Body")])
+    
+    assert undelivered == []
+    assert handler.recipients == ["retry@test.com"]
+
+
+@pytest.mark.asyncio
+async def test_send_messages_replaces_spent_connections(smtp_server, monkeypatch):
+    """Test a connection carries at most the configured number of messages."""
+    monkeypatch.setattr(settings, "SMTP_MAX_MESSAGES_PER_CONNECTION", 2)
+    handler = smtp_server(RecordingHandler())
+    messages = [email.build_message(f"user{i}@test.com", "Report", "Body") for i in range(10)]
+    
+    undelivered = await email.send_messages(messages)
+    
+    assert undelivered == []
+    # Two messages per connection at most, batches may share the rest
+    assert handler.sessions >= 5
+
+
+@pytest.mark.asyncio
+async def test_send_messages_gives_up_batches_on_login_failure(smtp_server, monkeypatch):
+    """Test a rejected login fails the remaining messages instead of one login per message."""
+    smtp_server(RecordingHandler())
+    attempts = []
+    
+    async def connect(self):
+        attempts.append(1)
+        raise aiosmtplib.SMTPAuthenticationError(535, "Authentication failed")
+    
+    monkeypatch.setattr(email.SMTPPool, "_connect", connect)
+    messages = [email.build_message(f"user{i}@test.com", "Report", "Body") for i in range(20)]
+    
+    undelivered = await email.send_messages(messages)
+    
+    assert undelivered == messages
+    assert len(attempts) <= settings.SMTP_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_send_messages_gives_up_batches_when_server_is_down(smtp_server, monkeypatch):
+    """Test an unreachable server is retried per batch, not per message."""
+    smtp_server(RecordingHandler())
+    monkeypatch.setattr(settings, "SMTP_PORT", free_port())
+    attempts = []
+    connect = email.SMTPPool._connect
+    
+    async def counting_connect(self):
+        attempts.append(1)
+        return await connect(self)
+    
+    monkeypatch.setattr(email.SMTPPool, "_connect", counting_connect)
+    messages = [email.build_message(f"user{i}@test.com", "Report", "Body") for i in range(20)]
+    
+    undelivered = await email.send_messages(messages)
+    
+    assert undelivered == messages
+    batches = len(messages) // settings.SMTP_BATCH_SIZE
+    assert len(attempts) <= batches * (settings.SMTP_MAX_RETRIES + 1)
+
+
+def test_send_monthly_reports_retries_only_undelivered(monkeypatch):
+    """Test the bulk report task retries with the reports not delivered only."""
+    report = MonthlyAnalytics(
+        year=2026, month=3, total_income=0, total_expense=0, net_income=0, total_gold=0, total_silver=0,
+        category_breakdown=[],
+    ).model_dump(mode="json")
+    reports = [[f"user{i}@test.com", report] for i in range(3)]
+    
+    async def send_messages(messages):
+        return [message for message in messages if message["To"] == "user1@test.com"]
+    
+    retried = []
+    
+    def retry(args):
+        retried.append(args)
+        return Retry()
+    
+    monkeypatch.setattr(email_tasks, "send_messages", send_messages)
+    monkeypatch.setattr(email_tasks.send_monthly_reports, "retry", retry)
+    
+    with pytest.raises(Retry):
+        email_tasks.send_monthly_reports(reports)
+    
+    assert retried == [[[reports[1]]]]
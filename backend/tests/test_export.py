@@ -0,0 +1,120 @@
+"""Data export tests."""
+import csv
+import gzip
+import io
+import json
+import os
+import time
+import pytest
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError
+from app.services.export import export_service
+from app.services.statement_import import statement_import_service
+from app.services.finance import finance_service
+from app.schemas.finance import DailyEntryCreate, MonthlyGoalUpdate
+from app.models.finance import ExpenseCategory
+
+
+@pytest.fixture
+async def user(db: AsyncSession, user, tmp_path, monkeypatch):
+    """Test user with a few records, exporting into a temporary directory."""
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+    
+    for day in range(1, 6):
+        await finance_service.create_entry(
+            db,
+            user.id,
+            DailyEntryCreate(date=date(2026, 1, day), expense=day, expense_category=ExpenseCategory.FOOD),
+        )
+    await finance_service.update_monthly_goal(db, user.id, 2026, 1, MonthlyGoalUpdate(income_goal=1))
+    return user
+
+
+@pytest.mark.asyncio
+async def test_export_jsonl(db: AsyncSession, user):
+    """Test JSON Lines export holds every record with plain values."""
+    progress = []
+    path = await export_service.export_user_data(
+        db, user.id, "jsonl", lambda record_type, written: progress.append((record_type, written))
+    )
+    
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    
+    assert [r["record_type"] for r in records] == ["daily_entry"] * 5 + ["monthly_goal"]
+    assert records[0]["date"] == "2026-01-01"
+    assert records[0]["expense_category"] == "FOOD"
+    assert progress == [("daily_entry", 2), ("daily_entry", 4), ("daily_entry", 5), ("monthly_goal", 1)]
+    assert [f["file_name"] for f in export_service.list_files(user.id)] == [path.name]
+    assert export_service.get_file(user.id, path.name) == path
+
+
+@pytest.mark.asyncio
+async def test_export_csv(db: AsyncSession, user):
+    """Test CSV export has one header and a row per record."""
+    path = await export_service.export_user_data(db, user.id, "csv")
+    
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    
+    assert len(rows) == 6
+    assert rows[-1]["record_type"] == "monthly_goal"
+    assert rows[-1]["income_goal"] == "1.0"
+    assert rows[-1]["date"] == ""
+
+
+@pytest.mark.asyncio
+async def test_get_file_rejects_foreign_exports(db: AsyncSession, user):
+    """Test users cannot reach other users' exports or other paths."""
+    path = await export_service.export_user_data(db, user.id)
+    
+    with pytest.raises(NotFoundError):
+        export_service.get_file(user.id + 1, path.name)
+    with pytest.raises(NotFoundError):
+        export_service.get_file(user.id, f"../{path.name}")
+
+
+@pytest.mark.asyncio
+async def test_write_report(db: AsyncSession, user):
+    """Test reports are compressed and listed with the user's exports."""
+    path = export_service.write_report(user.id, "annual-2026.html", "<h1>2026</h1>")
+    
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert file.read() == "<h1>2026</h1>"
+    
+    assert path.name.endswith(".annual-2026.html.gz")
+    assert [f["file_name"] for f in export_service.list_files(user.id)] == [path.name]
+    assert export_service.get_file(user.id, path.name) == path
+
+
+def test_file_names_are_unique(tmp_path, monkeypatch):
+    """Test exports started within the same second get distinct files."""
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path))
+    first = export_service.write_report(1, "annual-2026.html", "first")
+    second = export_service.write_report(1, "annual-2026.html", "second")
+    
+    assert first != second
+    assert len(export_service.list_files(1)) == 2
+
+
+def test_prune_and_delete_files(tmp_path, monkeypatch):
+    """Test old files are pruned and a user's files deleted with them."""
+    monkeypatch.setattr(settings, "EXPORT_DIR", str(tmp_path / "exports"))
+    monkeypatch.setattr(settings, "IMPORT_DIR", str(tmp_path / "imports"))
+    old = export_service.write_report(1, "annual-2025.html", "old")
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    recent = export_service.write_report(1, "annual-2026.html", "recent")
+    other = export_service.write_report(12, "annual-2026.html", "other")
+    upload_id = statement_import_service.store_upload(1, io.BytesIO(b"date,amount\n"))
+    
+    assert export_service.prune_files(3600) == 1
+    assert not old.exists() and recent.exists()
+    
+    assert export_service.delete_files(1) == 1
+    assert statement_import_service.delete_uploads(1) == 1
+    assert not recent.exists() and other.exists()
+    assert not statement_import_service.upload_path(1, upload_id).exists()
@@ -0,0 +1,401 @@
+"""Finance tests."""
+import json
+import pytest
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.auth import auth_service
+from app.core.cache import cache_set
+from app.core.config import settings
+from app.core.database import run_after_commit
+from app.core.exceptions import ValidationError
+from app.repositories.finance import daily_entry_repository, monthly_goal_repository
+from app.services.analytics import analytics_service
+from app.services.finance import finance_service
+from app.services.notification import notification_service, GOAL_REMINDER_TITLE
+from app.schemas.finance import (
+    DailyEntryCreate,
+    DailyEntryResponse,
+    InvestmentCreate,
+    MonthlyGoalUpdate,
+    YearlyGoalUpdate,
+)
+from app.schemas.user import UserCreate
+from app.models.finance import ExpenseCategory, InvestmentType
+
+
+@pytest.mark.asyncio
+async def test_get_entries_json_matches_response_schema(db: AsyncSession, user):
+    """Test database-built JSON has the same shape as the ORM path."""
+    for day in (1, 2, 3):
+        await finance_service.create_entry(
+            db,
+            user.id,
+            DailyEntryCreate(
+                date=date(2026, 1, day),
+                income=100.5 * day,
+                expense=20,
+                expense_category=ExpenseCategory.FOOD,
+                notes=f"Day {day}",
+            ),
+        )
+    
+    content = await finance_service.get_entries_json(
+        db, user.id, date(2026, 1, 1), date(2026, 1, 2)
+    )
+    entries = json.loads(content)
+    
+    assert [e["date"] for e in entries] == ["2026-01-02", "2026-01-01"]
+    assert set(entries[0]) == set(DailyEntryResponse.model_fields)
+    assert entries[0]["expense_category"] == "FOOD"
+    
+    parsed = [DailyEntryResponse.model_validate(e) for e in entries]
+    orm = await finance_service.get_entries(
+        db, user.id, date(2026, 1, 1), date(2026, 1, 2)
+    )
+    assert parsed == [DailyEntryResponse.model_validate(e) for e in orm]
+
+
+@pytest.mark.asyncio
+async def test_get_entries_json_empty_range(db: AsyncSession, user):
+    """Test empty date range yields an empty JSON array."""
+    content = await finance_service.get_entries_json(
+        db, user.id, date(2020, 1, 1), date(2020, 12, 31)
+    )
+    assert content == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_stream_by_date_range_chunks(db: AsyncSession, user):
+    """Test streamed date range yields every row in bounded chunks."""
+    for day in range(1, 8):
+        await finance_service.create_entry(
+            db, user.id, DailyEntryCreate(date=date(2026, 2, day), income=day)
+        )
+    
+    chunks = [
+        chunk
+        async for chunk in daily_entry_repository.stream_by_date_range(
+            db, user.id, date(2026, 2, 1), date(2026, 2, 28), chunk_size=3
+        )
+    ]
+    
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [e.date.day for chunk in chunks for e in chunk] == list(range(7, 0, -1))
+
+
+@pytest.mark.asyncio
+async def test_get_entries_date_range_cap(db: AsyncSession, user, monkeypatch):
+    """Test non-streaming date range reads refuse to exceed the cap."""
+    monkeypatch.setattr(settings, "ENTRIES_MAX_RESULTS", 2)
+    for day in (1, 2, 3):
+        await finance_service.create_entry(
+            db, user.id, DailyEntryCreate(date=date(2026, 3, day))
+        )
+    
+    with pytest.raises(ValidationError):
+        await finance_service.get_entries(db, user.id, date(2026, 3, 1), date(2026, 3, 31))
+    with pytest.raises(ValidationError):
+        await finance_service.get_entries_json(db, user.id, date(2026, 3, 1), date(2026, 3, 31))
+    
+    entries = await finance_service.get_entries(db, user.id, date(2026, 3, 1), date(2026, 3, 2))
+    assert len(entries) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_monthly_goal_is_idempotent(db: AsyncSession, user):
+    """Test repeated reads return the same goal created with defaults."""
+    first = await finance_service.get_or_create_monthly_goal(db, user.id, 2026, 4)
+    second = await finance_service.get_or_create_monthly_goal(db, user.id, 2026, 4)
+    
+    assert first.id == second.id
+    assert first.income_goal == settings.DEFAULT_MONTHLY_INCOME_GOAL
+    assert len(await monthly_goal_repository.get_by_year(db, user.id, 2026)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_monthly_goal_restores_deleted(db: AsyncSession, user):
+    """Test a soft-deleted goal comes back with defaults instead of None."""
+    goal = await finance_service.update_monthly_goal(
+        db, user.id, 2026, 5, MonthlyGoalUpdate(income_goal=1)
+    )
+    await monthly_goal_repository.delete(db, goal.id)
+    
+    restored = await finance_service.get_or_create_monthly_goal(db, user.id, 2026, 5)
+    
+    assert restored.id == goal.id
+    assert not restored.is_deleted
+    assert restored.income_goal == settings.DEFAULT_MONTHLY_INCOME_GOAL
+    assert len(await finance_service.get_yearly_goals(db, user.id, 2026, materialize=True)) == 12
+
+
+@pytest.mark.asyncio
+async def test_create_if_missing_skips_existing_goal(db: AsyncSession, user):
+    """Test conflicting insert returns nothing instead of a duplicate."""
+    values = {"income_goal": 1, "gold_goal": 2, "silver_goal": 3, "investment_goal": 4}
+    created = await monthly_goal_repository.create_if_missing(db, user.id, 2026, 5, values)
+    duplicate = await monthly_goal_repository.create_if_missing(db, user.id, 2026, 5, values)
+    
+    assert created is not None
+    assert duplicate is None
+
+
+@pytest.mark.asyncio
+async def test_update_monthly_goal_upserts(db: AsyncSession, user):
+    """Test updating a missing goal creates it and later updates keep other fields."""
+    created = await finance_service.update_monthly_goal(
+        db, user.id, 2026, 6, MonthlyGoalUpdate(income_goal=15000)
+    )
+    assert created.income_goal == 15000
+    assert created.gold_goal == settings.DEFAULT_MONTHLY_GOLD_GOAL
+    
+    updated = await finance_service.update_monthly_goal(
+        db, user.id, 2026, 6, MonthlyGoalUpdate(gold_goal=25)
+    )
+    assert updated.id == created.id
+    assert updated.income_goal == 15000
+    assert updated.gold_goal == 25
+
+
+@pytest.mark.asyncio
+async def test_get_yearly_goals_materialize(db: AsyncSession, user):
+    """Test materializing a year fills only the missing months."""
+    await finance_service.update_monthly_goal(
+        db, user.id, 2027, 3, MonthlyGoalUpdate(income_goal=1)
+    )
+    
+    assert len(await finance_service.get_yearly_goals(db, user.id, 2027)) == 1
+    
+    goals = await finance_service.get_yearly_goals(db, user.id, 2027, materialize=True)
+    assert [g.month for g in goals] == list(range(1, 13))
+    assert goals[2].income_goal == 1
+    assert goals[0].income_goal == settings.DEFAULT_MONTHLY_INCOME_GOAL
+
+
+@pytest.mark.asyncio
+async def test_update_yearly_goals_applies_template(db: AsyncSession, user):
+    """Test one template is applied to the selected months only."""
+    await finance_service.get_or_create_monthly_goal(db, user.id, 2027, 1)
+    
+    goals = await finance_service.update_yearly_goals(
+        db, user.id, 2027, YearlyGoalUpdate(silver_goal=42, months=[2, 1, 2])
+    )
+    
+    assert [g.month for g in goals] == [1, 2]
+    assert all(g.silver_goal == 42 for g in goals)
+    assert len(await finance_service.get_yearly_goals(db, user.id, 2027)) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_goal_reminders(db: AsyncSession, user):
+    """Test reminders go to users behind on goals, at most once per interval."""
+    on_track = await auth_service.register(
+        db,
+        UserCreate(email="track@test.com", username="ontrack", password="testpassword123"),
+    )
+    await finance_service.update_monthly_goal(
+        db, on_track.id, 2026, 7, MonthlyGoalUpdate(gold_goal=0, silver_goal=0)
+    )
+    await finance_service.create_entry(
+        db,
+        on_track.id,
+        DailyEntryCreate(date=date(2026, 7, 1), income=settings.DEFAULT_MONTHLY_INCOME_GOAL),
+    )
+    await finance_service.create_investment(
+        db,
+        on_track.id,
+        InvestmentCreate(
+            investment_type=InvestmentType.BONDS,
+            name="Monthly bonds",
+            amount=settings.DEFAULT_MONTHLY_INVESTMENT_GOAL,
+            purchase_date=date(2026, 7, 2),
+        ),
+    )
+    
+    created = await notification_service.create_goal_reminders(db, date(2026, 7, 15))
+    repeated = await notification_service.create_goal_reminders(db, date(2026, 7, 16))
+    too_early = await notification_service.create_goal_reminders(db, date(2026, 7, 1))
+    
+    assert (created, repeated, too_early) == (1, 0, 0)
+    notifications = await notification_service.get_notifications(db, user.id)
+    assert [n.title for n in notifications] == [GOAL_REMINDER_TITLE]
+    assert "0% of your investment goal with 48% of the month elapsed" in notifications[0].message
+    assert await notification_service.get_notifications(db, on_track.id) == []
+    
+    shards = [
+        await notification_service.create_goal_reminders(db, date(2026, 8, 15), shard, 2)
+        for shard in (user.id % 2, on_track.id % 2)
+    ]
+    assert shards == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_monthly_analytics_for_users_matches_single_user(db: AsyncSession, user):
+    """Test bulk monthly analytics equal the per-user computation."""
+    other = await auth_service.register(
+        db,
+        UserCreate(email="other@test.com", username="other", password="testpassword123"),
+    )
+    await finance_service.update_monthly_goal(
+        db, user.id, 2026, 8, MonthlyGoalUpdate(income_goal=500)
+    )
+    for day, category in ((1, ExpenseCategory.FOOD), (2, ExpenseCategory.FOOD), (3, ExpenseCategory.TRANSPORT)):
+        await finance_service.create_entry(
+            db,
+            user.id,
+            DailyEntryCreate(date=date(2026, 8, day), income=10, expense=5 * day, expense_category=category),
+        )
+    
+    bulk = await analytics_service.get_monthly_analytics_for_users(db, [user.id, other.id], 2026, 8)
+    
+    single = await analytics_service.get_monthly_analytics(db, user.id, 2026, 8)
+    by_category = lambda a: sorted(a.category_breakdown, key=lambda c: c.category)
+    assert bulk[user.id].model_dump(exclude={"category_breakdown"}) == single.model_dump(
+        exclude={"category_breakdown"}
+    )
+    assert by_category(bulk[user.id]) == by_category(single)
+    assert bulk[other.id].total_income == 0
+    assert bulk[other.id].category_breakdown == []
+
+
+async def create_investments(db, user, count):
+    for i in range(count):
+        await finance_service.create_investment(
+            db,
+            user.id,
+            InvestmentCreate(
+                investment_type=InvestmentType.STOCKS if i % 2 else InvestmentType.BONDS,
+                name=f"Lot {i}",
+                amount=100 * (1 + i % 3),
+                purchase_date=date(2026, 1, 1 + i),
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_investment_pages_follow_cursor(db: AsyncSession, user):
+    """Test keyset pages cover every investment once in sort order."""
+    await create_investments(db, user, 7)
+    
+    amounts, ids, cursor = [], [], None
+    while True:
+        page, total, cursor = await finance_service.get_investment_page(
+            db, user.id, sort="amount", cursor=cursor, limit=3
+        )
+        assert total == 7
+        amounts += [investment.amount for investment in page]
+        ids += [investment.id for investment in page]
+        if cursor is None:
+            break
+    
+    assert amounts == sorted(amounts)
+    assert sorted(ids) == sorted(set(ids)) and len(ids) == 7
+    
+    page, total, cursor = await finance_service.get_investment_page(
+        db,
+        user.id,
+        investment_type=InvestmentType.STOCKS,
+        start_date=date(2026, 1, 3),
+    )
+    assert [investment.name for investment in page] == ["Lot 5", "Lot 3"]
+    assert total == 2 and cursor is None
+
+
+@pytest.mark.asyncio
+async def test_investment_count_cache_invalidated_on_write(db: AsyncSession, user):
+    """Test cached listing counts follow investment writes."""
+    await create_investments(db, user, 2)
+    assert await finance_service.count_investments(db, user.id) == 2
+    
+    await create_investments(db, user, 1)
+    
+    assert await finance_service.count_investments(db, user.id) == 3
+
+
+@pytest.mark.asyncio
+async def test_investment_summary_invalidated_after_commit(db: AsyncSession, user):
+    """Test a summary cached between the write and its commit is dropped."""
+    await create_investments(db, user, 1)
+    # Concurrent read that still saw no investments
+    await cache_set(await finance_service._summary_cache_key(user.id), [], 60)
+    
+    await run_after_commit(db)
+    
+    assert len(await finance_service.get_investment_summary(db, user.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_investment_page_rejects_foreign_cursor(db: AsyncSession, user):
+    """Test sort keys are whitelisted and cursors bound to their sort order."""
+    await create_investments(db, user, 3)
+    _, _, cursor = await finance_service.get_investment_page(db, user.id, sort="name", limit=1)
+    
+    with pytest.raises(ValidationError):
+        await finance_service.get_investment_page(db, user.id, sort="-name", cursor=cursor)
+    with pytest.raises(ValidationError):
+        await finance_service.get_investment_page(db, user.id, sort="notes")
+    with pytest.raises(ValidationError):
+        await finance_service.get_investment_page(db, user.id, sort="name", cursor="not-a-cursor")
+
+
+@pytest.fixture
+async def trigram(db: AsyncSession):
+    """pg_trgm in the test database, created by migrations elsewhere."""
+    try:
+        await db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await db.commit()
+    except DBAPIError:
+        await db.rollback()
+        pytest.skip("pg_trgm is not available")
+
+
+@pytest.mark.asyncio
+async def test_search_entries_ranks_and_pages(db: AsyncSession, user, trigram):
+    """Test search matches misspelled words, ranks by similarity and pages by cursor."""
+    descriptions = ["Allegro order", "Zakupy allegro smart", "Biedronka", "Allegrp return"]
+    for day, description in enumerate(descriptions, start=1):
+        await finance_service.create_entry(
+            db,
+            user.id,
+            DailyEntryCreate(
+                date=date(2026, 1, day),
+                expense=10,
+                expense_category=ExpenseCategory.SHOPPING if day < 3 else ExpenseCategory.FOOD,
+                expense_description=description,
+            ),
+        )
+    
+    found, cursor = [], None
+    while True:
+        page, cursor = await finance_service.search_entries(db, user.id, "allegro", cursor=cursor, limit=1)
+        found += [entry.expense_description for entry in page]
+        if cursor is None:
+            break
+    
+    assert set(found[:2]) == {"Allegro order", "Zakupy allegro smart"}
+    assert found[2:] == ["Allegrp return"]
+    
+    page, _ = await finance_service.search_entries(
+        db, user.id, "allegro", category=ExpenseCategory.FOOD
+    )
+    assert [entry.expense_description for entry in page] == ["Allegrp return"]
+    
+    _, cursor = await finance_service.search_entries(db, user.id, "allegro", limit=1)
+    with pytest.raises(ValidationError):
+        await finance_service.search_entries(db, user.id, "order", cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_search_investments_by_name(db: AsyncSession, user, trigram):
+    """Test investment search matches names and honors listing filters."""
+    await create_investments(db, user, 4)
+    
+    page, cursor = await finance_service.search_investments(db, user.id, "Lot 3")
+    
+    assert page[0].name == "Lot 3" and cursor is None
+    page, _ = await finance_service.search_investments(
+        db, user.id, "lot", investment_type=InvestmentType.BONDS
+    )
+    assert sorted(investment.name for investment in page) == ["Lot 0", "Lot 2"]
@@ -0,0 +1,146 @@
+"""Bank statement import tests."""
+import io
+import pytest
+from datetime import date
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.repositories.finance import daily_entry_repository
+from app.services.statement_import import statement_import_service
+from app.schemas.finance import EntryImportMapping
+from app.models.finance import ExpenseCategory
+
+
+CSV_STATEMENT = """Data;Kwota;Opis;Kategoria
+05.01.2026;-12,50;Coffee;food
+05.01.2026;-12,50;Coffee;food
+06.01.2026;5 000,00;Salary;
+07.01.2026;abc;Broken;
+""".encode("utf-8")
+
+CSV_MAPPING = EntryImportMapping(
+    date="Data",
+    amount="Kwota",
+    description="Opis",
+    category="Kategoria",
+    date_format="%d.%m.%Y",
+    decimal_separator=",",
+)
+
+OFX_STATEMENT = b"""OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20260110120000[+1:CET]<TRNAMT>-42.00<FITID>T-1<NAME>Fuel &amp; Co</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20260111<TRNAMT>100.00<FITID>T-2<NAME>Refund<MEMO>Order 7</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+async def entries(db, user):
+    return await daily_entry_repository.get_by_date_range(db, user.id, date(2026, 1, 1), date(2026, 12, 31))
+
+
+@pytest.mark.asyncio
+async def test_import_csv_maps_columns_and_skips_duplicates(db: AsyncSession, user):
+    """Test CSV rows become entries once, also when imported again."""
+    result = await statement_import_service.import_file(
+        db, user.id, io.BytesIO(CSV_STATEMENT), "csv", CSV_MAPPING
+    )
+    
+    assert (result.rows, result.inserted, result.duplicates, result.skipped) == (4, 3, 0, 1)
+    assert result.errors[0].startswith("Row 5:")
+    
+    imported = await entries(db, user)
+    assert sorted(e.expense for e in imported) == [0, 12.5, 12.5]
+    salary = next(e for e in imported if e.income)
+    assert (salary.income, salary.income_description) == (5000, "Salary")
+    assert {e.expense_category for e in imported if e.expense} == {ExpenseCategory.FOOD}
+    
+    again = await statement_import_service.import_file(
+        db, user.id, io.BytesIO(CSV_STATEMENT), "csv", CSV_MAPPING
+    )
+    
+    assert (again.inserted, again.duplicates) == (0, 3)
+    assert len(await entries(db, user)) == 3
+
+
+
+@pytest.mark.asyncio
+async def test_import_csv_with_income_and_expense_columns(db: AsyncSession, user):
+    """Test separate income and expense columns replace the signed amount column."""
+    statement = b"date,amount,credit,debit,description\n2026-01-03,999,100,,Salary\n2026-01-04,999,,25.5,Shop\n"
+    mapping = EntryImportMapping(income="credit", expense="debit")
+    
+    result = await statement_import_service.import_file(db, user.id, io.BytesIO(statement), "csv", mapping)
+    
+    assert mapping.amount is None
+    assert result.inserted == 2
+    imported = sorted(await entries(db, user), key=lambda e: e.date)
+    assert [(e.income, e.expense) for e in imported] == [(100, 0), (0, 25.5)]
+    
+    without_amount = b"date,credit,debit,description\n2026-01-05,,7,Shop\n"
+    result = await statement_import_service.import_file(db, user.id, io.BytesIO(without_amount), "csv", mapping)
+    assert result.inserted == 1
+
+@pytest.mark.asyncio
+async def test_import_ofx_uses_bank_transaction_ids(db: AsyncSession, user):
+    """Test OFX transactions are parsed from SGML and deduplicated by FITID."""
+    result = await statement_import_service.import_file(db, user.id, io.BytesIO(OFX_STATEMENT), "ofx")
+    
+    assert (result.rows, result.inserted) == (2, 2)
+    imported = sorted(await entries(db, user), key=lambda e: e.date)
+    assert (imported[0].expense, imported[0].expense_description) == (42, "Fuel & Co")
+    assert imported[0].expense_category == ExpenseCategory.OTHER
+    assert (imported[1].income, imported[1].income_description) == (100, "Refund Order 7")
+    
+    again = await statement_import_service.import_file(db, user.id, io.BytesIO(OFX_STATEMENT), "ofx")
+    assert again.duplicates == 2
+
+
+@pytest.mark.asyncio
+async def test_import_inserts_in_batches(db: AsyncSession, user, monkeypatch):
+    """Test entries are written and reported batch by batch."""
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    lines = ["date,amount,description"] + [f"2026-02-{day:02d},-{day},Shop" for day in range(1, 8)]
+    progress = []
+    
+    result = await statement_import_service.import_file(
+        db,
+        user.id,
+        io.BytesIO("\n".join(lines).encode()),
+        "csv",
+        on_progress=lambda r: progress.append(r.inserted),
+    )
+    
+    assert result.inserted == 7
+    assert progress == [2, 4, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_import_skips_short_rows(db: AsyncSession, user):
+    """Test rows missing mapped cells, like statement footers, are skipped."""
+    statement = b"date,amount,description\n2026-01-01,-10,x\n2026-01-02\n"
+    
+    result = await statement_import_service.import_file(db, user.id, io.BytesIO(statement), "csv")
+    
+    assert (result.inserted, result.skipped) == (1, 1)
+    assert result.errors == ["Row 3: missing 'amount'"]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unmapped_columns(db: AsyncSession, user):
+    """Test mapped columns must exist in the file."""
+    with pytest.raises(ValidationError):
+        await statement_import_service.import_file(
+            db, user.id, io.BytesIO(b"when,what\n2026-01-01,1\n"), "csv"
+        )
+
+
+def test_mapping_rejects_unknown_encoding():
+    """Test unknown encodings fail validation instead of the import."""
+    with pytest.raises(PydanticValidationError):
+        EntryImportMapping(encoding="latin2x")
+    assert EntryImportMapping(encoding="cp1250").encoding == "cp1250"
@@ -0,0 +1,112 @@
+"""Background job tests."""
+import asyncio
+import random
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, RateLimitError
+from app.core.redis import RedisClient
+from app.services import jobs
+from app.services.jobs import job_service
+
+
+@pytest.fixture
+def states(monkeypatch):
+    """Celery states of jobs by ID, with tasks sent nowhere."""
+    states = {}
+    
+    class FakeResult:
+        def __init__(self, job_id, app=None):
+            self.state, self.info = states.get(job_id, ("PENDING", None))
+    
+    monkeypatch.setattr(jobs, "AsyncResult", FakeResult)
+    monkeypatch.setattr(jobs.celery_app, "send_task", lambda *args, **kwargs: None)
+    monkeypatch.setattr(settings, "JOBS_MAX_CONCURRENT_PER_USER", 2)
+    monkeypatch.setattr(settings, "JOBS_EVENTS_POLL_INTERVAL", 0.01)
+    return states
+
+
+@pytest.fixture
+def user_id():
+    """User ID without jobs of earlier tests."""
+    return random.randint(10**8, 10**9)
+
+
+@pytest.mark.asyncio
+async def test_submit_enforces_limit(states, user_id):
+    """Test users cannot run more jobs than allowed until one finishes."""
+    first = await job_service.submit(user_id, "export", {})
+    await job_service.submit(user_id, "export", {"format": "csv"})
+    with pytest.raises(RateLimitError):
+        await job_service.submit(user_id, "export", {})
+    
+    states[first.id] = ("SUCCESS", {"status": "success"})
+    await job_service.submit(user_id, "export", {})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_respect_limit(states, user_id):
+    """Test concurrent submits cannot all pass the limit."""
+    results = await asyncio.gather(
+        *(job_service.submit(user_id, "export", {}) for _ in range(6)),
+        return_exceptions=True,
+    )
+    
+    assert sum(not isinstance(r, Exception) for r in results) == 2
+    assert all(isinstance(r, RateLimitError) for r in results if isinstance(r, Exception))
+    redis = await RedisClient.get_client()
+    assert await redis.scard(job_service._active_key(user_id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_jobs_free_their_slot(states, user_id):
+    """Test jobs whose record expired no longer count as running."""
+    first = await job_service.submit(user_id, "export", {})
+    await job_service.submit(user_id, "export", {})
+    
+    redis = await RedisClient.get_client()
+    await redis.delete(job_service._job_key(first.id))
+    await job_service.submit(user_id, "export", {})
+
+
+@pytest.mark.asyncio
+async def test_get_checks_owner(states, user_id):
+    """Test jobs are only visible to their owner."""
+    job = await job_service.submit(user_id, "export", {})
+    states[job.id] = ("PROGRESS", {"records": {"daily_entry": 10}})
+    
+    fetched = await job_service.get(user_id, job.id)
+    assert fetched.status == "running"
+    assert fetched.progress == {"records": {"daily_entry": 10}}
+    with pytest.raises(NotFoundError):
+        await job_service.get(user_id + 1, job.id)
+    with pytest.raises(NotFoundError):
+        await job_service.get(user_id, "missing")
+
+
+@pytest.mark.asyncio
+async def test_stream_events_ends_with_done(states, user_id):
+    """Test the event stream reports progress and ends once the job finished."""
+    job = await job_service.submit(user_id, "export", {})
+    states[job.id] = ("PROGRESS", {"records": {}})
+    
+    events = []
+    async for event in job_service.stream_events(user_id, job.id):
+        events.append(event.decode().split("\n")[0])
+        states[job.id] = ("SUCCESS", {"status": "success"})
+    
+    assert events == ["event: progress", "event: done"]
+
+
+@pytest.mark.asyncio
+async def test_stream_events_ends_when_job_expires(states, user_id):
+    """Test the event stream ends quietly if the job record expires."""
+    job = await job_service.submit(user_id, "export", {})
+    redis = await RedisClient.get_client()
+    
+    events = []
+    async for event in job_service.stream_events(user_id, job.id):
+        events.append(event)
+        await redis.delete(job_service._job_key(job.id))
+    
+    assert len(events) == 1
@@ -0,0 +1,127 @@
+"""Data maintenance tests."""
+import pytest
+from datetime import date
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import Notification
+from app.repositories.partition import PartitionRepository
+from app.utils.purge import BatchedPurge
+
+
+async def count_notifications(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count()).select_from(Notification))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_batched_purge_deletes_matching_rows(db: AsyncSession, user):
+    """Test purge deletes matching rows in batches and keeps the rest."""
+    db.add_all(
+        Notification(user_id=user.id, title=f"N{i}", message="", notification_type="info", is_read=i < 5)
+        for i in range(7)
+    )
+    await db.commit()
+    
+    purge = BatchedPurge(batch_size=2, pause=0)
+    finished = await purge.purge(db, Notification, Notification.is_read == True)
+    
+    assert finished
+    assert purge.deleted == {"notifications": 5}
+    assert await count_notifications(db) == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_purge_respects_time_budget(db: AsyncSession, user):
+    """Test purge stops without deleting once the budget is spent."""
+    db.add(Notification(user_id=user.id, title="N", message="", notification_type="info"))
+    await db.commit()
+    
+    purge = BatchedPurge(batch_size=2, pause=0, time_budget=0)
+    
+    assert not await purge.purge(db, Notification)
+    assert await count_notifications(db) == 1
+
+
+def test_partition_bounds_and_names():
+    """Test partitions cover whole years or months, December included."""
+    yearly = PartitionRepository("events", "day", "year")
+    monthly = PartitionRepository("events", "day", "month")
+    
+    assert yearly.bounds(date(2026, 7, 15)) == (date(2026, 1, 1), date(2027, 1, 1))
+    assert monthly.bounds(date(2026, 7, 15)) == (date(2026, 7, 1), date(2026, 8, 1))
+    assert monthly.bounds(date(2026, 12, 31)) == (date(2026, 12, 1), date(2027, 1, 1))
+    assert yearly.partition_name(date(2026, 7, 15)) == "events_y2026"
+    assert monthly.partition_name(date(2026, 7, 15)) == "events_m2026_07"
+    with pytest.raises(ValueError):
+        PartitionRepository("events", "day", "week")
+
+
+def test_partition_names_parse_back():
+    """Test lower bounds are read from own partition names only."""
+    yearly = PartitionRepository("events", "day", "year")
+    monthly = PartitionRepository("events", "day", "month")
+    
+    assert yearly._parse_lower_bound("events_y2026") == date(2026, 1, 1)
+    assert monthly._parse_lower_bound("events_m2026_07") == date(2026, 7, 1)
+    assert yearly._parse_lower_bound("events_default") is None
+    assert yearly._parse_lower_bound("events_m2026_07") is None
+    assert monthly._parse_lower_bound("events_y2026") is None
+    assert monthly._parse_lower_bound("events_m2026_13") is None
+    assert monthly._parse_lower_bound("events_mold") is None
+
+
+@pytest.fixture
+async def events(db: AsyncSession):
+    """Scratch table partitioned by month, with a default partition."""
+    await db.execute(text("CREATE TABLE events (id serial, day date NOT NULL) PARTITION BY RANGE (day)"))
+    await db.execute(text("CREATE TABLE events_default PARTITION OF events DEFAULT"))
+    await db.commit()
+    yield PartitionRepository("events", "day", "month")
+    await db.rollback()
+    await db.execute(text("DROP TABLE IF EXISTS events CASCADE"))
+    await db.commit()
+
+
+async def partition_rows(db: AsyncSession, partition: str) -> int:
+    result = await db.execute(text(f"SELECT count(*) FROM {partition}"))
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_moves_default_rows(db: AsyncSession, events):
+    """Test partitions are created once and take over rows of the default partition."""
+    await db.execute(text("INSERT INTO events (day) VALUES ('2026-01-10'), ('2026-02-20'), ('2026-05-01')"))
+    
+    created = await events.ensure_partitions(db, date(2026, 1, 15), 3)
+    
+    assert created == ["events_m2026_01", "events_m2026_02", "events_m2026_03"]
+    assert await events.ensure_partitions(db, date(2026, 1, 15), 3) == []
+    assert await events.get_partitions(db) == created
+    assert await partition_rows(db, "events_m2026_01") == 1
+    assert await partition_rows(db, "events_m2026_02") == 1
+    assert await partition_rows(db, "events_default") == 1
+    assert await partition_rows(db, "events") == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_partitions_before_keeps_straddling(db: AsyncSession, events):
+    """Test only partitions entirely before the cutoff are dropped."""
+    await events.ensure_partitions(db, date(2026, 1, 1), 3)
+    await db.execute(text("INSERT INTO events (day) VALUES ('2026-01-10'), ('2026-02-20'), ('2026-03-05')"))
+    
+    dropped = await events.drop_partitions_before(db, date(2026, 2, 15))
+    
+    assert dropped == ["events_m2026_01"]
+    assert await events.get_partitions(db) == ["events_m2026_02", "events_m2026_03"]
+    assert await partition_rows(db, "events") == 2
+    assert await events.drop_partitions_before(db, date(2026, 3, 1)) == ["events_m2026_02"]
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_skips_plain_tables(db: AsyncSession):
+    """Test unpartitioned tables are left alone."""
+    partitions = PartitionRepository("notifications", "created_at", "month")
+    
+    assert await partitions.ensure_partitions(db, date(2026, 1, 1), 2) == []
+    assert await partitions.drop_partitions_before(db, date(2026, 1, 1)) == []
@@ -0,0 +1,128 @@
+"""Notification tests."""
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache_set
+from app.core.config import settings
+from app.core.database import run_after_commit
+from app.core.redis import RedisClient
+from app.services.auth import auth_service
+from app.services.notification import DIGEST_PENDING_KEY, _digest_keys, notification_service
+from app.schemas.user import UserCreate
+
+
+@pytest.mark.asyncio
+async def test_create_notifications_bulk(db: AsyncSession, user):
+    """Test bulk insert keeps digest counts and defaults the rest."""
+    created = await notification_service.create_notifications(
+        db,
+        [
+            {"user_id": user.id, "title": "Achievement unlocked", "message": "Latest", "count": 5},
+            {"user_id": user.id, "title": "Report ready", "message": "March"},
+        ],
+    )
+    
+    assert created == 2
+    notifications = await notification_service.get_notifications(db, user.id)
+    assert sorted((n.title, n.count, n.notification_type) for n in notifications) == [
+        ("Achievement unlocked", 5, "info"),
+        ("Report ready", 1, "info"),
+    ]
+    assert await notification_service.get_unread_count(db, user.id) == 2
+    assert await notification_service.create_notifications(db, []) == 0
+
+
+@pytest.mark.asyncio
+async def test_create_notifications_bulk_to_active_users(db: AsyncSession, user):
+    """Test broadcast reaches active users only, or the selected ones."""
+    other = await auth_service.register(
+        db,
+        UserCreate(email="other@test.com", username="other", password="testpassword123"),
+    )
+    inactive = await auth_service.register(
+        db,
+        UserCreate(email="inactive@test.com", username="inactive", password="testpassword123"),
+    )
+    inactive.is_active = False
+    await db.flush()
+    
+    assert await notification_service.get_unread_count(db, user.id) == 0
+    
+    everyone = await notification_service.create_notifications_bulk(db, "Maintenance", "Tonight", "warning")
+    selected = await notification_service.create_notifications_bulk(
+        db, "Beta", "New charts", user_ids=[other.id, inactive.id]
+    )
+    
+    assert (everyone, selected) == (2, 1)
+    assert await notification_service.get_unread_count(db, user.id) == 1
+    assert await notification_service.get_unread_count(db, other.id) == 2
+    assert await notification_service.get_notifications(db, inactive.id) == []
+    assert await notification_service.create_notifications_bulk(db, "None", "-", user_ids=[]) == 0
+
+
+@pytest.mark.asyncio
+async def test_unread_count_invalidated_after_commit(db: AsyncSession, user):
+    """Test a count cached between the write and its commit is dropped."""
+    await notification_service.create_notification(db, user.id, "Report ready", "March")
+    # Concurrent read that still saw the old row set
+    await cache_set(await notification_service._unread_count_key(user.id), 0, 60)
+    
+    await run_after_commit(db)
+    
+    assert await notification_service.get_unread_count(db, user.id) == 1
+
+
+@pytest.fixture
+def digests():
+    """Redis client with digest buffers of earlier tests dropped."""
+    redis = RedisClient.get_sync_client()
+    for buffer_id in redis.smembers(DIGEST_PENDING_KEY):
+        redis.delete(*_digest_keys(buffer_id))
+    redis.delete(DIGEST_PENDING_KEY)
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_flush_digests_merges_closed_windows(db: AsyncSession, user, digests):
+    """Test notifications of one window, type and title become one row with count and latest message."""
+    start = datetime.fromtimestamp(
+        int(datetime(2026, 3, 2, 10).timestamp()) // settings.NOTIFICATION_DIGEST_WINDOW
+        * settings.NOTIFICATION_DIGEST_WINDOW
+    )
+    window = timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+    queue = notification_service.queue_notification
+    for minute, message in enumerate(["First", "Second", "Latest"]):
+        queue(user.id, "Achievement unlocked", message, "success", now=start + timedelta(minutes=minute))
+    queue(user.id, "Achievement unlocked", "Other type", "info", now=start)
+    queue(user.id, "Report ready", "March", "info", now=start + timedelta(minutes=1))
+    queue(user.id, "Achievement unlocked", "Next window", "success", now=start + window)
+    
+    created = await notification_service.flush_digests(db, now=start + window + timedelta(minutes=1))
+    
+    assert created == 3
+    notifications = await notification_service.get_notifications(db, user.id)
+    assert sorted((n.title, n.notification_type, n.count, n.message) for n in notifications) == [
+        ("Achievement unlocked", "info", 1, "Other type"),
+        ("Achievement unlocked", "success", 3, "Latest"),
+        ("Report ready", "info", 1, "March"),
+    ]
+    latest = next(n for n in notifications if n.count == 3)
+    assert latest.created_at == start + timedelta(minutes=2)
+    
+    # The open window stays buffered until it closed
+    buffer_id = f"{start.date().isoformat()}:{user.id}"
+    counts_key, payloads_key = _digest_keys(buffer_id)
+    next_window = int((start + window).timestamp()) // settings.NOTIFICATION_DIGEST_WINDOW
+    open_field = json.dumps([next_window, "success", "Achievement unlocked"])
+    assert digests.hgetall(counts_key) == {open_field: "1"}
+    assert list(digests.hgetall(payloads_key)) == [open_field]
+    
+    created = await notification_service.flush_digests(db, now=start + 2 * window)
+    
+    assert created == 1
+    assert digests.hgetall(counts_key) == {}
+    assert digests.hgetall(payloads_key) == {}
+    assert len(await notification_service.get_notifications(db, user.id)) == 4
+    assert await notification_service.flush_digests(db, now=start + 2 * window) == 0
@@ -0,0 +1,93 @@
+"""Portfolio valuation tests."""
+import pytest
+from datetime import date, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.finance import finance_service
+from app.services.portfolio import portfolio_service
+from app.repositories.finance import investment_repository, market_price_repository
+from app.schemas.finance import InvestmentCreate
+from app.models.finance import InvestmentType
+
+
+async def buy(db, user, investment_type, day, amount, quantity=None, current_value=None):
+    await finance_service.create_investment(
+        db,
+        user.id,
+        InvestmentCreate(
+            investment_type=investment_type,
+            name=investment_type.value,
+            amount=amount,
+            quantity=quantity,
+            purchase_date=day,
+            current_value=current_value,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_history_values_holdings_at_carried_prices(db: AsyncSession, user):
+    """Test daily values combine cumulative holdings with carried forward prices."""
+    start = date.today() - timedelta(days=10)
+    await buy(db, user, InvestmentType.GOLD, start, 600, quantity=2)
+    await buy(db, user, InvestmentType.BONDS, start + timedelta(days=1), 1000)
+    await buy(db, user, InvestmentType.SILVER, start + timedelta(days=2), 50, quantity=10)
+    await market_price_repository.upsert_prices(db, start - timedelta(days=5), {"XAU": 300}, "test")
+    await market_price_repository.upsert_prices(db, start + timedelta(days=3), {"XAU": 350}, "test")
+    
+    history = await portfolio_service.get_history(
+        db, user.id, start - timedelta(days=1), start + timedelta(days=4)
+    )
+    
+    assert [(p.value, p.invested) for p in history] == [
+        (600, 600),
+        (1600, 1600),
+        (1650, 1650),
+        (1750, 1650),
+        (1750, 1650),
+    ]
+    assert history[0].date == start
+    unbounded = await portfolio_service.get_history(db, user.id, date.min, start)
+    assert [(p.date, p.value) for p in unbounded] == [(start, 600)]
+
+
+@pytest.mark.asyncio
+async def test_history_samples_period_ends(db: AsyncSession, user):
+    """Test weekly and monthly steps keep the last day of every period."""
+    today = date.today()
+    await buy(db, user, InvestmentType.BONDS, today - timedelta(days=60), 100)
+    
+    weekly = await portfolio_service.get_history(db, user.id, today - timedelta(days=27), today, "week")
+    monthly = await portfolio_service.get_history(
+        db, user.id, today - timedelta(days=45), today + timedelta(days=30), "month"
+    )
+    
+    assert all(p.date.weekday() == 6 for p in weekly[:-1])
+    assert weekly[-1].date == today
+    assert all((p.date + timedelta(days=1)).day == 1 for p in monthly[:-1])
+    assert monthly[-1].date == today
+    assert {p.value for p in weekly + monthly} == {100}
+
+
+@pytest.mark.asyncio
+async def test_summary_by_type_profit_and_weights(db: AsyncSession, user):
+    """Test summary computes P/L, returns, weights and holding periods per type."""
+    await buy(db, user, InvestmentType.GOLD, date(2026, 1, 1), 600, current_value=900)
+    await buy(db, user, InvestmentType.BONDS, date(2026, 1, 11), 1000)
+    await buy(db, user, InvestmentType.BONDS, date(2026, 1, 21), 500, current_value=400)
+    
+    summary = await investment_repository.get_summary_by_type(db, user.id, date(2026, 1, 31))
+    
+    bonds, gold = summary
+    assert bonds["investment_type"] == InvestmentType.BONDS
+    assert (bonds["total_amount"], bonds["total_current_value"], bonds["market_value"]) == (1500, 400, 1400)
+    assert bonds["unrealized_pl"] == -100
+    assert bonds["return_percentage"] == pytest.approx(-6.6667, abs=1e-3)
+    assert bonds["weight"] == pytest.approx(1400 / 2300 * 100)
+    assert (bonds["oldest_purchase_date"], bonds["newest_purchase_date"]) == (date(2026, 1, 11), date(2026, 1, 21))
+    assert bonds["average_holding_days"] == 15
+    assert (gold["unrealized_pl"], gold["return_percentage"], gold["count"]) == (300, 50, 1)
+    assert gold["weight"] + bonds["weight"] == pytest.approx(100)
+    
+    cached = await finance_service.get_investment_summary(db, user.id)
+    assert [item.market_value for item in cached] == [1400, 900]
@@ -0,0 +1,92 @@
+"""Market price tests."""
+import pytest
+from pathlib import Path
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.finance import finance_service
+from app.services.prices import FilePriceProvider, price_service
+from app.repositories.finance import market_price_repository
+from app.schemas.finance import InvestmentCreate
+from app.models.finance import InvestmentType
+
+
+PRICES_FILE = Path(__file__).parent / "fixtures" / "prices.csv"
+
+
+class CountingProvider(FilePriceProvider):
+    """File provider recording requested instruments."""
+    
+    def __init__(self, path):
+        super().__init__(path)
+        self.requests = []
+    
+    async def get_prices(self, instruments, day):
+        self.requests.append(list(instruments))
+        return await super().get_prices(instruments, day)
+
+
+async def create_investment(db, user, investment_type, quantity=None, symbol=None):
+    return await finance_service.create_investment(
+        db,
+        user.id,
+        InvestmentCreate(
+            investment_type=investment_type,
+            name=f"{investment_type.value} {symbol or ''}",
+            symbol=symbol,
+            amount=100,
+            quantity=quantity,
+            purchase_date=date(2026, 1, 1),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_provider_uses_latest_price_on_or_before_day():
+    """Test file provider picks the latest known price."""
+    provider = FilePriceProvider(str(PRICES_FILE))
+    
+    prices = await provider.get_prices(["XAU", "AAPL", "MSFT"], date(2026, 10, 1))
+    
+    assert prices == {"XAU": 410.5}
+
+
+@pytest.mark.asyncio
+async def test_revalue_investments(db: AsyncSession, user):
+    """Test revaluation prices each instrument once and sets quantity times price."""
+    gold = [await create_investment(db, user, InvestmentType.GOLD, quantity=q) for q in (2, 3)]
+    silver = await create_investment(db, user, InvestmentType.SILVER, quantity=10)
+    stock = await create_investment(db, user, InvestmentType.STOCKS, quantity=1, symbol="MSFT")
+    savings = await create_investment(db, user, InvestmentType.SAVINGS)
+    provider = CountingProvider(str(PRICES_FILE))
+    
+    stats = await price_service.revalue_investments(db, provider, date(2026, 10, 1), batch_size=2)
+    
+    assert stats == {"updated_count": 3, "instruments": 3, "missing_instruments": ["MSFT"]}
+    assert provider.requests == [["MSFT", "XAG", "XAU"]]
+    for investment in gold + [silver, stock, savings]:
+        await db.refresh(investment)
+    assert [g.current_value for g in gold] == [821.0, 1231.5]
+    assert silver.current_value == pytest.approx(42.0)
+    assert stock.current_value is None
+    assert savings.current_value is None
+    
+    stored = await market_price_repository.get_prices(db, ["XAU", "XAG"], date(2026, 10, 1))
+    assert stored == {"XAU": 410.5, "XAG": 4.2}
+    
+    await price_service.revalue_investments(db, provider, date(2026, 10, 1))
+    assert provider.requests[1] == ["MSFT"]
+
+
+@pytest.mark.asyncio
+async def test_revalue_investments_without_price_file(db: AsyncSession, user, tmp_path):
+    """Test a missing price file leaves investments unchanged."""
+    gold = await create_investment(db, user, InvestmentType.GOLD, quantity=2)
+    provider = FilePriceProvider(str(tmp_path / "missing.csv"))
+    
+    stats = await price_service.revalue_investments(db, provider, date(2026, 10, 1))
+    
+    assert stats == {"updated_count": 0, "instruments": 1, "missing_instruments": ["XAU"]}
+    await db.refresh(gold)
+    assert gold.current_value is None
+    assert await FilePriceProvider(None).get_prices(["XAU"], date(2026, 10, 1)) == {}
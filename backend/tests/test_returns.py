@@ -0,0 +1,90 @@
+"""Investment returns tests."""
+import random
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.auth import auth_service
+from app.services.finance import finance_service
+from app.services.returns import (
+    pad_cash_flows,
+    returns_service,
+    time_weighted_return,
+    xirr_batch,
+    xirr_scalar,
+)
+from app.schemas.finance import InvestmentCreate
+from app.schemas.user import UserCreate
+from app.models.finance import InvestmentType
+
+
+def random_flows(rng: random.Random):
+    purchases = [(-rng.uniform(10, 1000), rng.uniform(0, 5)) for _ in range(rng.randint(1, 8))]
+    end = max(t for _, t in purchases) + rng.uniform(0.05, 3)
+    total = -sum(amount for amount, _ in purchases)
+    return sorted(purchases, key=lambda flow: flow[1]) + [(total * rng.uniform(0.2, 3), end)]
+
+
+def test_xirr_two_flows():
+    """Test a doubling over one year and 10% over two years."""
+    rates = xirr_batch(*pad_cash_flows([[(-100, 0), (200, 1)], [(-100, 0), (121, 2)]]))
+    
+    assert rates == pytest.approx([1.0, 0.1])
+
+
+def test_xirr_batch_matches_scalar_reference():
+    """Test batched solving of padded series agrees with the scalar solver."""
+    rng = random.Random(7)
+    series = [random_flows(rng) for _ in range(200)]
+    series.append([(-100, 0), (-50, 1)])  # No sign change, no rate
+    
+    rates = xirr_batch(*pad_cash_flows(series))
+    
+    for flows, rate in zip(series, rates):
+        expected = xirr_scalar(flows)
+        if expected is None:
+            assert np.isnan(rate)
+        else:
+            assert rate == pytest.approx(expected, rel=1e-6, abs=1e-8)
+    assert np.isnan(rates[-1])
+
+
+def test_time_weighted_return_ignores_purchases():
+    """Test money added mid-period does not count as return."""
+    twr = time_weighted_return([100, 110, 231], [100, 100, 200])
+    
+    assert twr == pytest.approx(0.21)
+    assert time_weighted_return([0, 0], [0, 0]) is None
+
+
+@pytest.mark.asyncio
+async def test_get_returns(db: AsyncSession, test_user_data):
+    """Test returns of positions, types and the portfolio."""
+    user = await auth_service.register(db, UserCreate(**test_user_data))
+    year_ago = date.today() - timedelta(days=365)
+    for investment_type, amount, current_value in (
+        (InvestmentType.STOCKS, 100, 110),
+        (InvestmentType.STOCKS, 100, 130),
+        (InvestmentType.BONDS, 200, None),
+    ):
+        await finance_service.create_investment(
+            db,
+            user.id,
+            InvestmentCreate(
+                investment_type=investment_type,
+                name=investment_type.value,
+                amount=amount,
+                purchase_date=year_ago,
+                current_value=current_value,
+            ),
+        )
+    
+    returns = await returns_service.get_returns(db, user.id)
+    
+    assert sorted(p.xirr for p in returns.positions) == pytest.approx([0, 0.1, 0.3], abs=1e-6)
+    by_type = {t.investment_type: t.xirr for t in returns.by_type}
+    assert by_type == pytest.approx({InvestmentType.STOCKS: 0.2, InvestmentType.BONDS: 0}, abs=1e-6)
+    assert returns.portfolio_xirr == pytest.approx(0.1, abs=1e-6)
+    assert returns.portfolio_twr == pytest.approx(0, abs=1e-6)
+    assert returns.since == year_ago
@@ -0,0 +1,66 @@
+"""Scheduling helper tests."""
+import uuid
+import pytest
+from datetime import date
+
+from app.core.redis import RedisClient
+from app.tasks.scheduling import daily_lock, task_lock
+
+
+@pytest.fixture
+def name():
+    """Lock name unique to the test."""
+    return f"test:{uuid.uuid4().hex}"
+
+
+def test_daily_lock_runs_once_per_day(name):
+    """Test a block that finished is skipped for the rest of the day."""
+    with daily_lock(name, date(2026, 1, 1)) as acquired:
+        assert acquired
+    
+    with daily_lock(name, date(2026, 1, 1)) as acquired:
+        assert not acquired
+    with daily_lock(name, date(2026, 1, 2)) as acquired:
+        assert acquired
+
+
+def test_daily_lock_allows_retry_after_failure(name):
+    """Test a block that raised can run again the same day."""
+    with pytest.raises(RuntimeError):
+        with daily_lock(name, date(2026, 1, 1)) as acquired:
+            assert acquired
+            raise RuntimeError("shard failed")
+    
+    with daily_lock(name, date(2026, 1, 1)) as acquired:
+        assert acquired
+
+
+def test_daily_lock_skips_while_held(name):
+    """Test a block running elsewhere is skipped but not marked done."""
+    redis = RedisClient.get_sync_client()
+    with daily_lock(name, date(2026, 1, 1)) as acquired:
+        assert acquired
+        assert redis.ttl(f"lock:{name}:2026-01-01") > 0
+        with daily_lock(name, date(2026, 1, 1)) as nested:
+            assert not nested
+    
+    assert not redis.exists(f"lock:{name}:2026-01-01")
+    
+    # A lock left by a killed worker blocks until it expires
+    redis.set(f"lock:{name}:2026-01-02", "dead-task", ex=60)
+    with daily_lock(name, date(2026, 1, 2)) as acquired:
+        assert not acquired
+    redis.delete(f"lock:{name}:2026-01-02")
+    with daily_lock(name, date(2026, 1, 2)) as acquired:
+        assert acquired
+
+
+def test_task_lock_excludes_overlapping_runs(name):
+    """Test a second holder is refused until the first one finished."""
+    with task_lock(name) as acquired:
+        assert acquired
+        with task_lock(name) as overlapping:
+            assert not overlapping
+    
+    with task_lock(name) as acquired:
+        assert acquired
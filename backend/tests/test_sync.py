@@ -0,0 +1,83 @@
+"""Delta sync tests."""
+import pytest
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.services.finance import finance_service
+from app.services.sync import sync_service
+from app.schemas.finance import DailyEntryCreate, DailyEntryUpdate, InvestmentCreate
+from app.models.finance import InvestmentType
+
+
+async def create_entries(db, user, count):
+    return [
+        await finance_service.create_entry(
+            db, user.id, DailyEntryCreate(date=date(2026, 3, 1 + i), expense=10 + i)
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_changes_since_token(db: AsyncSession, user, monkeypatch):
+    """Test a sync after a full one returns only updated, created and deleted rows."""
+    monkeypatch.setattr(settings, "SYNC_OVERLAP_SECONDS", 0)
+    first, second, third = await create_entries(db, user, 3)
+    
+    full = await sync_service.get_changes(db, user.id)
+    
+    assert sorted(e.id for e in full.entries.updated) == sorted([first.id, second.id, third.id])
+    assert not full.has_more and full.investments.updated == []
+    
+    await finance_service.update_entry(db, first.id, user.id, DailyEntryUpdate(notes="Edited"))
+    await finance_service.delete_entry(db, second.id, user.id)
+    investment = await finance_service.create_investment(
+        db,
+        user.id,
+        InvestmentCreate(
+            investment_type=InvestmentType.STOCKS, name="ETF", amount=100, purchase_date=date(2026, 3, 1)
+        ),
+    )
+    
+    delta = await sync_service.get_changes(db, user.id, full.token)
+    
+    assert [(e.id, e.notes) for e in delta.entries.updated] == [(first.id, "Edited")]
+    assert delta.entries.deleted == [second.id]
+    assert [i.id for i in delta.investments.updated] == [investment.id]
+    
+    again = await sync_service.get_changes(db, user.id, delta.token)
+    assert again.entries.updated == [] and again.entries.deleted == []
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_tables_in_write_order(db: AsyncSession, user, monkeypatch):
+    """Test large changes are split over syncs that cover every row once."""
+    monkeypatch.setattr(settings, "SYNC_OVERLAP_SECONDS", 0)
+    monkeypatch.setattr(settings, "SYNC_PAGE_SIZE", 2)
+    entries = await create_entries(db, user, 5)
+    
+    ids, token, rounds = [], None, 0
+    while True:
+        changes = await sync_service.get_changes(db, user.id, token)
+        ids += [e.id for e in changes.entries.updated]
+        token, rounds = changes.token, rounds + 1
+        if not changes.has_more:
+            break
+    
+    assert ids == [e.id for e in entries]
+    assert rounds == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_resends_overlap_window(db: AsyncSession, user):
+    """Test recent rows are sent again and malformed tokens rejected."""
+    entries = await create_entries(db, user, 2)
+    
+    full = await sync_service.get_changes(db, user.id)
+    delta = await sync_service.get_changes(db, user.id, full.token)
+    
+    assert [e.id for e in delta.entries.updated] == [e.id for e in entries]
+    with pytest.raises(ValidationError):
+        await sync_service.get_changes(db, user.id, "not-a-token")
@@ -0,0 +1,51 @@
+"""Template rendering tests."""
+from app.schemas.finance import AnnualAnalytics, CategoryBreakdown, MonthlyAnalytics
+from app.utils.templates import get_template, render_annual_report, render_email
+
+
+def monthly_report(month: int = 3) -> MonthlyAnalytics:
+    return MonthlyAnalytics(
+        year=2026,
+        month=month,
+        total_income=12345.5,
+        total_expense=2000,
+        net_income=10345.5,
+        total_gold=1.25,
+        total_silver=0,
+        category_breakdown=[CategoryBreakdown(category="<FOOD>", amount=2000, percentage=100)],
+    )
+
+
+def test_render_monthly_report_email():
+    """Test report email renders analytics and escapes only the HTML part."""
+    subject, body, html = render_email("monthly_report", report=monthly_report())
+    
+    assert subject == "Monthly report March 2026"
+    assert "Net income: 10,345.50 PLN" in body
+    assert "<FOOD>: 2,000.00 PLN (100.0%)" in body
+    assert "&lt;FOOD&gt;" in html
+    assert "<FOOD>" not in html
+
+
+def test_templates_are_compiled_once():
+    """Test repeated lookups return the same compiled template."""
+    assert get_template("emails/monthly_report.html") is get_template("emails/monthly_report.html")
+
+
+def test_render_annual_report():
+    """Test annual report lists every month."""
+    report = AnnualAnalytics(
+        year=2026,
+        total_income=24691,
+        total_expense=4000,
+        net_income=20691,
+        total_gold=2.5,
+        total_silver=0,
+        total_investments=0,
+        monthly_breakdown=[monthly_report(1), monthly_report(2)],
+    )
+    
+    text = render_annual_report(report, "txt")
+    
+    assert "Net income:  20,691.00 PLN" in text
+    assert "- January:" in text and "- February:" in text
@@ -52,25 +52,27 @@ class APIClient {
                     // Retry original request
                     headers['Authorization'] = `Bearer ${this.accessToken}`;
                     const retryResponse = await fetch(url, config);
-                    return await this.handleResponse(retryResponse);
+                    return await this.handleResponse(retryResponse, options.withHeaders);
                 }
             }
 
-            return await this.handleResponse(response);
+            return await this.handleResponse(response, options.withHeaders);
         } catch (error) {
             console.error('API request failed:', error);
             throw error;
         }
     }
 
-    async handleResponse(response) {
+    async handleResponse(response, withHeaders = false) {
         const data = await response.json().catch(() => ({}));
         
         if (!response.ok) {
-            throw new Error(data.detail || `HTTP error! status: ${response.status}`);
+            const error = new Error(data.detail || `HTTP error! status: ${response.status}`);
+            error.status = response.status;
+            throw error;
         }
         
-        return data;
+        return withHeaders ? { data, headers: response.headers } : data;
     }
 
     async refreshAccessToken() {
@@ -100,6 +102,11 @@ class APIClient {
         return this.request(endpoint, { ...options, method: 'GET' });
     }
 
+    // Resolves to { data, headers } for paginated endpoints
+    getPage(endpoint, options = {}) {
+        return this.request(endpoint, { ...options, method: 'GET', withHeaders: true });
+    }
+
     post(endpoint, data, options = {}) {
         return this.request(endpoint, { ...options, method: 'POST', body: data });
     }
@@ -1,6 +1,7 @@
 // API Module Exports
 export { default as apiClient } from './client.js';
 export { authAPI } from './auth.js';
+export { syncAPI } from './sync.js';
 
 // Entries API
 import apiClient from './client.js';
@@ -30,8 +31,26 @@ export const entriesAPI = {
 
 // Investments API
 export const investmentsAPI = {
-    async getAll() {
-        return await apiClient.get('/investments');
+    async getPage(params = {}) {
+        const query = new URLSearchParams(params).toString();
+        const { data, headers } = await apiClient.getPage(`/investments${query ? '?' + query : ''}`);
+        return {
+            items: data,
+            total: Number(headers.get('X-Total-Count')),
+            nextCursor: headers.get('X-Next-Cursor'),
+        };
+    },
+
+    async getAll(params = {}) {
+        // GET /investments is paginated, follow X-Next-Cursor to the last page
+        const investments = [];
+        let cursor = null;
+        do {
+            const page = await this.getPage({ ...params, limit: 100, ...(cursor ? { cursor } : {}) });
+            investments.push(...page.items);
+            cursor = page.nextCursor;
+        } while (cursor);
+        return investments;
     },
 
     async getSummary() {
@@ -65,8 +84,13 @@ export const goalsAPI = {
         return await apiClient.put(`/goals/monthly/${year}/${month}`, data);
     },
 
-    async getYearly(year) {
-        return await apiClient.get(`/goals/yearly/${year}`);
+    async getYearly(year, materialize = false) {
+        const query = materialize ? '?materialize=true' : '';
+        return await apiClient.get(`/goals/yearly/${year}${query}`);
+    },
+
+    async updateYearly(year, data) {
+        return await apiClient.put(`/goals/yearly/${year}`, data);
     }
 };
 
@@ -108,3 +132,26 @@ export const notificationsAPI = {
         return await apiClient.delete(`/notifications/${id}`);
     }
 };
+
+// Jobs API
+export const jobsAPI = {
+    async submit(kind, params = {}) {
+        return await apiClient.post(`/jobs/${kind}`, { params });
+    },
+
+    async get(id) {
+        return await apiClient.get(`/jobs/${id}`);
+    },
+
+    async waitFor(id, onProgress = () => {}, interval = 1000) {
+        // EventSource cannot send the bearer token, so poll the job instead
+        while (true) {
+            const job = await this.get(id);
+            onProgress(job);
+            if (job.status === 'succeeded' || job.status === 'failed') {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+    }
+};
@@ -0,0 +1,118 @@
+// Offline mirror of user data, kept current with delta syncs
+import apiClient from './client.js';
+
+const DB_NAME = 'portfel';
+const DB_VERSION = 1;
+const META_STORE = 'meta';
+
+// Object stores by /sync response field, with indexes used for local reads
+const STORES = {
+    entries: ['date'],
+    investments: ['purchase_date'],
+    goals: ['year'],
+    notifications: ['created_at'],
+};
+
+let dbPromise = null;
+
+function openMirror() {
+    if (!dbPromise) {
+        dbPromise = new Promise((resolve, reject) => {
+            const request = indexedDB.open(DB_NAME, DB_VERSION);
+
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                for (const [name, indexes] of Object.entries(STORES)) {
+                    const store = db.createObjectStore(name, { keyPath: 'id' });
+                    indexes.forEach(index => store.createIndex(index, index));
+                }
+                db.createObjectStore(META_STORE);
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    }
+    return dbPromise;
+}
+
+function requestDone(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function transactionDone(tx) {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+}
+
+async function getMeta(key) {
+    const db = await openMirror();
+    return requestDone(db.transaction(META_STORE).objectStore(META_STORE).get(key));
+}
+
+export const syncAPI = {
+    // Bring the mirror up to date, fetching only rows changed since the last sync
+    async pull(userId) {
+        if (await getMeta('userId') !== userId) {
+            await this.clear();
+        }
+
+        let token = await getMeta('token');
+        while (true) {
+            let changes;
+            try {
+                changes = await apiClient.get(`/sync${token ? '?since=' + encodeURIComponent(token) : ''}`);
+            } catch (error) {
+                // Rejected token, start over with a full sync
+                if (token && error.status === 422) {
+                    await this.clear();
+                    token = null;
+                    continue;
+                }
+                throw error;
+            }
+
+            // Rows and the token are stored together, so an interrupted sync resumes cleanly
+            const db = await openMirror();
+            const tx = db.transaction([...Object.keys(STORES), META_STORE], 'readwrite');
+            for (const name of Object.keys(STORES)) {
+                const store = tx.objectStore(name);
+                changes[name].updated.forEach(row => store.put(row));
+                changes[name].deleted.forEach(id => store.delete(id));
+            }
+            tx.objectStore(META_STORE).put(changes.token, 'token');
+            tx.objectStore(META_STORE).put(userId, 'userId');
+            await transactionDone(tx);
+
+            token = changes.token;
+            if (!changes.has_more) {
+                return;
+            }
+        }
+    },
+
+    // Read rows from the mirror, optionally by an index and key range
+    async getAll(storeName, index = null, range = null) {
+        const db = await openMirror();
+        const store = db.transaction(storeName).objectStore(storeName);
+        return requestDone((index ? store.index(index) : store).getAll(range));
+    },
+
+    async getEntries(startDate, endDate) {
+        return this.getAll('entries', 'date', IDBKeyRange.bound(startDate, endDate));
+    },
+
+    async clear() {
+        const db = await openMirror();
+        const tx = db.transaction([...Object.keys(STORES), META_STORE], 'readwrite');
+        for (const name of [...Object.keys(STORES), META_STORE]) {
+            tx.objectStore(name).clear();
+        }
+        await transactionDone(tx);
+    }
+};
@@ -1,5 +1,5 @@
 // Main Application Initialization
-import { authAPI, apiClient } from '../api/index.js';
+import { authAPI, apiClient, syncAPI } from '../api/index.js';
 
 // Check authentication and initialize app
 async function init() {
@@ -32,6 +32,7 @@ async function init() {
         // Initialize app components
         initNavigation();
         initAuth();
+        initSync(user);
         loadDashboard();
     }
 
@@ -117,10 +118,24 @@ async function init() {
         logoutBtn.addEventListener('click', async (e) => {
             e.preventDefault();
             await authAPI.logout();
+            await syncAPI.clear();
             location.reload();
         });
     }
 
+    function initSync(user) {
+        // Offline the app keeps working from the last mirrored data
+        const pull = () => syncAPI.pull(user.id).catch(error => console.error('Sync failed:', error));
+
+        pull();
+        window.addEventListener('online', pull);
+        navigator.serviceWorker?.addEventListener('message', (event) => {
+            if (event.data?.type === 'sync-data') {
+                pull();
+            }
+        });
+    }
+
     async function loadDashboard() {
         // This would load dashboard data
         console.log('Loading dashboard...');
@@ -1,10 +1,13 @@
 // Service Worker for PWA
-const CACHE_NAME = 'portfel-v1';
+const CACHE_NAME = 'portfel-v2';
 const STATIC_CACHE = [
     '/',
     '/index.html',
     '/css/style.css',
     '/js/api/index.js',
+    '/js/api/client.js',
+    '/js/api/auth.js',
+    '/js/api/sync.js',
     '/js/app/init.js',
     '/manifest.json',
 ];
@@ -70,7 +73,7 @@ self.addEventListener('sync', (event) => {
 });
 
 async function syncData() {
-    // Sync offline data when connection is restored
-    console.log('Syncing offline data...');
-    // Implementation would sync IndexedDB data to API
+    // The access token lives in the page, so open pages pull the changes into IndexedDB
+    const clients = await self.clients.matchAll({ type: 'window' });
+    clients.forEach((client) => client.postMessage({ type: 'sync-data' }));
 }